@@ -101,7 +101,7 @@ class SectorAnalyzer:
         sector_results: list[SectorPerformance] = []
 
         # Group by sector
-        grouped = prices_df.groupby("Sector33Code")
+        grouped = prices_df.groupby("Sector33Code", observed=True)
 
         for sector_code, group in grouped:
             if pd.isna(sector_code) or sector_code == "":
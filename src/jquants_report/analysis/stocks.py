@@ -6,6 +6,7 @@ top gainers/losers, high volume stocks, and limit hits.
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 
@@ -120,12 +121,7 @@ class StockAnalyzer:
             )
 
             # Merge with current data
-            result_df = result_df.merge(
-                avg_volumes.rename("AvgVolume"),
-                left_on="Code",
-                right_index=True,
-                how="left",
-            )
+            result_df["AvgVolume"] = result_df["Code"].map(avg_volumes)
 
             result_df["VolumeRatio"] = result_df["Volume"] / result_df["AvgVolume"]
             result_df = result_df[result_df["VolumeRatio"] >= volume_threshold]
@@ -138,8 +134,8 @@ class StockAnalyzer:
 
         # Add volume ratio if available
         if "VolumeRatio" in result_df.columns:
-            for i, stock in enumerate(stocks):
-                stock.volume_ratio = float(result_df.iloc[i]["VolumeRatio"])
+            for stock, ratio in zip(stocks, result_df["VolumeRatio"].tolist(), strict=True):
+                stock.volume_ratio = float(ratio)
 
         return stocks
 
@@ -204,12 +200,8 @@ class StockAnalyzer:
 
         # Merge with current data
         result_df = prices_df.copy()
-        result_df = result_df.merge(
-            year_highs.rename("YearHigh"), left_on="Code", right_index=True, how="left"
-        )
-        result_df = result_df.merge(
-            year_lows.rename("YearLow"), left_on="Code", right_index=True, how="left"
-        )
+        result_df["YearHigh"] = result_df["Code"].map(year_highs)
+        result_df["YearLow"] = result_df["Code"].map(year_lows)
 
         # Find stocks at year high
         if "High" in result_df.columns:
@@ -259,41 +251,54 @@ class StockAnalyzer:
         Returns:
             List of StockInfo objects.
         """
-        stocks: list[StockInfo] = []
-
-        for _, row in df.iterrows():
-            code = str(row.get("Code", ""))
-            name = str(row.get("CompanyName", row.get("Name", "")))
-            close = float(row.get("Close", 0.0))
-            change_pct = float(row.get("ChangeRate", 0.0))
-            volume = float(row.get("Volume", 0.0))
-            turnover_value = float(row.get("TurnoverValue", 0.0))
-
-            # Calculate price change from previous close or from change_pct
-            prev_close = row.get("PrevClose")
-            if prev_close is not None and not pd.isna(prev_close):
-                change = close - float(prev_close)
-            elif change_pct != 0:
-                # Calculate change from change_pct: change = close - (close / (1 + pct/100))
-                change = close - (close / (1 + change_pct / 100))
-            else:
-                change = 0.0
-
-            sector_name = ""
-            if "Sector33CodeName" in row:
-                sector_name = str(row["Sector33CodeName"])
-
-            stocks.append(
-                StockInfo(
-                    code=code,
-                    name=name,
-                    close=close,
-                    change=change,
-                    change_pct=change_pct,
-                    volume=volume,
-                    turnover_value=turnover_value,
-                    sector_name=sector_name,
-                )
+        n = len(df)
+
+        def text(column: str, default: list[str]) -> list[str]:
+            if column in df.columns:
+                return [str(v) for v in df[column].tolist()]
+            return default
+
+        def numbers(column: str) -> np.ndarray:
+            if column in df.columns:
+                return df[column].to_numpy(dtype=np.float64)
+            return np.zeros(n)
+
+        codes = text("Code", [""] * n)
+        names = text("CompanyName", text("Name", [""] * n))
+        sector_names = text("Sector33CodeName", [""] * n)
+        close = numbers("Close")
+        change_pct = numbers("ChangeRate")
+        volume = numbers("Volume")
+        turnover_value = numbers("TurnoverValue")
+
+        # Price change from previous close, else back out of change_pct:
+        # change = close - (close / (1 + pct/100))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(change_pct != 0, close - close / (1 + change_pct / 100), 0.0)
+            if "PrevClose" in df.columns:
+                prev_close = df["PrevClose"].to_numpy(dtype=np.float64)
+                change = np.where(np.isnan(prev_close), change, close - prev_close)
+
+        return [
+            StockInfo(
+                code=code,
+                name=name,
+                close=c,
+                change=ch,
+                change_pct=pct,
+                volume=v,
+                turnover_value=tv,
+                sector_name=sector_name,
             )
-
-        return stocks
+            for code, name, c, ch, pct, v, tv, sector_name in zip(
+                codes,
+                names,
+                close.tolist(),
+                change.tolist(),
+                change_pct.tolist(),
+                volume.tolist(),
+                turnover_value.tolist(),
+                sector_names,
+                strict=True,
+            )
+        ]
@@ -111,7 +111,7 @@ class SupplyDemandAnalyzer:
 
         # Group by investor type
         if "InvestorType" in trading_df.columns:
-            grouped = trading_df.groupby("InvestorType")
+            grouped = trading_df.groupby("InvestorType", observed=True)
 
             for investor_type_code, group in grouped:
                 investor_type = self.INVESTOR_TYPE_NAMES.get(
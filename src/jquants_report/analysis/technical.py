@@ -181,18 +181,8 @@ class TechnicalAnalyzer:
         if "High" not in result_df.columns or "Low" not in result_df.columns:
             return 0, 0
 
-        result_df = result_df.merge(
-            period_highs.rename("PeriodHigh"),
-            left_on="Code",
-            right_index=True,
-            how="left",
-        )
-        result_df = result_df.merge(
-            period_lows.rename("PeriodLow"),
-            left_on="Code",
-            right_index=True,
-            how="left",
-        )
+        result_df["PeriodHigh"] = result_df["Code"].map(period_highs)
+        result_df["PeriodLow"] = result_df["Code"].map(period_lows)
 
         # Count new highs and lows
         new_highs = int((result_df["High"] >= result_df["PeriodHigh"]).sum())
@@ -234,12 +224,7 @@ class TechnicalAnalyzer:
         if "Close" not in result_df.columns:
             return None, None
 
-        result_df = result_df.merge(
-            ma_values.rename(f"MA{period}"),
-            left_on="Code",
-            right_index=True,
-            how="left",
-        )
+        result_df[f"MA{period}"] = result_df["Code"].map(ma_values)
 
         # Calculate divergence percentage
         result_df[f"MA{period}Divergence"] = (
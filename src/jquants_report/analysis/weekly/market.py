@@ -10,6 +10,7 @@ Section 1: Weekly Market Summary
 import logging
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
 from jquants_report.report.weekly_types import (
@@ -109,42 +110,39 @@ class WeeklyMarketAnalyzer:
         daily_indices_list: list[tuple[date, pd.DataFrame]],
     ) -> dict[str, list[DailyIndexChange]]:
         """Process daily index changes."""
-        daily_changes: dict[str, list[DailyIndexChange]] = {}
-
-        for index_name in self.INDEX_CODES.values():
-            daily_changes[index_name] = []
-
-        prev_closes: dict[str, float] = {}
+        # Gather each index's closes column-wise, one isin scan per day
+        days: dict[str, list[date]] = {name: [] for name in self.INDEX_CODES.values()}
+        closes: dict[str, list[float]] = {name: [] for name in self.INDEX_CODES.values()}
 
         for day, df in sorted(daily_indices_list, key=lambda x: x[0]):
             if df.empty:
                 continue
 
-            for code, name in self.INDEX_CODES.items():
-                row = df[df["Code"] == code]
-                if row.empty:
-                    continue
-
-                close = float(row.iloc[0].get("Close", 0))
-                prev_close = prev_closes.get(name)
-
-                if prev_close is not None:
-                    change = close - prev_close
-                    change_pct = (change / prev_close) * 100 if prev_close != 0 else 0
-                else:
-                    change = 0.0
-                    change_pct = 0.0
-
-                daily_changes[name].append(
-                    DailyIndexChange(
-                        date=day,
-                        close=close,
-                        change=change,
-                        change_pct=change_pct,
-                    )
-                )
+            rows = df[df["Code"].isin(list(self.INDEX_CODES))].drop_duplicates("Code")
+            day_closes = rows["Close"] if "Close" in rows.columns else [0] * len(rows)
+            for code, close in zip(rows["Code"], day_closes, strict=True):
+                name = self.INDEX_CODES[code]
+                days[name].append(day)
+                closes[name].append(float(close))
 
-                prev_closes[name] = close
+        daily_changes: dict[str, list[DailyIndexChange]] = {}
+        for name, index_days in days.items():
+            close = np.asarray(closes[name], dtype=np.float64)
+            prev = close[:-1]
+
+            # The first day of each index has no previous close to compare with
+            change = np.zeros_like(close)
+            change[1:] = close[1:] - prev
+            change_pct = np.zeros_like(close)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                change_pct[1:] = np.where(prev != 0, change[1:] / prev * 100, 0.0)
+
+            daily_changes[name] = [
+                DailyIndexChange(date=day, close=c, change=ch, change_pct=pct)
+                for day, c, ch, pct in zip(
+                    index_days, close.tolist(), change.tolist(), change_pct.tolist(), strict=True
+                )
+            ]
 
         return daily_changes
 
@@ -156,13 +154,13 @@ class WeeklyMarketAnalyzer:
         if weekly_quotes.empty or "WeeklyReturn" not in weekly_quotes.columns:
             return 0, 0, 0
 
-        valid_returns = weekly_quotes["WeeklyReturn"].dropna()
+        returns = weekly_quotes["WeeklyReturn"].to_numpy(dtype=float, na_value=np.nan)
+        signs = np.sign(returns[~np.isnan(returns)]).astype(np.intp)
 
-        advancing = int((valid_returns > 0).sum())
-        declining = int((valid_returns < 0).sum())
-        unchanged = int((valid_returns == 0).sum())
+        # Count -1/0/+1 signs in a single pass
+        declining, unchanged, advancing = np.bincount(signs + 1, minlength=3)
 
-        return advancing, declining, unchanged
+        return int(advancing), int(declining), int(unchanged)
 
     def _calculate_volume_turnover(
         self,
@@ -18,6 +18,19 @@ from jquants_report.report.weekly_types import (
 logger = logging.getLogger(__name__)
 
 
+def _column(df: pd.DataFrame, name: str, default: object) -> pd.Series:
+    """Return a column, or a constant series when the column is missing."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+def _optional_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Return a column as floats with missing values mapped to None."""
+    values = _column(df, name, None).astype(float)
+    return values.astype(object).where(values.notna(), None)
+
+
 class WeeklyStockAnalyzer:
     """Analyzer for weekly stock performance (Section 3)."""
 
@@ -50,26 +63,31 @@ class WeeklyStockAnalyzer:
             top_turnover=top_turnover,
         )
 
-    def _convert_to_performance(self, row: pd.Series) -> WeeklyStockPerformance:
-        """Convert a DataFrame row to WeeklyStockPerformance."""
-        code = str(row.get("Code", ""))
+    def _to_performances(self, ranked: pd.DataFrame) -> list[WeeklyStockPerformance]:
+        """Convert ranked rows to WeeklyStockPerformance in one columnar pass."""
+        # Plain strings: aggregated codes are categorical, which rejects new values
+        codes = _column(ranked, "Code", "").astype(str)
         # Normalize 5-digit codes to 4-digit
-        if len(code) == 5 and code.endswith("0"):
-            code = code[:4]
-
-        return WeeklyStockPerformance(
-            code=code,
-            name=str(row.get("CompanyName", "不明")),
-            sector_name=str(row.get("Sector33CodeName", "不明")),
-            week_open=float(row.get("WeekOpen", 0)),
-            week_close=float(row.get("WeekClose", 0)),
-            weekly_return_pct=float(row.get("WeeklyReturn", 0)) if pd.notna(row.get("WeeklyReturn")) else 0.0,
-            week_volume=int(row.get("WeekVolume", 0)),
-            week_turnover=float(row.get("WeekTurnover", 0)),
-            week_high=float(row.get("WeekHigh", 0)) if pd.notna(row.get("WeekHigh")) else None,
-            week_low=float(row.get("WeekLow", 0)) if pd.notna(row.get("WeekLow")) else None,
-            prev_week_close=float(row.get("PrevWeekClose", 0)) if pd.notna(row.get("PrevWeekClose")) else None,
+        five_digit = (codes.str.len() == 5) & codes.str.endswith("0")
+        codes = codes.where(~five_digit, codes.str[:4])
+
+        frame = pd.DataFrame(
+            {
+                "code": codes,
+                "name": _column(ranked, "CompanyName", "不明").astype(str),
+                "sector_name": _column(ranked, "Sector33CodeName", "不明").astype(str),
+                "week_open": _column(ranked, "WeekOpen", 0).astype(float),
+                "week_close": _column(ranked, "WeekClose", 0).astype(float),
+                "weekly_return_pct": _column(ranked, "WeeklyReturn", 0).astype(float).fillna(0.0),
+                "week_volume": _column(ranked, "WeekVolume", 0).astype("int64"),
+                "week_turnover": _column(ranked, "WeekTurnover", 0).astype(float),
+                "week_high": _optional_column(ranked, "WeekHigh"),
+                "week_low": _optional_column(ranked, "WeekLow"),
+                "prev_week_close": _optional_column(ranked, "PrevWeekClose"),
+            },
+            index=ranked.index,
         )
+        return WeeklyStockPerformance.from_dataframe(frame)
 
     def _get_top_gainers(
         self,
@@ -83,7 +101,7 @@ class WeeklyStockAnalyzer:
         valid_data = weekly_quotes[weekly_quotes["WeeklyReturn"].notna()].copy()
         sorted_data = valid_data.sort_values("WeeklyReturn", ascending=False).head(top_n)
 
-        return [self._convert_to_performance(row) for _, row in sorted_data.iterrows()]
+        return self._to_performances(sorted_data)
 
     def _get_top_losers(
         self,
@@ -97,7 +115,7 @@ class WeeklyStockAnalyzer:
         valid_data = weekly_quotes[weekly_quotes["WeeklyReturn"].notna()].copy()
         sorted_data = valid_data.sort_values("WeeklyReturn", ascending=True).head(top_n)
 
-        return [self._convert_to_performance(row) for _, row in sorted_data.iterrows()]
+        return self._to_performances(sorted_data)
 
     def _get_top_volume(
         self,
@@ -110,7 +128,7 @@ class WeeklyStockAnalyzer:
 
         sorted_data = weekly_quotes.sort_values("WeekVolume", ascending=False).head(top_n)
 
-        return [self._convert_to_performance(row) for _, row in sorted_data.iterrows()]
+        return self._to_performances(sorted_data)
 
     def _get_top_turnover(
         self,
@@ -123,4 +141,4 @@ class WeeklyStockAnalyzer:
 
         sorted_data = weekly_quotes.sort_values("WeekTurnover", ascending=False).head(top_n)
 
-        return [self._convert_to_performance(row) for _, row in sorted_data.iterrows()]
+        return self._to_performances(sorted_data)
@@ -135,6 +135,7 @@ class WeeklyTechnicalAnalyzer:
             left_on="Code",
             right_index=True,
             how="left",
+            validate="many_to_one",
         )
 
         # Count new highs (weekly high >= period high)
@@ -179,6 +180,7 @@ class WeeklyTechnicalAnalyzer:
                 left_on="Code",
                 right_index=True,
                 how="left",
+                validate="many_to_one",
             )
 
             # Calculate percentage above MA
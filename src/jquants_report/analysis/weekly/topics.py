@@ -153,6 +153,7 @@ class WeeklyTopicsAnalyzer:
             left_on="Code",
             right_index=True,
             how="left",
+            validate="many_to_one",
         )
 
         for _, row in merged.iterrows():
@@ -7,6 +7,7 @@ This module handles authentication for the J-Quants API, including:
 """
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
 
@@ -77,6 +78,7 @@ class JQuantsAuthenticator:
         email: str,
         password: str,
         refresh_token: str | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         """Initialize the authenticator.
 
@@ -85,12 +87,16 @@ class JQuantsAuthenticator:
             email: User email for authentication.
             password: User password for authentication.
             refresh_token: Optional pre-existing refresh token.
+            session: Optional HTTP session to share; a new one is created if omitted.
         """
         self.base_url = base_url.rstrip("/")
         self.email = email
         self.password = password
         self._refresh_token = refresh_token
         self._id_token: TokenInfo | None = None
+        self._session = session or requests.Session()
+        # Serializes token requests when the client is shared across threads
+        self._token_lock = threading.Lock()
 
     def get_refresh_token(self) -> str:
         """Get a valid refresh token.
@@ -98,6 +104,20 @@ class JQuantsAuthenticator:
         If a refresh token exists and is valid, returns it.
         Otherwise, obtains a new refresh token using email/password.
 
+        Returns:
+            A valid refresh token string.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+        """
+        with self._token_lock:
+            return self._get_refresh_token_locked()
+
+    def _get_refresh_token_locked(self) -> str:
+        """Return the refresh token, obtaining one first if needed.
+
+        Must be called with the token lock held.
+
         Returns:
             A valid refresh token string.
 
@@ -112,7 +132,7 @@ class JQuantsAuthenticator:
         url = f"{self.base_url}{self.TOKEN_AUTH_USER_ENDPOINT}"
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 json={"mailaddress": self.email, "password": self.password},
                 timeout=30,
@@ -145,16 +165,36 @@ class JQuantsAuthenticator:
         Raises:
             AuthenticationError: If authentication fails.
         """
-        if not force_refresh and self._id_token and not self._id_token.is_expired():
+        id_token = self._id_token
+        if not force_refresh and id_token and not id_token.is_expired():
             logger.debug("Using existing ID token")
-            return self._id_token.token
+            return id_token.token
 
+        with self._token_lock:
+            # Another thread may have refreshed while this one waited
+            if not force_refresh or self._id_token is not id_token:
+                id_token = self._id_token
+                if id_token and not id_token.is_expired():
+                    return id_token.token
+            return self._refresh_id_token_locked()
+
+    def _refresh_id_token_locked(self) -> str:
+        """Obtain a new ID token using the refresh token.
+
+        Must be called with the token lock held.
+
+        Returns:
+            The new ID token string.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+        """
         logger.info("Obtaining new ID token")
-        refresh_token = self.get_refresh_token()
+        refresh_token = self._get_refresh_token_locked()
         url = f"{self.base_url}{self.TOKEN_AUTH_REFRESH_ENDPOINT}"
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 params={"refreshtoken": refresh_token},
                 timeout=30,
@@ -5,6 +5,7 @@ including rate limiting, automatic retry, and error handling.
 """
 
 import logging
+import threading
 import time
 from typing import Any
 
@@ -65,6 +66,7 @@ class JQuantsClient:
         refresh_token: str | None = None,
         base_url: str = "https://api.jquants.com/v1",
         rate_limit_delay: float = 1.0,
+        session: requests.Session | None = None,
     ) -> None:
         """Initialize the J-Quants API client.
 
@@ -74,25 +76,37 @@ class JQuantsClient:
             refresh_token: Optional pre-existing refresh token.
             base_url: Base URL for J-Quants API.
             rate_limit_delay: Minimum seconds between API requests.
+            session: Optional HTTP session shared with the authenticator; a new
+                one is created if omitted so connections are reused across requests.
         """
+        self._session = session or requests.Session()
         self.authenticator = JQuantsAuthenticator(
             base_url=base_url,
             email=email,
             password=password,
             refresh_token=refresh_token,
+            session=self._session,
         )
         self.base_url = base_url.rstrip("/")
         self.rate_limit_delay = rate_limit_delay
         self._last_request_time: float = 0.0
+        self._rate_lock = threading.Lock()
 
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting by sleeping if necessary."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - elapsed
+        """Enforce rate limiting by sleeping if necessary.
+
+        Safe to call from several threads: each caller reserves the next
+        request slot under a lock and sleeps outside it until that slot.
+        """
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + self.rate_limit_delay)
+            self._last_request_time = slot
+
+        sleep_time = slot - now
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-        self._last_request_time = time.time()
 
     @retry(
         retry=retry_if_exception_type((requests.RequestException, APIError)),
@@ -130,7 +144,7 @@ class JQuantsClient:
         logger.debug(f"Making {method} request to {endpoint} with params: {params}")
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -161,6 +175,42 @@ class JQuantsClient:
         except ValueError as e:
             raise APIError(f"Invalid JSON response: {e}") from e
 
+    def _make_paginated_request(
+        self, endpoint: str, key: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a GET request and follow pagination keys until the last page.
+
+        Records from every page are collected in one list, so the caller
+        builds a single DataFrame instead of concatenating one per page.
+
+        Args:
+            endpoint: API endpoint path.
+            key: Key containing the data array.
+            params: Query parameters.
+
+        Returns:
+            JSON response of the first page with ``key`` holding all records.
+
+        Raises:
+            APIError: If the API returns a pagination key it already returned.
+        """
+        response = self._make_request(endpoint, params)
+        records = list(response.get(key) or [])
+        pagination_key = response.pop("pagination_key", None)
+        seen_keys: set[str] = set()
+        while pagination_key:
+            if pagination_key in seen_keys:
+                raise APIError(f"Repeated pagination key from {endpoint}: {pagination_key}")
+            seen_keys.add(pagination_key)
+            logger.debug(f"Fetching next page of {endpoint}")
+            page = self._make_request(
+                endpoint, {**(params or {}), "pagination_key": pagination_key}
+            )
+            records.extend(page.get(key) or [])
+            pagination_key = page.get("pagination_key")
+        response[key] = records
+        return response
+
     def _to_dataframe(self, data: dict[str, Any], key: str = "data") -> pd.DataFrame:
         """Convert API response to pandas DataFrame.
 
@@ -231,7 +281,9 @@ class JQuantsClient:
             date=date,
             **{"from": from_date, "to": to_date} if from_date or to_date else {},
         )
-        response = self._make_request(JQuantsEndpoints.PRICES_DAILY_QUOTES.path, params)
+        response = self._make_paginated_request(
+            JQuantsEndpoints.PRICES_DAILY_QUOTES.path, "daily_quotes", params
+        )
         return self._to_dataframe(response, "daily_quotes")
 
     def get_prices_am(
@@ -7,7 +7,9 @@ Includes cache expiration management and automatic migration from legacy parquet
 import io
 import logging
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Mapping
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,25 +21,57 @@ logger = logging.getLogger(__name__)
 # Database schema version for future migrations
 SCHEMA_VERSION = 1
 
+# Number of recently used frames kept in memory in front of the database
+DEFAULT_MEMORY_ITEMS = 32
+
+# Per-connection tuning: commits skip the second fsync and temp data stays in
+# memory. WAL mode itself is persistent and set once in _init_database.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+_UPSERT_ENTRY_SQL = """
+    INSERT OR REPLACE INTO cache_entries
+    (cache_key, data, row_count, created_at, expires_at, compression)
+    VALUES (?, ?, ?, ?, ?, 'pickle')
+"""
+
 
 class CacheManager:
     """Manages local cache for J-Quants API data using SQLite.
 
     Caches are stored in a SQLite database for efficient storage and retrieval.
     Each cache entry has an expiration time for automatic invalidation.
+    Recently used entries are also kept in a small in-memory LRU so repeated
+    reads within a process skip unpickling.
     """
 
     DB_FILENAME = "cache.db"
 
-    def __init__(self, cache_dir: Path, default_ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_dir: Path,
+        default_ttl_hours: int = 24,
+        memory_items: int = DEFAULT_MEMORY_ITEMS,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
         """Initialize CacheManager.
 
         Args:
             cache_dir: Directory path for storing the cache database.
             default_ttl_hours: Default time-to-live for cache entries in hours.
+            memory_items: Number of entries kept in memory (0 disables it).
+            clock: Returns the current time for expiry checks.
         """
         self.cache_dir = Path(cache_dir)
         self.default_ttl_hours = default_ttl_hours
+        self.memory_items = memory_items
+        self._now = clock
+        self._memory: OrderedDict[str, tuple[datetime, pd.DataFrame]] = OrderedDict()
+        self._memory_lock = threading.Lock()
         self._db_path = self.cache_dir / self.DB_FILENAME
         self._ensure_cache_dir()
         self._init_database()
@@ -57,6 +91,8 @@ class CacheManager:
         """
         conn = sqlite3.connect(str(self._db_path), timeout=30.0)
         conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         try:
             yield conn
             conn.commit()
@@ -71,6 +107,14 @@ class CacheManager:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # Readers no longer block on a writer, and commits append to the log
+            cursor.execute("PRAGMA journal_mode=WAL")
+
+            # An existing database at this schema version needs no DDL or
+            # metadata write, so reopening the cache stays read-only
+            if self._schema_is_current(cursor):
+                return
+
             # Create cache entries table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
@@ -113,6 +157,23 @@ class CacheManager:
 
             logger.debug("Database schema initialized")
 
+    def _schema_is_current(self, cursor: sqlite3.Cursor) -> bool:
+        """Check whether the database already holds the current schema.
+
+        Args:
+            cursor: Database cursor.
+
+        Returns:
+            True if the stored schema version matches SCHEMA_VERSION.
+        """
+        try:
+            cursor.execute("SELECT value FROM cache_metadata WHERE key = 'schema_version'")
+        except sqlite3.OperationalError:
+            # Fresh database without tables yet
+            return False
+        row = cursor.fetchone()
+        return row is not None and row["value"] == str(SCHEMA_VERSION)
+
     def _serialize_dataframe(self, df: pd.DataFrame) -> bytes:
         """Serialize DataFrame to bytes.
 
@@ -150,6 +211,57 @@ class CacheManager:
         # Keep the key as-is for SQLite (no need for filename sanitization)
         return key
 
+    def _remember(self, key: str, expires_at: datetime, df: pd.DataFrame) -> None:
+        """Keep a frame in the in-memory LRU, evicting the oldest entry.
+
+        Args:
+            key: Sanitized cache key.
+            expires_at: Expiration time of the entry.
+            df: DataFrame to keep.
+        """
+        if self.memory_items <= 0:
+            return
+        # Store and hand out copies so callers mutating their frame never
+        # change what later reads see
+        stored = df.copy()
+        with self._memory_lock:
+            self._memory[key] = (expires_at, stored)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> pd.DataFrame | None:
+        """Look up a frame in the in-memory LRU.
+
+        Args:
+            key: Sanitized cache key.
+
+        Returns:
+            Copy of the stored frame, None if missing or expired.
+        """
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, df = entry
+            if self._now() >= expires_at:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+        return df.copy()
+
+    def _forget(self, key: str | None = None) -> None:
+        """Drop one entry, or all entries, from the in-memory LRU.
+
+        Args:
+            key: Sanitized cache key, or None to drop everything.
+        """
+        with self._memory_lock:
+            if key is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(key, None)
+
     def get(self, key: str) -> pd.DataFrame | None:
         """Retrieve data from cache.
 
@@ -161,6 +273,11 @@ class CacheManager:
         """
         sanitized_key = self._sanitize_key(key)
 
+        df = self._recall(sanitized_key)
+        if df is not None:
+            logger.debug(f"Memory cache hit: {key}")
+            return df
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -180,7 +297,7 @@ class CacheManager:
 
             # Check expiration
             expires_at = datetime.fromisoformat(row["expires_at"])
-            if datetime.now() >= expires_at:
+            if self._now() >= expires_at:
                 logger.debug(f"Cache expired: {key}")
                 self._remove_entry(cursor, sanitized_key)
                 conn.commit()
@@ -189,6 +306,7 @@ class CacheManager:
             try:
                 df = self._deserialize_dataframe(row["data"])
                 logger.info(f"Cache hit: {key} ({row['row_count']} rows)")
+                self._remember(sanitized_key, expires_at, df)
                 return df
             except Exception as e:
                 logger.error(f"Failed to deserialize cache {key}: {e}")
@@ -211,7 +329,7 @@ class CacheManager:
         sanitized_key = self._sanitize_key(key)
         ttl = ttl_hours if ttl_hours is not None else self.default_ttl_hours
 
-        created_at = datetime.now()
+        created_at = self._now()
         expires_at = created_at + timedelta(hours=ttl)
 
         try:
@@ -220,11 +338,7 @@ class CacheManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO cache_entries
-                    (cache_key, data, row_count, created_at, expires_at, compression)
-                    VALUES (?, ?, ?, ?, ?, 'pickle')
-                """,
+                    _UPSERT_ENTRY_SQL,
                     (
                         sanitized_key,
                         serialized_data,
@@ -234,6 +348,7 @@ class CacheManager:
                     ),
                 )
 
+            self._remember(sanitized_key, expires_at, data)
             logger.info(
                 f"Cached {len(data)} rows for key: {key} "
                 f"(expires: {expires_at.strftime('%Y-%m-%d %H:%M')})"
@@ -241,6 +356,50 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Failed to write cache {key}: {e}")
 
+    def set_many(self, items: Mapping[str, pd.DataFrame], ttl_hours: int | None = None) -> None:
+        """Store several DataFrames in cache within a single transaction.
+
+        Args:
+            items: Mapping of cache key to DataFrame. Empty frames are skipped.
+            ttl_hours: Time-to-live in hours. Uses default if not specified.
+        """
+        ttl = ttl_hours if ttl_hours is not None else self.default_ttl_hours
+
+        created_at = self._now()
+        expires_at = created_at + timedelta(hours=ttl)
+
+        frames: dict[str, pd.DataFrame] = {}
+        for key, data in items.items():
+            if data.empty:
+                logger.warning(f"Attempted to cache empty DataFrame for key: {key}")
+                continue
+            frames[self._sanitize_key(key)] = data
+        if not frames:
+            return
+
+        try:
+            rows = [
+                (
+                    key,
+                    self._serialize_dataframe(data),
+                    len(data),
+                    created_at.isoformat(),
+                    expires_at.isoformat(),
+                )
+                for key, data in frames.items()
+            ]
+
+            with self._get_connection() as conn:
+                conn.executemany(_UPSERT_ENTRY_SQL, rows)
+
+            for key, data in frames.items():
+                self._remember(key, expires_at, data)
+            logger.info(
+                f"Cached {len(frames)} entries (expires: {expires_at.strftime('%Y-%m-%d %H:%M')})"
+            )
+        except Exception as e:
+            logger.error(f"Failed to write cache batch: {e}")
+
     def _remove_entry(self, cursor: sqlite3.Cursor, key: str) -> None:
         """Remove a cache entry (internal method, no commit).
 
@@ -259,6 +418,7 @@ class CacheManager:
         """
         logger.info(f"Invalidating cache: {key}")
         sanitized_key = self._sanitize_key(key)
+        self._forget(sanitized_key)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -267,6 +427,7 @@ class CacheManager:
     def clear_all(self) -> None:
         """Clear all cache entries."""
         logger.info("Clearing all cache entries")
+        self._forget()
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -293,7 +454,7 @@ class CacheManager:
         """
         logger.info("Cleaning up expired cache entries")
 
-        now = datetime.now().isoformat()
+        now = self._now().isoformat()
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -339,7 +500,9 @@ class CacheManager:
             return
 
         logger.info(f"Migrating {len(parquet_files)} cache files to SQLite...")
-        migrated_count = 0
+        created_at = self._now().isoformat()
+        rows: list[tuple[str, bytes, int, str, str]] = []
+        migrated_files: list[tuple[Path, Path]] = []
 
         for parquet_path in parquet_files:
             key = parquet_path.stem  # Filename without extension
@@ -356,28 +519,45 @@ class CacheManager:
                         expires_at = datetime.fromisoformat(expiry_str)
                 else:
                     # Default to 24 hours from now if no meta
-                    expires_at = datetime.now() + timedelta(hours=24)
+                    expires_at = self._now() + timedelta(hours=24)
 
                 # Skip if already expired
-                if datetime.now() >= expires_at:
+                if self._now() >= expires_at:
                     logger.debug(f"Skipping expired file: {key}")
                     self._delete_old_files(parquet_path, meta_path)
                     continue
 
-                # Calculate remaining TTL
-                remaining_hours = (expires_at - datetime.now()).total_seconds() / 3600
-
-                # Insert into database
-                self.set(key, df, ttl_hours=remaining_hours)
-                migrated_count += 1
-
-                # Delete old files after successful migration
-                self._delete_old_files(parquet_path, meta_path)
+                if not df.empty:
+                    rows.append(
+                        (
+                            self._sanitize_key(key),
+                            self._serialize_dataframe(df),
+                            len(df),
+                            created_at,
+                            expires_at.isoformat(),
+                        )
+                    )
+                migrated_files.append((parquet_path, meta_path))
 
             except Exception as e:
                 logger.warning(f"Failed to migrate {key}: {e}")
                 continue
 
+        # Insert every entry in one transaction; on failure keep the files so
+        # the migration is retried next time
+        if rows:
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany(_UPSERT_ENTRY_SQL, rows)
+            except Exception as e:
+                logger.warning(f"Failed to migrate cache files: {e}")
+                return
+
+        # Delete old files only after their entries are committed
+        for parquet_path, meta_path in migrated_files:
+            self._delete_old_files(parquet_path, meta_path)
+
+        migrated_count = len(migrated_files)
         logger.info(f"Migration completed: {migrated_count} files migrated")
         self._mark_migration_completed()
 
@@ -5,7 +5,10 @@ Implements rate limiting, retry logic, and differential updates.
 """
 
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from typing import Any
 
@@ -26,6 +29,9 @@ class DataFetcher:
     # Rate limiting - 1 second between API calls
     MIN_REQUEST_INTERVAL = 1.0
 
+    # Worker threads for batch fetches
+    DEFAULT_MAX_WORKERS = 4
+
     def __init__(self, api_client: Any, cache_manager: CacheManager):
         """Initialize DataFetcher.
 
@@ -36,15 +42,66 @@ class DataFetcher:
         self.client = api_client
         self.cache = cache_manager
         self._last_request_time: float = 0.0
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            sleep_time = self.MIN_REQUEST_INTERVAL - elapsed
+        """Enforce rate limiting between API requests.
+
+        Safe to call from several threads: each caller reserves the next
+        request slot under a lock and sleeps outside it until that slot.
+        """
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + self.MIN_REQUEST_INTERVAL)
+            self._last_request_time = slot
+
+        sleep_time = slot - now
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
             time.sleep(sleep_time)
-        self._last_request_time = time.time()
+
+    def _fetch_many(
+        self,
+        fetch_fn: Callable[[date], pd.DataFrame],
+        dates: list[date],
+        max_workers: int,
+        key_prefix: str | None = None,
+    ) -> dict[date, pd.DataFrame]:
+        """Run a per-date fetch method for several dates on a thread pool.
+
+        When key_prefix is given, cached dates are read up front and only the
+        cache misses are dispatched to the pool. API calls still go through
+        the shared rate limiter, so only their latency overlaps.
+
+        Args:
+            fetch_fn: Per-date fetch method (e.g. fetch_daily_quotes).
+            dates: Dates to fetch.
+            max_workers: Maximum number of worker threads.
+            key_prefix: Cache key prefix used by fetch_fn (e.g. "daily_quotes_").
+
+        Returns:
+            Dictionary mapping each date to its DataFrame (empty on failure),
+            in the order of dates.
+        """
+        results: dict[date, pd.DataFrame] = {}
+        misses = list(dates)
+        if key_prefix is not None:
+            misses = []
+            for d in dates:
+                cached = self.cache.get(f"{key_prefix}{d.isoformat()}")
+                if cached is None:
+                    misses.append(d)
+                else:
+                    results[d] = cached
+
+        if misses:
+            if max_workers <= 1 or len(misses) <= 1:
+                results.update((d, fetch_fn(d)) for d in misses)
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                    results.update(zip(misses, executor.map(fetch_fn, misses), strict=True))
+
+        return {d: results[d] for d in dates}
 
     def _make_api_call(self, method_name: str, *args: Any, **kwargs: Any) -> dict[str, Any] | None:
         """Make an API call with rate limiting and error handling.
@@ -57,16 +114,18 @@ class DataFetcher:
         Returns:
             API response data or None if failed.
         """
+        # Resolve the method first so a missing one does not use up a rate-limit slot
+        method = getattr(self.client, method_name, None)
+        if method is None:
+            logger.error(f"API method not found: {method_name}")
+            return None
+
         self._rate_limit()
 
         try:
-            method = getattr(self.client, method_name)
             response = method(*args, **kwargs)
             logger.debug(f"API call successful: {method_name}")
             return response
-        except AttributeError:
-            logger.error(f"API method not found: {method_name}")
-            return None
         except Exception as e:
             logger.error(f"API call failed ({method_name}): {e}")
             return None
@@ -164,6 +223,20 @@ class DataFetcher:
             logger.error(f"Failed to process daily quotes: {e}")
             return pd.DataFrame()
 
+    def fetch_daily_quotes_batch(
+        self, dates: list[date], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> dict[date, pd.DataFrame]:
+        """Fetch daily quotes for several dates concurrently.
+
+        Args:
+            dates: Dates for which to fetch quotes.
+            max_workers: Maximum number of worker threads.
+
+        Returns:
+            Dictionary mapping each date to its daily quotes DataFrame.
+        """
+        return self._fetch_many(self.fetch_daily_quotes, dates, max_workers, "daily_quotes_")
+
     def fetch_indices(self, target_date: date, force_refresh: bool = False) -> pd.DataFrame:
         """Fetch index data (NIKKEI, TOPIX, etc.).
 
@@ -208,6 +281,20 @@ class DataFetcher:
             logger.error(f"Failed to process indices: {e}")
             return pd.DataFrame()
 
+    def fetch_indices_batch(
+        self, dates: list[date], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> dict[date, pd.DataFrame]:
+        """Fetch index data for several dates concurrently.
+
+        Args:
+            dates: Dates for which to fetch index data.
+            max_workers: Maximum number of worker threads.
+
+        Returns:
+            Dictionary mapping each date to its index DataFrame.
+        """
+        return self._fetch_many(self.fetch_indices, dates, max_workers, "indices_")
+
     def fetch_topix(self, target_date: date, force_refresh: bool = False) -> pd.DataFrame:
         """Fetch TOPIX data.
 
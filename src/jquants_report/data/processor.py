@@ -7,10 +7,94 @@ utilities for various J-Quants API data types.
 import logging
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Quote columns narrowed by downcast_quotes
+PRICE_COLUMNS = ("Open", "High", "Low", "Close")
+VOLUME_COLUMNS = ("Volume", "TurnoverValue")
+
+# Company info columns taken from listed info for enrichment
+COMPANY_INFO_COLUMNS = ("CompanyName", "Sector33Code", "Sector33CodeName")
+
+def index_company_info(listed_info_df: pd.DataFrame) -> pd.DataFrame:
+    """Get company info from listed info, de-duplicated and indexed by Code.
+
+    Build it once per listed info frame and reuse it for every quote frame
+    enriched against that listed info.
+
+    Args:
+        listed_info_df: Listed company information with a Code column.
+
+    Returns:
+        DataFrame of available company info columns indexed by Code.
+    """
+    columns = ["Code", *(c for c in COMPANY_INFO_COLUMNS if c in listed_info_df.columns)]
+    return listed_info_df[columns].drop_duplicates("Code").set_index("Code")
+
+
+def pct_change(current: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """Calculate percentage change from base to current.
+
+    Args:
+        current: Current values.
+        base: Base values.
+
+    Returns:
+        Percentage change with plain division semantics: +/-inf where base
+        is zero, NaN where base is missing or both values are zero.
+    """
+    out: np.ndarray = np.subtract(current, base, dtype=np.float64)
+    # Zero bases give inf as the Series division this replaces did
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(out, base, out=out)
+    out *= 100
+    return out
+
+
+def previous_in_group(keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Shift values down by one row within contiguous groups.
+
+    Args:
+        keys: Group key of each row, sorted so that each group is contiguous.
+        values: Values to shift.
+
+    Returns:
+        float64 array holding the previous row's value, NaN at the first row
+        of each group.
+    """
+    out = np.empty(len(values), dtype=np.float64)
+    if len(values) == 0:
+        return out
+    out[0] = np.nan
+    out[1:] = values[:-1]
+    out[1:][keys[1:] != keys[:-1]] = np.nan
+    return out
+
+
+def downcast_quotes(df: pd.DataFrame) -> None:
+    """Downcast price and volume columns in place to shrink scanned data.
+
+    Price columns go to float32 only when every value round-trips exactly,
+    so downcast prices still compare equal to float64 data from elsewhere.
+    Volume and turnover are downcast to the smallest integer type only when
+    they hold no missing values.
+
+    Args:
+        df: Daily quotes DataFrame.
+    """
+    for col in PRICE_COLUMNS:
+        if col in df.columns and df[col].dtype == np.float64:
+            values = df[col].to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed, values, equal_nan=True):
+                df[col] = narrowed
+    for col in VOLUME_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+
 
 class DataProcessor:
     """Processes and normalizes J-Quants API data.
@@ -37,6 +121,52 @@ class DataProcessor:
         "AdjustmentVolume": "adjusted_volume",
     }
 
+    LISTED_INFO_COLUMN_MAPPINGS = {
+        "Code": "code",
+        "CompanyName": "company_name",
+        "CompanyNameEnglish": "company_name_en",
+        "Sector17Code": "sector_17_code",
+        "Sector17CodeName": "sector_17_name",
+        "Sector33Code": "sector_33_code",
+        "Sector33CodeName": "sector_33_name",
+        "ScaleCategory": "scale_category",
+        "MarketCode": "market_code",
+        "MarketCodeName": "market_name",
+    }
+
+    INDEX_COLUMN_MAPPINGS = {
+        "Date": "date",
+        "Code": "code",
+        "IndexName": "index_name",
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+    }
+
+    MARGIN_INTEREST_COLUMN_MAPPINGS = {
+        "Code": "code",
+        "Date": "date",
+        "MarginBuy": "margin_buy",
+        "MarginSell": "margin_sell",
+        "MarginBuyBalance": "margin_buy_balance",
+        "MarginSellBalance": "margin_sell_balance",
+    }
+
+    SHORT_SELLING_COLUMN_MAPPINGS = {
+        "Code": "code",
+        "Date": "date",
+        "ShortSellingRatio": "short_selling_ratio",
+        "ShortSellingVolume": "short_selling_volume",
+        "TotalVolume": "total_volume",
+    }
+
+    ANNOUNCEMENT_COLUMN_MAPPINGS = {
+        "Code": "code",
+        "Date": "date",
+        "CompanyName": "company_name",
+    }
+
     def __init__(self):
         """Initialize DataProcessor."""
         pass
@@ -61,6 +191,22 @@ class DataProcessor:
         logger.debug(f"Standardized columns: {list(df.columns)}")
         return df
 
+    def _categorize_codes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the code column as categorical.
+
+        A few thousand distinct codes repeat across every row, so integer
+        category codes shrink memory and speed up groupby and merges on code.
+
+        Args:
+            df: Input DataFrame.
+
+        Returns:
+            DataFrame with a categorical code column.
+        """
+        if "code" in df.columns:
+            df["code"] = df["code"].astype("category")
+        return df
+
     def _convert_date_columns(self, df: pd.DataFrame, date_columns: list[str]) -> pd.DataFrame:
         """Convert string columns to datetime.
 
@@ -99,13 +245,21 @@ class DataProcessor:
         if df.empty:
             return df
 
-        for col in numeric_columns:
-            if col in df.columns:
-                try:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-                    logger.debug(f"Converted {col} to numeric")
-                except Exception as e:
-                    logger.warning(f"Failed to convert {col} to numeric: {e}")
+        # Columns the API already returned as numbers need no conversion
+        columns = [
+            col
+            for col in numeric_columns
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+        ]
+        if not columns:
+            return df
+
+        # Convert every column in one assignment instead of one per column
+        try:
+            df[columns] = df[columns].apply(pd.to_numeric, errors="coerce")
+            logger.debug(f"Converted {columns} to numeric")
+        except Exception as e:
+            logger.warning(f"Failed to convert {columns} to numeric: {e}")
 
         return df
 
@@ -148,6 +302,7 @@ class DataProcessor:
 
         # Standardize column names
         df = self._standardize_columns(df)
+        df = self._categorize_codes(df)
 
         # Convert date columns
         df = self._convert_date_columns(df, ["date"])
@@ -201,19 +356,8 @@ class DataProcessor:
         logger.info(f"Processing {len(df)} listed info records")
 
         # Standardize common column names
-        column_mapping = {
-            "Code": "code",
-            "CompanyName": "company_name",
-            "CompanyNameEnglish": "company_name_en",
-            "Sector17Code": "sector_17_code",
-            "Sector17CodeName": "sector_17_name",
-            "Sector33Code": "sector_33_code",
-            "Sector33CodeName": "sector_33_name",
-            "ScaleCategory": "scale_category",
-            "MarketCode": "market_code",
-            "MarketCodeName": "market_name",
-        }
-        df = self._standardize_columns(df, column_mapping)
+        df = self._standardize_columns(df, self.LISTED_INFO_COLUMN_MAPPINGS)
+        df = self._categorize_codes(df)
 
         # Remove duplicates based on code
         if "code" in df.columns:
@@ -241,16 +385,7 @@ class DataProcessor:
         logger.info(f"Processing {len(df)} index records")
 
         # Standardize column names
-        column_mapping = {
-            "Date": "date",
-            "Code": "code",
-            "IndexName": "index_name",
-            "Open": "open",
-            "High": "high",
-            "Low": "low",
-            "Close": "close",
-        }
-        df = self._standardize_columns(df, column_mapping)
+        df = self._standardize_columns(df, self.INDEX_COLUMN_MAPPINGS)
 
         # Convert date columns
         df = self._convert_date_columns(df, ["date"])
@@ -318,15 +453,7 @@ class DataProcessor:
         logger.info(f"Processing {len(df)} margin interest records")
 
         # Standardize column names
-        column_mapping = {
-            "Code": "code",
-            "Date": "date",
-            "MarginBuy": "margin_buy",
-            "MarginSell": "margin_sell",
-            "MarginBuyBalance": "margin_buy_balance",
-            "MarginSellBalance": "margin_sell_balance",
-        }
-        df = self._standardize_columns(df, column_mapping)
+        df = self._standardize_columns(df, self.MARGIN_INTEREST_COLUMN_MAPPINGS)
 
         # Convert date columns
         df = self._convert_date_columns(df, ["date"])
@@ -358,14 +485,7 @@ class DataProcessor:
         logger.info(f"Processing {len(df)} short selling records")
 
         # Standardize column names
-        column_mapping = {
-            "Code": "code",
-            "Date": "date",
-            "ShortSellingRatio": "short_selling_ratio",
-            "ShortSellingVolume": "short_selling_volume",
-            "TotalVolume": "total_volume",
-        }
-        df = self._standardize_columns(df, column_mapping)
+        df = self._standardize_columns(df, self.SHORT_SELLING_COLUMN_MAPPINGS)
 
         # Convert date columns
         df = self._convert_date_columns(df, ["date"])
@@ -435,12 +555,7 @@ class DataProcessor:
         logger.info(f"Processing {len(df)} announcement records")
 
         # Standardize column names
-        column_mapping = {
-            "Code": "code",
-            "Date": "date",
-            "CompanyName": "company_name",
-        }
-        df = self._standardize_columns(df, column_mapping)
+        df = self._standardize_columns(df, self.ANNOUNCEMENT_COLUMN_MAPPINGS)
 
         # Convert date columns
         df = self._convert_date_columns(df, ["date", "Date"])
@@ -471,35 +586,18 @@ class DataProcessor:
 
         logger.info(f"Calculating statistics for {value_column}")
 
+        # describe() computes count, mean, std, min, quartiles and max in one
+        # vectorized pass per group, without Python-level quantile lambdas
         if group_by and group_by in df.columns:
-            stats = (
-                df.groupby(group_by)[value_column]
-                .agg(
-                    [
-                        ("count", "count"),
-                        ("mean", "mean"),
-                        ("std", "std"),
-                        ("min", "min"),
-                        ("25%", lambda x: x.quantile(0.25)),
-                        ("50%", lambda x: x.quantile(0.50)),
-                        ("75%", lambda x: x.quantile(0.75)),
-                        ("max", "max"),
-                    ]
-                )
-                .reset_index()
-            )
+            stats = df.groupby(group_by, observed=True)[value_column].describe().reset_index()
         else:
-            stats_dict = {
-                "count": df[value_column].count(),
-                "mean": df[value_column].mean(),
-                "std": df[value_column].std(),
-                "min": df[value_column].min(),
-                "25%": df[value_column].quantile(0.25),
-                "50%": df[value_column].quantile(0.50),
-                "75%": df[value_column].quantile(0.75),
-                "max": df[value_column].max(),
-            }
-            stats = pd.DataFrame([stats_dict])
+            stats = df[value_column].describe().to_frame().T.reset_index(drop=True)
+        stats["count"] = stats["count"].astype(np.int64)
+        # describe() reports everything as float; min and max are observed
+        # values, so give integer columns their source dtype back
+        source_dtype = df[value_column].dtype
+        if pd.api.types.is_integer_dtype(source_dtype):
+            stats[["min", "max"]] = stats[["min", "max"]].astype(source_dtype)
 
         logger.info("Statistics calculated successfully")
         return stats
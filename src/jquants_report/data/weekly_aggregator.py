@@ -5,15 +5,192 @@ reusing cached daily data to minimize API calls.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from jquants_report.data.cache import CacheManager
+from jquants_report.data.processor import (
+    COMPANY_INFO_COLUMNS,
+    downcast_quotes,
+    pct_change,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cache reads are I/O bound (SQLite + unpickling), so a small pool is enough
+DEFAULT_MAX_WORKERS = 5
+
+
+@lru_cache(maxsize=256)
+def _week_trading_days(week_end: date) -> tuple[date, ...]:
+    """Get weekdays from Monday up to week_end (cached).
+
+    Args:
+        week_end: The Friday (or last trading day) of the week.
+
+    Returns:
+        Tuple of weekdays from Monday to week_end.
+    """
+    week_start = week_end - timedelta(days=week_end.weekday())
+    return tuple(
+        day
+        for day in (week_start + timedelta(days=i) for i in range(5))
+        if day <= week_end
+    )
+
+
+@lru_cache(maxsize=256)
+def _previous_week_end(week_end: date) -> date:
+    """Get the Friday before week_end (cached).
+
+    Args:
+        week_end: Current week's end date.
+
+    Returns:
+        Previous week's Friday.
+    """
+    days_to_friday = (week_end.weekday() - 4) % 7
+    if days_to_friday == 0:
+        days_to_friday = 7
+    return week_end - timedelta(days=days_to_friday)
+
+
+@lru_cache(maxsize=256)
+def _latest_friday(reference_date: date) -> date:
+    """Get the most recent Friday on or before reference_date (cached).
+
+    Args:
+        reference_date: Reference date.
+
+    Returns:
+        Most recent Friday date.
+    """
+    return reference_date - timedelta(days=(reference_date.weekday() - 4) % 7)
+
+
+def _pick_valid(
+    values: np.ndarray, group_ids: np.ndarray, n_groups: int, last: bool
+) -> np.ndarray:
+    """Pick the first or last non-missing value of each presorted group.
+
+    Args:
+        values: Column values, sorted so that each group is contiguous.
+        group_ids: Group number of each row (0..n_groups-1, non-decreasing).
+        n_groups: Number of groups.
+        last: Pick the last value instead of the first.
+
+    Returns:
+        One value per group, missing where the group has no valid value.
+    """
+    if values.dtype.kind in "iub":
+        out = np.empty(n_groups, dtype=values.dtype)
+        valid = np.ones(len(values), dtype=bool)
+    else:
+        out = np.full(n_groups, np.nan, dtype=values.dtype if values.dtype.kind == "f" else object)
+        valid = ~pd.isna(values)
+
+    valid_groups = group_ids[valid]
+    if len(valid_groups) == 0:
+        return out
+
+    boundary = valid_groups[1:] != valid_groups[:-1]
+    mask = np.append(boundary, True) if last else np.insert(boundary, 0, True)
+    out[valid_groups[mask]] = values[valid][mask]
+    return out
+
+
+def _aggregate_sorted(
+    df: pd.DataFrame, key: str, spec: dict[str, tuple[str, str]]
+) -> pd.DataFrame:
+    """Aggregate a frame whose rows are already sorted by ``key``.
+
+    Equivalent to ``df.groupby(key).agg(**spec).reset_index()`` for the
+    reductions "first", "last", "min", "max", "sum" and "nunique", but
+    reduces each contiguous run with ``ufunc.reduceat`` instead of hashing
+    keys. Missing values are skipped as in pandas. "nunique" assumes the
+    column is also sorted within each group.
+
+    Args:
+        df: Non-empty DataFrame sorted by ``key``.
+        key: Grouping column.
+        spec: Mapping of output column to (source column, reduction).
+
+    Returns:
+        DataFrame with one row per key in sorted order.
+    """
+    key_col = df[key]
+    if isinstance(key_col.dtype, pd.CategoricalDtype):
+        keys = key_col.cat.codes.to_numpy()
+    else:
+        keys = key_col.to_numpy()
+    is_start = np.empty(len(keys), dtype=bool)
+    is_start[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=is_start[1:])
+    starts = np.flatnonzero(is_start)
+    group_ids = np.cumsum(is_start) - 1
+    n_groups = len(starts)
+
+    result: dict[str, Any] = {key: key_col.iloc[starts].reset_index(drop=True)}
+    for out_col, (col, func) in spec.items():
+        values = df[col].to_numpy()
+        is_float = values.dtype.kind == "f"
+
+        if func in ("first", "last"):
+            picked = _pick_valid(values, group_ids, n_groups, last=func == "last")
+            source_dtype = df[col].dtype
+            # Restore extension dtypes (e.g. Arrow strings) lost by to_numpy()
+            result[out_col] = (
+                picked
+                if isinstance(source_dtype, np.dtype)
+                else pd.Series(picked, dtype=source_dtype, copy=False)
+            )
+        elif func == "max":
+            result[out_col] = (np.fmax if is_float else np.maximum).reduceat(values, starts)
+        elif func == "min":
+            result[out_col] = (np.fmin if is_float else np.minimum).reduceat(values, starts)
+        elif func == "sum":
+            # Accumulate in 64 bits even when the input was downcast
+            result[out_col] = np.add.reduceat(
+                np.nan_to_num(values) if is_float else values,
+                starts,
+                dtype=np.float64 if is_float else np.int64,
+            )
+        elif func == "nunique":
+            changed = is_start.copy()
+            changed[1:] |= values[1:] != values[:-1]
+            result[out_col] = np.add.reduceat(changed.astype(np.int64), starts)
+        else:
+            raise ValueError(f"Unsupported reduction: {func}")
+
+    return pd.DataFrame(result)
+
+
+def _prev_week_closes(prev_week_close_df: pd.DataFrame, codes: pd.Series) -> pd.DataFrame:
+    """Previous week closes keyed by this week's Code categories.
+
+    Codes that no longer trade this week cannot match a left merge, and
+    casting them would turn each into a duplicate NaN key, so they are
+    dropped first.
+
+    Args:
+        prev_week_close_df: DataFrame with Code and Close of the previous week.
+        codes: This week's categorical Code column.
+
+    Returns:
+        DataFrame with Code and PrevWeekClose columns.
+    """
+    categories = codes.cat.categories
+    prev_close = prev_week_close_df.loc[
+        prev_week_close_df["Code"].isin(categories), ["Code", "Close"]
+    ].rename(columns={"Close": "PrevWeekClose"})
+    prev_close["Code"] = prev_close["Code"].astype(pd.CategoricalDtype(categories))
+    return prev_close
+
 
 class WeeklyDataAggregator:
     """Aggregates daily data into weekly summaries.
@@ -22,19 +199,92 @@ class WeeklyDataAggregator:
     without redundant API calls.
     """
 
+    # Company info columns carried through weekly aggregation when present
+    INFO_COLUMNS = COMPANY_INFO_COLUMNS
+
     def __init__(
         self,
         cache_manager: CacheManager,
         data_fetcher: Any = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """Initialize WeeklyDataAggregator.
 
         Args:
             cache_manager: CacheManager instance for accessing cached data.
             data_fetcher: Optional DataFetcher for fetching missing data.
+            max_workers: Number of threads used for per-day cache reads.
+                Values of 1 or less load days sequentially.
         """
         self.cache = cache_manager
         self.fetcher = data_fetcher
+        self.max_workers = max_workers
+
+    def _load_one(self, day: date, key_prefix: str) -> pd.DataFrame | None:
+        """Load one day's data from cache.
+
+        Args:
+            day: Trading day to load.
+            key_prefix: Cache key prefix (e.g. "daily_quotes_").
+
+        Returns:
+            Cached DataFrame, or None if missing or empty.
+        """
+        df = self.cache.get(f"{key_prefix}{day.isoformat()}")
+        if df is None or df.empty:
+            return None
+        return df
+
+    def load_cached_frames(
+        self, days: list[date], key_prefix: str
+    ) -> list[pd.DataFrame | None]:
+        """Load per-day data from cache only, in parallel when enabled.
+
+        Args:
+            days: Days to load.
+            key_prefix: Cache key prefix.
+
+        Returns:
+            List aligned with ``days`` holding the cached DataFrame or None.
+        """
+        workers = min(self.max_workers, len(days))
+        if workers <= 1:
+            return [self._load_one(day, key_prefix) for day in days]
+        # The pool lives only for this load, so no threads outlive the call
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="weekly-aggregator"
+        ) as pool:
+            return list(pool.map(lambda day: self._load_one(day, key_prefix), days))
+
+    def _load_daily_frames(
+        self, trading_days: list[date], key_prefix: str, fetch_method: str
+    ) -> list[pd.DataFrame]:
+        """Load per-day data tagged with TradeDate, fetching cache misses.
+
+        Cache reads run on a worker pool. Fetches for cache misses stay
+        sequential: DataFetcher spaces every request by its rate limit, so
+        fetching from several threads would only queue them on that limiter.
+
+        Args:
+            trading_days: Trading days to load.
+            key_prefix: Cache key prefix.
+            fetch_method: DataFetcher method name used for cache misses.
+
+        Returns:
+            List of non-empty daily DataFrames in ascending date order.
+        """
+        trading_days = sorted(trading_days)
+        cached = self.load_cached_frames(trading_days, key_prefix)
+        daily_dfs = []
+        for day, df in zip(trading_days, cached, strict=True):
+            if df is None and self.fetcher:
+                df = getattr(self.fetcher, fetch_method)(day)
+                if df.empty:
+                    df = None
+            if df is not None:
+                df["TradeDate"] = day
+                daily_dfs.append(df)
+        return daily_dfs
 
     def get_week_trading_days(self, week_end: date) -> list[date]:
         """Get trading days for a week ending on the specified date.
@@ -45,18 +295,7 @@ class WeeklyDataAggregator:
         Returns:
             List of trading dates from Monday to Friday (excluding weekends).
         """
-        # Find Monday of that week
-        days_since_monday = week_end.weekday()
-        week_start = week_end - timedelta(days=days_since_monday)
-
-        # Generate weekdays (Mon-Fri)
-        trading_days = []
-        for i in range(5):
-            day = week_start + timedelta(days=i)
-            if day <= week_end and day.weekday() < 5:  # Weekday only
-                trading_days.append(day)
-
-        return trading_days
+        return list(_week_trading_days(week_end))
 
     def get_previous_week_end(self, week_end: date) -> date:
         """Get the Friday of the previous week.
@@ -67,11 +306,7 @@ class WeeklyDataAggregator:
         Returns:
             Previous week's Friday.
         """
-        # Find previous Friday
-        days_to_friday = (week_end.weekday() - 4) % 7
-        if days_to_friday == 0:
-            days_to_friday = 7
-        return week_end - timedelta(days=days_to_friday)
+        return _previous_week_end(week_end)
 
     def get_latest_friday(self, reference_date: date | None = None) -> date:
         """Get the most recent Friday.
@@ -85,8 +320,7 @@ class WeeklyDataAggregator:
         if reference_date is None:
             reference_date = date.today()
 
-        days_since_friday = (reference_date.weekday() - 4) % 7
-        return reference_date - timedelta(days=days_since_friday)
+        return _latest_friday(reference_date)
 
     def aggregate_daily_quotes(
         self,
@@ -106,64 +340,55 @@ class WeeklyDataAggregator:
             return pd.DataFrame()
 
         # Collect daily data
-        daily_dfs = []
-        for day in trading_days:
-            date_str = day.strftime("%Y-%m-%d")
-            df = self.cache.get(f"daily_quotes_{date_str}")
-
-            if df is not None and not df.empty:
-                df["TradeDate"] = day
-                daily_dfs.append(df)
-            elif self.fetcher:
-                df = self.fetcher.fetch_daily_quotes(day)
-                if not df.empty:
-                    df["TradeDate"] = day
-                    daily_dfs.append(df)
+        daily_dfs = self._load_daily_frames(trading_days, "daily_quotes_", "fetch_daily_quotes")
 
         if not daily_dfs:
             logger.warning("No daily data available for the week")
             return pd.DataFrame()
 
-        # Combine all daily data
-        combined_df = pd.concat(daily_dfs, ignore_index=True)
-
-        # Sort by Code and Date
-        combined_df = combined_df.sort_values(["Code", "TradeDate"])
-
-        # Aggregate by Code
-        weekly_agg = combined_df.groupby("Code").agg(
-            WeekOpen=("Open", "first"),
-            WeekHigh=("High", "max"),
-            WeekLow=("Low", "min"),
-            WeekClose=("Close", "last"),
-            WeekVolume=("Volume", "sum"),
-            WeekTurnover=("TurnoverValue", "sum"),
-            TradingDays=("TradeDate", "nunique"),
-            FirstDate=("TradeDate", "min"),
-            LastDate=("TradeDate", "max"),
-        ).reset_index()
-
-        # Merge company info if available
-        last_day_df = combined_df[combined_df["TradeDate"] == combined_df["TradeDate"].max()]
-        info_cols = ["Code"]
-        for col in ["CompanyName", "Sector33Code", "Sector33CodeName"]:
-            if col in last_day_df.columns:
-                info_cols.append(col)
-
-        if len(info_cols) > 1:
-            company_info = last_day_df[info_cols].drop_duplicates("Code")
-            weekly_agg = weekly_agg.merge(company_info, on="Code", how="left")
+        # Combine all daily data; categorical Code lets groupby/merge work on
+        # integer codes instead of hashing strings per row
+        combined_df = pd.concat(daily_dfs, ignore_index=True, sort=False)
+        # Drop the per-day frames so they can be freed during aggregation
+        daily_dfs.clear()
+        combined_df["Code"] = combined_df["Code"].astype("category")
+        downcast_quotes(combined_df)
+
+        # Arrow-backed strings hash and compare in C for the text info columns
+        str_cols = list(combined_df.columns.intersection(list(self.INFO_COLUMNS)))
+        if str_cols:
+            combined_df[str_cols] = combined_df[str_cols].astype("string[pyarrow]")
+
+        # Daily frames are concatenated in date order, so a stable sort on Code
+        # alone leaves each code's rows ordered by TradeDate
+        combined_df = combined_df.sort_values("Code", kind="stable")
+
+        # Aggregate by Code in one scan over the sorted rows; company info rides
+        # along so no separate last-day slice and merge is needed
+        agg_spec: dict[str, tuple[str, str]] = {
+            "WeekOpen": ("Open", "first"),
+            "WeekHigh": ("High", "max"),
+            "WeekLow": ("Low", "min"),
+            "WeekClose": ("Close", "last"),
+            "WeekVolume": ("Volume", "sum"),
+            "WeekTurnover": ("TurnoverValue", "sum"),
+            "TradingDays": ("TradeDate", "nunique"),
+            "FirstDate": ("TradeDate", "min"),
+            "LastDate": ("TradeDate", "max"),
+        }
+        # Rows are sorted by TradeDate, so "last" is the latest day's value
+        for col in combined_df.columns.intersection(list(self.INFO_COLUMNS)):
+            agg_spec[col] = (col, "last")
+
+        weekly_agg = _aggregate_sorted(combined_df, "Code", agg_spec)
 
         # Calculate weekly return if previous week data available
         if prev_week_close_df is not None and not prev_week_close_df.empty:
-            prev_close = prev_week_close_df[["Code", "Close"]].rename(
-                columns={"Close": "PrevWeekClose"}
-            )
-            weekly_agg = weekly_agg.merge(prev_close, on="Code", how="left")
-            weekly_agg["WeeklyReturn"] = (
-                (weekly_agg["WeekClose"] - weekly_agg["PrevWeekClose"])
-                / weekly_agg["PrevWeekClose"]
-                * 100
+            prev_close = _prev_week_closes(prev_week_close_df, weekly_agg["Code"])
+            weekly_agg = weekly_agg.merge(prev_close, on="Code", how="left", validate="many_to_one")
+            weekly_agg["WeeklyReturn"] = pct_change(
+                weekly_agg["WeekClose"].to_numpy(dtype=np.float64),
+                weekly_agg["PrevWeekClose"].to_numpy(dtype=np.float64),
             )
         else:
             weekly_agg["WeeklyReturn"] = None
@@ -171,6 +396,24 @@ class WeeklyDataAggregator:
 
         return weekly_agg
 
+    def attach_company_info(
+        self, weekly_quotes: pd.DataFrame, company_info: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Merge company info columns the weekly quotes do not already have.
+
+        Args:
+            weekly_quotes: Weekly aggregated quote data.
+            company_info: Company info indexed by Code, from index_company_info.
+
+        Returns:
+            Weekly quotes with company info columns added.
+        """
+        missing = company_info.columns.difference(weekly_quotes.columns, sort=False)
+        if missing.empty:
+            return weekly_quotes
+
+        return weekly_quotes.join(company_info[missing], on="Code")
+
     def aggregate_indices(
         self,
         trading_days: list[date],
@@ -188,44 +431,36 @@ class WeeklyDataAggregator:
         if not trading_days:
             return pd.DataFrame()
 
-        daily_dfs = []
-        for day in trading_days:
-            date_str = day.strftime("%Y-%m-%d")
-            df = self.cache.get(f"indices_{date_str}")
-
-            if df is not None and not df.empty:
-                df["TradeDate"] = day
-                daily_dfs.append(df)
-            elif self.fetcher:
-                df = self.fetcher.fetch_indices(day)
-                if not df.empty:
-                    df["TradeDate"] = day
-                    daily_dfs.append(df)
+        daily_dfs = self._load_daily_frames(trading_days, "indices_", "fetch_indices")
 
         if not daily_dfs:
             return pd.DataFrame()
 
-        combined_df = pd.concat(daily_dfs, ignore_index=True)
-        combined_df = combined_df.sort_values(["Code", "TradeDate"])
-
-        weekly_agg = combined_df.groupby("Code").agg(
-            WeekOpen=("Open", "first"),
-            WeekHigh=("High", "max"),
-            WeekLow=("Low", "min"),
-            WeekClose=("Close", "last"),
-            FirstDate=("TradeDate", "min"),
-            LastDate=("TradeDate", "max"),
-        ).reset_index()
+        combined_df = pd.concat(daily_dfs, ignore_index=True, sort=False)
+        daily_dfs.clear()
+        combined_df["Code"] = combined_df["Code"].astype("category")
+        combined_df = combined_df.sort_values("Code", kind="stable")
+
+        weekly_agg = _aggregate_sorted(
+            combined_df,
+            "Code",
+            {
+                "WeekOpen": ("Open", "first"),
+                "WeekHigh": ("High", "max"),
+                "WeekLow": ("Low", "min"),
+                "WeekClose": ("Close", "last"),
+                "FirstDate": ("TradeDate", "min"),
+                "LastDate": ("TradeDate", "max"),
+            },
+        )
 
         if prev_week_close_df is not None and not prev_week_close_df.empty:
-            prev_close = prev_week_close_df[["Code", "Close"]].rename(
-                columns={"Close": "PrevWeekClose"}
-            )
-            weekly_agg = weekly_agg.merge(prev_close, on="Code", how="left")
-            weekly_agg["WeeklyChange"] = weekly_agg["WeekClose"] - weekly_agg["PrevWeekClose"]
-            weekly_agg["WeeklyChangeRate"] = (
-                weekly_agg["WeeklyChange"] / weekly_agg["PrevWeekClose"] * 100
-            )
+            prev_close = _prev_week_closes(prev_week_close_df, weekly_agg["Code"])
+            weekly_agg = weekly_agg.merge(prev_close, on="Code", how="left", validate="many_to_one")
+            week_close = weekly_agg["WeekClose"].to_numpy(dtype=np.float64)
+            prev_week_close = weekly_agg["PrevWeekClose"].to_numpy(dtype=np.float64)
+            weekly_agg["WeeklyChange"] = week_close - prev_week_close
+            weekly_agg["WeeklyChangeRate"] = pct_change(week_close, prev_week_close)
 
         return weekly_agg
 
@@ -250,7 +485,10 @@ class WeeklyDataAggregator:
         if valid_data.empty:
             return pd.DataFrame()
 
-        sector_agg = valid_data.groupby(["Sector33Code", "Sector33CodeName"]).agg(
+        for col in ["Sector33Code", "Sector33CodeName"]:
+            valid_data[col] = valid_data[col].astype("category")
+
+        sector_agg = valid_data.groupby(["Sector33Code", "Sector33CodeName"], observed=True).agg(
             AvgWeeklyReturn=("WeeklyReturn", "mean"),
             MedianWeeklyReturn=("WeeklyReturn", "median"),
             TotalTurnover=("WeekTurnover", "sum"),
@@ -276,24 +514,12 @@ class WeeklyDataAggregator:
         if not trading_days:
             return pd.DataFrame()
 
-        daily_dfs = []
-        for day in trading_days:
-            date_str = day.strftime("%Y-%m-%d")
-            df = self.cache.get(f"trades_spec_{date_str}")
-
-            if df is not None and not df.empty:
-                df["TradeDate"] = day
-                daily_dfs.append(df)
-            elif self.fetcher:
-                df = self.fetcher.fetch_trades_spec(day)
-                if not df.empty:
-                    df["TradeDate"] = day
-                    daily_dfs.append(df)
+        daily_dfs = self._load_daily_frames(trading_days, "trades_spec_", "fetch_trades_spec")
 
         if not daily_dfs:
             return pd.DataFrame()
 
-        return pd.concat(daily_dfs, ignore_index=True)
+        return pd.concat(daily_dfs, ignore_index=True, sort=False)
 
     def get_week_margin_data(self, week_end: date) -> pd.DataFrame:
         """Get margin trading data for the week.
@@ -307,7 +533,7 @@ class WeeklyDataAggregator:
         Returns:
             DataFrame with margin trading data.
         """
-        date_str = week_end.strftime("%Y-%m-%d")
+        date_str = week_end.isoformat()
         df = self.cache.get(f"margin_interest_{date_str}")
 
         if df is not None:
@@ -339,21 +565,24 @@ class WeeklyDataAggregator:
         end_date = max(trading_days)
         start_date = end_date - timedelta(weeks=lookback_weeks)
 
-        # Collect daily data
-        all_data = []
+        # Collect weekdays in range
+        weekdays = []
         current_date = start_date
-
         while current_date <= end_date:
             if current_date.weekday() < 5:  # Weekday
-                date_str = current_date.strftime("%Y-%m-%d")
-                df = self.cache.get(f"daily_quotes_{date_str}")
-                if df is not None and not df.empty:
-                    if "Date" not in df.columns:
-                        df["Date"] = date_str
-                    all_data.append(df)
+                weekdays.append(current_date)
             current_date += timedelta(days=1)
 
+        # Collect daily data (cache only)
+        cached = self.load_cached_frames(weekdays, "daily_quotes_")
+        all_data = []
+        for day, df in zip(weekdays, cached, strict=True):
+            if df is not None:
+                if "Date" not in df.columns:
+                    df["Date"] = day.isoformat()
+                all_data.append(df)
+
         if not all_data:
             return pd.DataFrame()
 
-        return pd.concat(all_data, ignore_index=True)
+        return pd.concat(all_data, ignore_index=True, sort=False)
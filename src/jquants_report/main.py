@@ -3,10 +3,87 @@
 import argparse
 import logging
 import sys
-from datetime import date, datetime, timedelta
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-
+from typing import Any, TypeGuard, overload
+
+import numpy as np
+import pandas as pd
+
+from jquants_report.analysis.market import MarketAnalyzer
+from jquants_report.analysis.sector import SectorAnalyzer
+from jquants_report.analysis.stocks import StockAnalyzer, StockInfo
+from jquants_report.analysis.supply_demand import SupplyDemandAnalysis, SupplyDemandAnalyzer
+from jquants_report.analysis.technical import TechnicalAnalyzer, TechnicalIndicators
+from jquants_report.analysis.weekly import (
+    WeeklyEventsAnalyzer,
+    WeeklyInvestorAnalyzer,
+    WeeklyMarginAnalyzer,
+    WeeklyMarketAnalyzer,
+    WeeklySectorAnalyzer,
+    WeeklyStockAnalyzer,
+    WeeklyTechnicalAnalyzer,
+    WeeklyTopicsAnalyzer,
+    WeeklyTrendsAnalyzer,
+)
+from jquants_report.api import JQuantsClient
 from jquants_report.config import load_config
+from jquants_report.data import CacheManager, DataFetcher, WeeklyDataAggregator
+from jquants_report.data.processor import (
+    downcast_quotes,
+    index_company_info,
+    pct_change,
+    previous_in_group,
+)
+from jquants_report.report import (
+    IndexData,
+    MarketSummary,
+    ReportGenerator,
+    SectorAnalysis,
+    SectorData,
+    StockData,
+    StockHighlights,
+    SupplyDemandSummary,
+    TechnicalIndicator,
+    TechnicalSummary,
+)
+from jquants_report.report.weekly_generator import WeeklyReportGenerator
+
+# Days back to the previous weekday, keyed by weekday (Monday and Sunday skip
+# back to Friday; every other day goes back one day)
+PREV_WEEKDAY_OFFSETS = {0: 3, 6: 2}
+
+# Column names the short selling API has used for the ratio, in priority order
+SHORT_SELLING_RATIO_COLUMNS = ("ShortSellingRatio", "short_selling_ratio")
+
+
+def _ma_signal(value: float) -> str:
+    """Signal for the share of stocks above a moving average."""
+    return "買い" if value > 50 else "売り"
+
+
+def _advance_decline_signal(value: float) -> str:
+    """Signal for the advance-decline ratio."""
+    if value > 120:
+        return "買われ過ぎ"
+    if value < 80:
+        return "売られ過ぎ"
+    return "中立"
+
+
+# (display name, TechnicalIndicators attribute, signal function)
+IndicatorSpec = tuple[str, str, Callable[[float], str]]
+
+MOVING_AVERAGE_SPECS: tuple[IndicatorSpec, ...] = (
+    ("25日線上回り銘柄比率", "stocks_above_ma25_pct", _ma_signal),
+    ("75日線上回り銘柄比率", "stocks_above_ma75_pct", _ma_signal),
+)
+
+MOMENTUM_SPECS: tuple[IndicatorSpec, ...] = (
+    ("騰落レシオ(25日)", "advance_decline_ratio_25d", _advance_decline_signal),
+)
 
 
 def setup_logging(log_level: str) -> None:
@@ -71,6 +148,31 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def parse_ymd(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string by slicing its fixed-width fields.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format.
+
+    Returns:
+        Parsed date.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date.
+    """
+    year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    # int() alone would accept signs, spaces and non-ASCII digits in a field
+    if (
+        len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not date_str.isascii()
+        or not (year + month + day).isdigit()
+    ):
+        raise ValueError(f"Not a YYYY-MM-DD date: {date_str}")
+    return date(int(year), int(month), int(day))
+
+
 def parse_date(date_str: str | None) -> date:
     """Parse date string to date object.
 
@@ -86,11 +188,90 @@ def parse_date(date_str: str | None) -> date:
     if date_str is None:
         return date.today()
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return parse_ymd(date_str)
     except ValueError as e:
         raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD.") from e
 
 
+def _nonempty(df: pd.DataFrame | None) -> TypeGuard[pd.DataFrame]:
+    """Check that a DataFrame exists and has rows.
+
+    Args:
+        df: DataFrame to check, or None.
+
+    Returns:
+        True if df is not None and has at least one row, narrowing it to
+        a DataFrame for type checkers.
+    """
+    return df is not None and df.shape[0] > 0
+
+
+def build_indicators(
+    indicators: TechnicalIndicators, specs: tuple[IndicatorSpec, ...]
+) -> list[TechnicalIndicator]:
+    """Build report indicators for each spec whose value is available.
+
+    Args:
+        indicators: Technical analysis results.
+        specs: Indicator specs to build, in display order.
+
+    Returns:
+        List of TechnicalIndicator objects, skipping missing values.
+    """
+    return [
+        TechnicalIndicator(name=name, value=value, signal=signal(value))
+        for name, attr, signal in specs
+        if (value := getattr(indicators, attr)) is not None
+    ]
+
+
+@overload
+def cached_or_fetch(
+    cache: CacheManager, key: str, fetch_fn: Callable[[], pd.DataFrame]
+) -> pd.DataFrame: ...
+
+
+@overload
+def cached_or_fetch(
+    cache: CacheManager, key: str, fetch_fn: Callable[[], pd.DataFrame] | None = None
+) -> pd.DataFrame | None: ...
+
+
+def cached_or_fetch(
+    cache: CacheManager, key: str, fetch_fn: Callable[[], pd.DataFrame] | None = None
+) -> pd.DataFrame | None:
+    """Read a DataFrame from cache, fetching it on a miss.
+
+    Args:
+        cache: Cache manager to read from.
+        key: Cache key.
+        fetch_fn: Fetch to run on a cache miss, or None for cache-only reads.
+
+    Returns:
+        Cached or fetched DataFrame. Only a cache-only read (no fetch_fn)
+        can return None.
+    """
+    df = cache.get(key)
+    if df is None and fetch_fn is not None:
+        df = fetch_fn()
+    return df
+
+
+def fetch_concurrently(tasks: dict[str, Callable[[], Any]], max_workers: int = 6) -> dict[str, Any]:
+    """Run independent fetch calls concurrently.
+
+    Args:
+        tasks: Mapping of result name to a zero-argument fetch callable.
+        max_workers: Maximum number of worker threads.
+
+    Returns:
+        Mapping of result name to the value returned by its callable.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     """Generate daily market report.
 
@@ -105,27 +286,6 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     logger = logging.getLogger(__name__)
     logger.info(f"Generating report for {target_date}")
 
-    # Import modules here to avoid circular imports
-    from jquants_report.analysis.market import MarketAnalyzer
-    from jquants_report.analysis.sector import SectorAnalyzer
-    from jquants_report.analysis.stocks import StockAnalyzer
-    from jquants_report.analysis.supply_demand import SupplyDemandAnalyzer
-    from jquants_report.analysis.technical import TechnicalAnalyzer
-    from jquants_report.api import JQuantsClient
-    from jquants_report.data import CacheManager, DataFetcher
-    from jquants_report.report import (
-        IndexData,
-        MarketSummary,
-        ReportGenerator,
-        SectorAnalysis,
-        SectorData,
-        StockData,
-        StockHighlights,
-        SupplyDemandSummary,
-        TechnicalIndicator,
-        TechnicalSummary,
-    )
-
     config = load_config()
 
     # Initialize components
@@ -139,76 +299,83 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     fetcher = DataFetcher(client, cache)
 
     # Fetch data
-    date_str = target_date.strftime("%Y-%m-%d")
+    date_str = target_date.isoformat()
 
     if dry_run:
         logger.info("Dry run mode: using cached data only")
-        prices_df = cache.get(f"daily_quotes_{date_str}") or fetcher.fetch_daily_quotes(
-            target_date
+        prices_df = cached_or_fetch(
+            cache, f"daily_quotes_{date_str}", lambda: fetcher.fetch_daily_quotes(target_date)
         )
-        indices_df = (
-            cache.get(f"indices_{date_str}") or fetcher.fetch_indices(target_date)
+        indices_df = cached_or_fetch(
+            cache, f"indices_{date_str}", lambda: fetcher.fetch_indices(target_date)
         )
-        listed_info_df = cache.get("listed_info") or fetcher.fetch_listed_info()
+        listed_info_df = cached_or_fetch(cache, "listed_info", fetcher.fetch_listed_info)
     else:
         logger.info("Fetching market data...")
-        prices_df = fetcher.fetch_daily_quotes(target_date)
-        indices_df = fetcher.fetch_indices(target_date)
-        listed_info_df = fetcher.fetch_listed_info()
+        # None of these depend on each other, so issue them together
+        fetched = fetch_concurrently(
+            {
+                "prices": lambda: fetcher.fetch_daily_quotes(target_date),
+                "indices": lambda: fetcher.fetch_indices(target_date),
+                "listed_info": fetcher.fetch_listed_info,
+                "trades_spec": lambda: fetcher.fetch_trades_spec(target_date),
+                "margin_interest": lambda: fetcher.fetch_margin_interest(target_date),
+                "short_selling": lambda: fetcher.fetch_short_selling(target_date),
+            }
+        )
+        prices_df = fetched["prices"]
+        indices_df = fetched["indices"]
+        listed_info_df = fetched["listed_info"]
+
+    # Narrow numeric columns before the analysis passes scan them; prices are
+    # only narrowed when float32 holds them exactly
+    for quotes_df in (prices_df, indices_df):
+        if _nonempty(quotes_df):
+            downcast_quotes(quotes_df)
 
     # Merge listed info with prices to get company names and sector info
-    if not prices_df.empty and not listed_info_df.empty:
+    if _nonempty(prices_df) and _nonempty(listed_info_df):
         logger.info("Enriching price data with company info...")
-        # Merge on Code
-        prices_df = prices_df.merge(
-            listed_info_df[
-                ["Code", "CompanyName", "Sector33Code", "Sector33CodeName"]
-            ].drop_duplicates("Code"),
-            on="Code",
-            how="left",
-        )
+        # Join against Code-indexed company info
+        prices_df = prices_df.join(index_company_info(listed_info_df), on="Code")
 
     # Fetch previous day's data to calculate change rates
-    prev_date = target_date - timedelta(days=1)
-    # Skip weekends
-    while prev_date.weekday() >= 5:
-        prev_date -= timedelta(days=1)
+    prev_date = target_date - timedelta(days=PREV_WEEKDAY_OFFSETS.get(target_date.weekday(), 1))
 
-    prev_prices_df = cache.get(f"daily_quotes_{prev_date.strftime('%Y-%m-%d')}")
-    if prev_prices_df is None and not dry_run:
-        prev_prices_df = fetcher.fetch_daily_quotes(prev_date)
+    prev_prices_df = cached_or_fetch(
+        cache,
+        f"daily_quotes_{prev_date.isoformat()}",
+        None if dry_run else lambda: fetcher.fetch_daily_quotes(prev_date),
+    )
 
     # Calculate change rate if we have previous day's data
-    if prev_prices_df is not None and not prev_prices_df.empty and not prices_df.empty:
+    if _nonempty(prev_prices_df) and _nonempty(prices_df):
         logger.info("Calculating change rates...")
-        prev_close = prev_prices_df[["Code", "Close"]].rename(
-            columns={"Close": "PrevClose"}
+        prices_df["PrevClose"] = prices_df["Code"].map(
+            prev_prices_df.set_index("Code")["Close"]
         )
-        prices_df = prices_df.merge(prev_close, on="Code", how="left")
-        prices_df["ChangeRate"] = (
-            (prices_df["Close"] - prices_df["PrevClose"]) / prices_df["PrevClose"] * 100
+        prices_df["ChangeRate"] = pct_change(
+            prices_df["Close"].to_numpy(dtype=np.float64),
+            prices_df["PrevClose"].to_numpy(dtype=np.float64),
         )
 
     # Fetch previous day's index data to calculate index changes
-    prev_indices_df = cache.get(f"indices_{prev_date.strftime('%Y-%m-%d')}")
-    if prev_indices_df is None and not dry_run:
-        prev_indices_df = fetcher.fetch_indices(prev_date)
+    prev_indices_df = cached_or_fetch(
+        cache,
+        f"indices_{prev_date.isoformat()}",
+        None if dry_run else lambda: fetcher.fetch_indices(prev_date),
+    )
 
     # Calculate change rate for indices
-    if (
-        prev_indices_df is not None
-        and not prev_indices_df.empty
-        and not indices_df.empty
-    ):
+    if _nonempty(prev_indices_df) and _nonempty(indices_df):
         logger.info("Calculating index change rates...")
-        prev_idx_close = prev_indices_df[["Code", "Close"]].rename(
-            columns={"Close": "PrevClose"}
-        )
-        indices_df = indices_df.merge(prev_idx_close, on="Code", how="left")
-        indices_df["Change"] = indices_df["Close"] - indices_df["PrevClose"]
-        indices_df["ChangeRate"] = (
-            indices_df["Change"] / indices_df["PrevClose"] * 100
+        indices_df["PrevClose"] = indices_df["Code"].map(
+            prev_indices_df.set_index("Code")["Close"]
         )
+        idx_close = indices_df["Close"].to_numpy(dtype=np.float64)
+        idx_prev_close = indices_df["PrevClose"].to_numpy(dtype=np.float64)
+        indices_df["Change"] = idx_close - idx_prev_close
+        indices_df["ChangeRate"] = pct_change(idx_close, idx_prev_close)
 
     # Fetch historical data for technical analysis
     # Note: J-Quants API doesn't support date range query without code parameter
@@ -216,35 +383,30 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     historical_df = None
     if not dry_run:
         logger.info("Fetching historical data for technical analysis...")
-        all_historical: list = []
-        # Fetch past 30 trading days (for 25-day MA calculation)
-        for days_ago in range(1, 35):
-            hist_date = target_date - timedelta(days=days_ago)
-            # Skip weekends
-            if hist_date.weekday() >= 5:
-                continue
-            hist_df = fetcher.fetch_daily_quotes(hist_date)
-            if not hist_df.empty:
-                all_historical.append(hist_df)
-            # Stop if we have enough data
-            if len(all_historical) >= 25:
-                break
+        # Past weekdays covering 25 trading days (for 25-day MA calculation)
+        candidate_dates = [target_date - timedelta(days=days_ago) for days_ago in range(1, 35)]
+        hist_dates = [d for d in candidate_dates if d.weekday() < 5]
+        # Fetch all candidate days concurrently, then keep the 25 most recent
+        hist_results = fetcher.fetch_daily_quotes_batch(hist_dates)
+        all_historical = [hist_results[d] for d in hist_dates if _nonempty(hist_results[d])][:25]
         if all_historical:
-            import pandas as pd_  # Local import to avoid circular dependency
-            historical_df = pd_.concat(all_historical, ignore_index=True)
+            # Narrow dtypes per day so the combined frame is built at the smaller size
+            for hist_df in all_historical:
+                downcast_quotes(hist_df)
+            historical_df = pd.concat(all_historical, ignore_index=True, sort=False)
             logger.info(f"Fetched {len(all_historical)} days of historical data")
     else:
         historical_df = cache.get("historical_prices")
 
     # Calculate ChangeRate for historical data (required for advance-decline ratio)
-    if historical_df is not None and not historical_df.empty:
+    if _nonempty(historical_df):
         historical_df = historical_df.sort_values(["Code", "Date"])
-        historical_df["PrevClose"] = historical_df.groupby("Code")["Close"].shift(1)
-        historical_df["ChangeRate"] = (
-            (historical_df["Close"] - historical_df["PrevClose"])
-            / historical_df["PrevClose"]
-            * 100
-        )
+        # Rows are sorted by Code, so the previous row is the previous day
+        # except at the first row of each code
+        hist_close = historical_df["Close"].to_numpy(dtype=np.float64)
+        prev_close = previous_in_group(historical_df["Code"].to_numpy(), hist_close)
+        historical_df["PrevClose"] = prev_close
+        historical_df["ChangeRate"] = pct_change(hist_close, prev_close)
         logger.info("Calculated ChangeRate for historical data")
 
     # Fetch supply/demand data
@@ -252,10 +414,10 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     margin_df = None
     short_selling_df = None
     if not dry_run:
-        logger.info("Fetching supply/demand data...")
-        investor_df = fetcher.fetch_trades_spec(target_date)
-        margin_df = fetcher.fetch_margin_interest(target_date)
-        short_selling_df = fetcher.fetch_short_selling(target_date)
+        # Already fetched together with the market data
+        investor_df = fetched["trades_spec"]
+        margin_df = fetched["margin_interest"]
+        short_selling_df = fetched["short_selling"]
     else:
         investor_df = cache.get(f"trades_spec_{date_str}")
         margin_df = cache.get(f"margin_interest_{date_str}")
@@ -267,7 +429,6 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     sector_analyzer = SectorAnalyzer()
     stock_analyzer = StockAnalyzer()
     technical_analyzer = TechnicalAnalyzer()
-    supply_demand_analyzer = SupplyDemandAnalyzer()
 
     # Market analysis
     market_overview = market_analyzer.analyze(date_str, prices_df, indices_df)
@@ -283,12 +444,22 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     # Technical analysis
     technical_indicators = technical_analyzer.analyze(date_str, prices_df, historical_df)
 
-    # Supply/Demand analysis (using fetched data)
-    supply_demand_result = supply_demand_analyzer.analyze(
-        date=date_str,
-        trading_df=investor_df,
-        margin_df=margin_df,
-    )
+    # Supply/Demand analysis (using fetched data); skipped when there is
+    # nothing to analyze, e.g. a dry run on a cold cache
+    if _nonempty(investor_df) or _nonempty(margin_df):
+        supply_demand_result = SupplyDemandAnalyzer().analyze(
+            date=date_str,
+            trading_df=investor_df,
+            margin_df=margin_df,
+        )
+    else:
+        supply_demand_result = SupplyDemandAnalysis(
+            date=date_str,
+            investor_trading=[],
+            margin_trading=None,
+            foreign_net_value=0.0,
+            individual_net_value=0.0,
+        )
 
     # Convert analysis results to report format
     logger.info("Generating report...")
@@ -335,8 +506,6 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     sector_analysis = SectorAnalysis(sectors=sector_data_list)
 
     # Build StockHighlights
-    from jquants_report.analysis.stocks import StockInfo
-
     def convert_stock_info(stock_info_list: list[StockInfo]) -> list[StockData]:
         def normalize_code(code: str) -> str:
             """Normalize stock code to 4 digits (remove trailing 0 if 5 digits)."""
@@ -368,37 +537,8 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
     )
 
     # Build TechnicalSummary
-    moving_averages = []
-    if technical_indicators.stocks_above_ma25_pct is not None:
-        moving_averages.append(
-            TechnicalIndicator(
-                name="25日線上回り銘柄比率",
-                value=technical_indicators.stocks_above_ma25_pct,
-                signal="買い" if technical_indicators.stocks_above_ma25_pct > 50 else "売り",
-            )
-        )
-    if technical_indicators.stocks_above_ma75_pct is not None:
-        moving_averages.append(
-            TechnicalIndicator(
-                name="75日線上回り銘柄比率",
-                value=technical_indicators.stocks_above_ma75_pct,
-                signal="買い" if technical_indicators.stocks_above_ma75_pct > 50 else "売り",
-            )
-        )
-
-    momentum_indicators = []
-    if technical_indicators.advance_decline_ratio_25d is not None:
-        momentum_indicators.append(
-            TechnicalIndicator(
-                name="騰落レシオ(25日)",
-                value=technical_indicators.advance_decline_ratio_25d,
-                signal="買われ過ぎ"
-                if technical_indicators.advance_decline_ratio_25d > 120
-                else "売られ過ぎ"
-                if technical_indicators.advance_decline_ratio_25d < 80
-                else "中立",
-            )
-        )
+    moving_averages = build_indicators(technical_indicators, MOVING_AVERAGE_SPECS)
+    momentum_indicators = build_indicators(technical_indicators, MOMENTUM_SPECS)
 
     technical_summary = TechnicalSummary(
         moving_averages=moving_averages,
@@ -416,12 +556,15 @@ def generate_report(target_date: date, dry_run: bool, output_dir: Path) -> Path:
 
     # Calculate short selling ratio from fetched data
     short_selling_ratio = 0.0
-    if short_selling_df is not None and not short_selling_df.empty:
-        # Average short selling ratio across all stocks
-        if "ShortSellingRatio" in short_selling_df.columns:
-            short_selling_ratio = float(short_selling_df["ShortSellingRatio"].mean())
-        elif "short_selling_ratio" in short_selling_df.columns:
-            short_selling_ratio = float(short_selling_df["short_selling_ratio"].mean())
+    if _nonempty(short_selling_df):
+        ratio_col = next(
+            (c for c in SHORT_SELLING_RATIO_COLUMNS if c in short_selling_df.columns), None
+        )
+        if ratio_col is not None:
+            # Average short selling ratio across all stocks, skipping missing values
+            ratios = short_selling_df[ratio_col].to_numpy(dtype=np.float64)
+            ratios = ratios[~np.isnan(ratios)]
+            short_selling_ratio = float(ratios.mean()) if ratios.size else float("nan")
 
     supply_demand = SupplyDemandSummary(
         margin_buying_balance=margin_buying,
@@ -472,24 +615,6 @@ def generate_weekly_report(week_end: date, dry_run: bool, output_dir: Path) -> P
     Returns:
         Path to the generated report file.
     """
-    import pandas as pd
-
-    from jquants_report.analysis.weekly import (
-        WeeklyEventsAnalyzer,
-        WeeklyInvestorAnalyzer,
-        WeeklyMarginAnalyzer,
-        WeeklyMarketAnalyzer,
-        WeeklySectorAnalyzer,
-        WeeklyStockAnalyzer,
-        WeeklyTechnicalAnalyzer,
-        WeeklyTopicsAnalyzer,
-        WeeklyTrendsAnalyzer,
-    )
-    from jquants_report.api import JQuantsClient
-    from jquants_report.data import CacheManager, DataFetcher
-    from jquants_report.data.weekly_aggregator import WeeklyDataAggregator
-    from jquants_report.report.weekly_generator import WeeklyReportGenerator
-
     logger = logging.getLogger(__name__)
     logger.info(f"Generating weekly report for week ending {week_end}")
 
@@ -516,73 +641,67 @@ def generate_weekly_report(week_end: date, dry_run: bool, output_dir: Path) -> P
     logger.info(f"Trading days: {len(trading_days)}")
 
     # Fetch listed info for company names
-    listed_info_df = cache.get("listed_info")
-    if listed_info_df is None and fetcher:
-        listed_info_df = fetcher.fetch_listed_info()
+    listed_info_df = cached_or_fetch(
+        cache, "listed_info", fetcher.fetch_listed_info if fetcher else None
+    )
 
     # Get previous week close for return calculations
     prev_week_quotes = None
     if prev_trading_days:
         prev_last_day = prev_trading_days[-1]
-        prev_week_quotes = cache.get(f"daily_quotes_{prev_last_day.strftime('%Y-%m-%d')}")
-        if prev_week_quotes is None and fetcher:
-            prev_week_quotes = fetcher.fetch_daily_quotes(prev_last_day)
+        prev_week_quotes = cached_or_fetch(
+            cache,
+            f"daily_quotes_{prev_last_day.isoformat()}",
+            (lambda: fetcher.fetch_daily_quotes(prev_last_day)) if fetcher else None,
+        )
 
     # Aggregate weekly stock data
     logger.info("Aggregating weekly stock data...")
     weekly_quotes = aggregator.aggregate_daily_quotes(trading_days, prev_week_quotes)
 
-    # Enrich with company info
-    if not weekly_quotes.empty and listed_info_df is not None and not listed_info_df.empty:
-        info_cols = ["Code", "CompanyName", "Sector33Code", "Sector33CodeName"]
-        available_cols = [c for c in info_cols if c in listed_info_df.columns]
-        if len(available_cols) > 1:
-            weekly_quotes = weekly_quotes.merge(
-                listed_info_df[available_cols].drop_duplicates("Code"),
-                on="Code",
-                how="left",
-            )
+    # Enrich with company info, indexed once for this and the previous week
+    company_info = index_company_info(listed_info_df) if _nonempty(listed_info_df) else None
+    if not weekly_quotes.empty and company_info is not None:
+        weekly_quotes = aggregator.attach_company_info(weekly_quotes, company_info)
 
     # Get previous week index close
     prev_week_indices = None
     if prev_trading_days:
         prev_last_day = prev_trading_days[-1]
-        prev_week_indices = cache.get(f"indices_{prev_last_day.strftime('%Y-%m-%d')}")
-        if prev_week_indices is None and fetcher:
-            prev_week_indices = fetcher.fetch_indices(prev_last_day)
+        prev_week_indices = cached_or_fetch(
+            cache,
+            f"indices_{prev_last_day.isoformat()}",
+            (lambda: fetcher.fetch_indices(prev_last_day)) if fetcher else None,
+        )
 
     # Aggregate weekly index data
     logger.info("Aggregating weekly index data...")
     weekly_indices = aggregator.aggregate_indices(trading_days, prev_week_indices)
 
     # Collect daily index data for daily changes
-    daily_indices_list: list[tuple[date, pd.DataFrame]] = []
-    for day in trading_days:
-        date_str = day.strftime("%Y-%m-%d")
-        idx_df = cache.get(f"indices_{date_str}")
-        if idx_df is None and fetcher:
-            idx_df = fetcher.fetch_indices(day)
-        if idx_df is not None and not idx_df.empty:
-            daily_indices_list.append((day, idx_df))
+    daily_indices: Mapping[date, pd.DataFrame | None]
+    if fetcher:
+        daily_indices = fetcher.fetch_indices_batch(trading_days)
+    else:
+        daily_indices = dict(
+            zip(trading_days, aggregator.load_cached_frames(trading_days, "indices_"), strict=True)
+        )
+    daily_indices_list: list[tuple[date, pd.DataFrame]] = [
+        (day, idx_df)
+        for day, idx_df in daily_indices.items()
+        if _nonempty(idx_df)
+    ]
 
     # Aggregate sector performance
-    logger.info("Analyzing sector performance...")
     sector_performance = aggregator.aggregate_sector_performance(weekly_quotes)
 
     # Previous week sector performance for comparison
     prev_week_sector_perf = None
     if prev_trading_days:
         prev_weekly_quotes = aggregator.aggregate_daily_quotes(prev_trading_days, None)
-        if not prev_weekly_quotes.empty and listed_info_df is not None:
-            info_cols = ["Code", "CompanyName", "Sector33Code", "Sector33CodeName"]
-            available_cols = [c for c in info_cols if c in listed_info_df.columns]
-            if len(available_cols) > 1:
-                prev_weekly_quotes = prev_weekly_quotes.merge(
-                    listed_info_df[available_cols].drop_duplicates("Code"),
-                    on="Code",
-                    how="left",
-                )
-            prev_week_sector_perf = aggregator.aggregate_sector_performance(prev_weekly_quotes)
+        if not prev_weekly_quotes.empty and company_info is not None:
+            prev_weekly_quotes = aggregator.attach_company_info(prev_weekly_quotes, company_info)
+        prev_week_sector_perf = aggregator.aggregate_sector_performance(prev_weekly_quotes)
 
     # Get investor trading data
     logger.info("Fetching investor trading data...")
@@ -654,12 +773,15 @@ def generate_weekly_report(week_end: date, dry_run: bool, output_dir: Path) -> P
 
     # Section 9: Medium-term Trends
     # Collect historical index data for trend analysis
-    historical_indices: list[tuple[date, pd.DataFrame]] = []
-    for weeks_ago in range(1, 14):
-        past_friday = week_end - timedelta(weeks=weeks_ago)
-        past_idx = cache.get(f"indices_{past_friday.strftime('%Y-%m-%d')}")
-        if past_idx is not None and not past_idx.empty:
-            historical_indices.append((past_friday, past_idx))
+    # (cache only, read in one parallel batch)
+    past_fridays = [week_end - timedelta(weeks=weeks_ago) for weeks_ago in range(1, 14)]
+    historical_indices: list[tuple[date, pd.DataFrame]] = [
+        (past_friday, past_idx)
+        for past_friday, past_idx in zip(
+            past_fridays, aggregator.load_cached_frames(past_fridays, "indices_"), strict=True
+        )
+        if _nonempty(past_idx)
+    ]
 
     # Historical sector performance
     historical_sector_perf: list[tuple[date, pd.DataFrame]] = []
@@ -721,7 +843,7 @@ def main() -> int:
             # Weekly report mode
             if args.week_end:
                 try:
-                    week_end = datetime.strptime(args.week_end, "%Y-%m-%d").date()
+                    week_end = parse_ymd(args.week_end)
                 except ValueError:
                     logger.error(f"Invalid week-end date format: {args.week_end}. Use YYYY-MM-DD.")
                     return 1
@@ -1,9 +1,70 @@
 """Data formatting utilities for report generation."""
 
+from collections.abc import Callable, Sequence
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
+# Number of distinct values remembered by each memoized number formatter.
+# Equal keys share a cache entry (0 and -0.0 included), so the memoized
+# formatters map every zero to 0 to give the same output whichever comes first.
+FORMAT_CACHE_SIZE = 8192
 
+# Prebuilt format methods for the common decimal places, so the format spec
+# is not rebuilt from an f-string on every call
+_GROUPED_FORMATS = tuple(f"{{:,.{d}f}}".format for d in range(4))
+_FIXED_FORMATS = tuple(f"{{:.{d}f}}".format for d in range(4))
+
+
+def _format_fixed(value: float, decimals: int, grouped: bool = False) -> str:
+    """Format a number with a fixed number of decimal places.
+
+    Args:
+        value: The number to format.
+        decimals: Number of decimal places.
+        grouped: Whether to add thousand separators.
+
+    Returns:
+        Formatted number string.
+    """
+    formats = _GROUPED_FORMATS if grouped else _FIXED_FORMATS
+    if 0 <= decimals < len(formats):
+        return formats[decimals](value)
+    if grouped:
+        return f"{value:,.{decimals}f}"
+    return f"{value:.{decimals}f}"
+
+
+# Larger units as (minimum value in 万, divisor from 万, format), largest first
+VOLUME_UNITS = ((10000, 10000, "{:.1f}億株".format),)
+AMOUNT_UNITS = (
+    (100000000, 100000000, "{:.1f}兆円".format),
+    (10000, 10000, "{:.1f}億円".format),
+)
+
+
+def _format_in_units(
+    man: float,
+    units: tuple[tuple[int, int, Callable[[float], str]], ...],
+    default: Callable[[float], str],
+) -> str:
+    """Format a value given in 万 with the largest unit it reaches.
+
+    Args:
+        man: Value in units of 10,000.
+        units: Larger units, largest first.
+        default: Format used when no larger unit applies.
+
+    Returns:
+        Formatted string with unit.
+    """
+    for threshold, divisor, fmt in units:
+        if man >= threshold:
+            return fmt(man / divisor)
+    return default(man)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_number(value: float | int | None, decimals: int = 0) -> str:
     """Format number with thousand separators.
 
@@ -24,13 +85,16 @@ def format_number(value: float | int | None, decimals: int = 0) -> str:
     """
     if value is None:
         return "N/A"
+    if value == 0:
+        value = 0
 
     if decimals == 0:
         return f"{int(value):,}"
     else:
-        return f"{value:,.{decimals}f}"
+        return _format_fixed(value, decimals, grouped=True)
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_percentage(value: float | None, decimals: int = 2) -> str:
     """Format percentage with sign.
 
@@ -51,11 +115,14 @@ def format_percentage(value: float | None, decimals: int = 2) -> str:
     """
     if value is None:
         return "N/A"
+    if value == 0:
+        value = 0
 
     sign = "+" if value >= 0 else ""
-    return f"{sign}{value:.{decimals}f}%"
+    return sign + _format_fixed(value, decimals) + "%"
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_change(value: float | None, decimals: int = 2) -> str:
     """Format change value with sign.
 
@@ -76,11 +143,43 @@ def format_change(value: float | None, decimals: int = 2) -> str:
     """
     if value is None:
         return "N/A"
+    if value == 0:
+        value = 0
+
+    sign = "+" if value >= 0 else ""
+    return sign + _format_fixed(value, decimals)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def format_change_with_trend(value: float | None, decimals: int = 2) -> str:
+    """Format change value with sign followed by its trend arrow.
+
+    Args:
+        value: The change value.
+        decimals: Number of decimal places.
+
+    Returns:
+        Same string as format_change and format_trend_indicator joined by a space.
+
+    Examples:
+        >>> format_change_with_trend(123.45)
+        '+123.45 ↑'
+        >>> format_change_with_trend(-67.89, 1)
+        '-67.9 ↓'
+        >>> format_change_with_trend(None)
+        'N/A -'
+    """
+    if value is None:
+        return "N/A -"
+    if value == 0:
+        value = 0
 
     sign = "+" if value >= 0 else ""
-    return f"{sign}{value:.{decimals}f}"
+    arrow = TREND_INDICATORS[(value > 0) + 2 * (value < 0)]
+    return f"{sign}{_format_fixed(value, decimals)} {arrow}"
 
 
+@lru_cache(maxsize=128)
 def format_date(value: date) -> str:
     """Format date in Japanese style.
 
@@ -95,9 +194,11 @@ def format_date(value: date) -> str:
         >>> format_date(date(2024, 1, 15))
         '2024年01月15日'
     """
-    return value.strftime("%Y年%m月%d日")
+    # Integer formatting skips strftime's locale-aware path
+    return f"{value.year}年{value.month:02d}月{value.day:02d}日"
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_volume(value: float | int | None) -> str:
     """Format trading volume in human-readable format.
 
@@ -117,17 +218,14 @@ def format_volume(value: float | int | None) -> str:
     """
     if value is None:
         return "N/A"
+    if value == 0:
+        value = 0
 
     # Convert to 万株 (10,000 shares)
-    man = value / 10000
-    if man >= 10000:
-        # Convert to 億株 (100,000,000 shares)
-        oku = man / 10000
-        return f"{oku:.1f}億株"
-    else:
-        return f"{man:.1f}万株"
+    return _format_in_units(value / 10000, VOLUME_UNITS, "{:.1f}万株".format)
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_amount(value: float | int | None) -> str:
     """Format monetary amount in human-readable format.
 
@@ -147,19 +245,92 @@ def format_amount(value: float | int | None) -> str:
     """
     if value is None:
         return "N/A"
+    if value == 0:
+        value = 0
 
     # Convert to 万円 (10,000 yen)
-    man = value / 10000
-    if man >= 100000000:
-        # Convert to 兆円 (1,000,000,000,000 yen)
-        cho = man / 100000000
-        return f"{cho:.1f}兆円"
-    elif man >= 10000:
-        # Convert to 億円 (100,000,000 yen)
-        oku = man / 10000
-        return f"{oku:.1f}億円"
-    else:
-        return f"{man:,.1f}万円"
+    return _format_in_units(value / 10000, AMOUNT_UNITS, "{:,.1f}万円".format)
+
+
+def format_oku(value: float | None) -> str:
+    """Format a yen amount as a whole number of 億 (100 million).
+
+    Args:
+        value: The amount value in yen.
+
+    Returns:
+        Amount in 億 with thousand separators, without the unit.
+
+    Examples:
+        >>> format_oku(123456789012)
+        '1,235'
+        >>> format_oku(None)
+        'N/A'
+    """
+    if value is None:
+        return "N/A"
+    return _format_fixed(value / 100_000_000, 0, grouped=True)
+
+
+def format_oku_signed(value: float | None) -> str:
+    """Format a yen amount change as a signed whole number of 億.
+
+    Args:
+        value: The amount change in yen.
+
+    Returns:
+        Signed amount in 億 with thousand separators, without the unit.
+
+    Examples:
+        >>> format_oku_signed(-250000000)
+        '-2'
+        >>> format_oku_signed(None)
+        'N/A'
+    """
+    if value is None:
+        return "N/A"
+    return f"{value / 100_000_000:+,.0f}"
+
+
+def format_hyakuman(value: float | None) -> str:
+    """Format a yen amount as a whole number of 百万 (1 million).
+
+    Args:
+        value: The amount value in yen.
+
+    Returns:
+        Amount in 百万 with thousand separators, without the unit.
+
+    Examples:
+        >>> format_hyakuman(1234567890)
+        '1,235'
+        >>> format_hyakuman(None)
+        'N/A'
+    """
+    if value is None:
+        return "N/A"
+    return _format_fixed(value / 1_000_000, 0, grouped=True)
+
+
+def truncate_text(value: str, length: int = 12) -> str:
+    """Truncate text to a number of characters, marking the cut with "...".
+
+    Args:
+        value: The text to truncate.
+        length: Maximum number of characters kept.
+
+    Returns:
+        The text itself if it fits, else its first length characters plus "...".
+
+    Examples:
+        >>> truncate_text("トヨタ自動車", 4)
+        'トヨタ自...'
+        >>> truncate_text("極洋", 4)
+        '極洋'
+    """
+    if len(value) <= length:
+        return value
+    return value[:length] + "..."
 
 
 def format_table_row(values: list[Any], widths: list[int] | None = None) -> str:
@@ -178,12 +349,15 @@ def format_table_row(values: list[Any], widths: list[int] | None = None) -> str:
         >>> format_table_row(['1234', 'Company', '+5.2%'], [6, 20, 8])
         '| 1234   | Company              | +5.2%    |'
     """
+    if not values:
+        return "||"
+
     if widths:
-        cells = [f" {str(val):<{width}} " for val, width in zip(values, widths)]
+        cells = [str(val).ljust(width) for val, width in zip(values, widths, strict=False)]
     else:
-        cells = [f" {str(val)} " for val in values]
+        cells = list(map(str, values))
 
-    return "|" + "|".join(cells) + "|"
+    return "| " + " | ".join(cells) + " |"
 
 
 def format_table_separator(widths: list[int]) -> str:
@@ -204,16 +378,16 @@ def format_table_separator(widths: list[int]) -> str:
 
 
 def create_markdown_table(
-    headers: list[str],
-    rows: list[list[Any]],
-    alignments: list[str] | None = None,
+    headers: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    alignments: Sequence[str] | None = None,
 ) -> str:
     """Create a Markdown table from headers and rows.
 
     Args:
-        headers: List of column headers.
-        rows: List of rows, each row is a list of cell values.
-        alignments: Optional list of alignments ('left', 'center', 'right').
+        headers: Sequence of column headers.
+        rows: Sequence of rows, each row is a sequence of cell values.
+        alignments: Optional sequence of alignments ('left', 'center', 'right').
 
     Returns:
         Complete Markdown table string.
@@ -230,41 +404,48 @@ def create_markdown_table(
     if not rows:
         return ""
 
-    # Convert all cells to strings
+    # Stringify cells and track column widths in the same pass
     str_headers = [str(h) for h in headers]
-    str_rows = [[str(cell) for cell in row] for row in rows]
-
-    # Calculate column widths
     widths = [len(h) for h in str_headers]
-    for row in str_rows:
+    str_rows = []
+    for row in rows:
+        str_row = []
         for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(cell))
-
-    # Build table
-    lines = []
+            text = cell if type(cell) is str else str(cell)
+            if len(text) > widths[i]:
+                widths[i] = len(text)
+            str_row.append(text)
+        str_rows.append(str_row)
 
-    # Header row
-    lines.append(format_table_row(str_headers, widths))
+    def render_row(cells: Sequence[str]) -> str:
+        return "| " + " | ".join(c.ljust(w) for c, w in zip(cells, widths, strict=False)) + " |"
 
     # Separator row
     if alignments:
         sep_cells = []
-        for i, (width, align) in enumerate(zip(widths, alignments)):
+        for width, align in zip(widths, alignments, strict=False):
             if align == "center":
                 sep_cells.append(f":{'-' * width}:")
             elif align == "right":
                 sep_cells.append(f"{'-' * width}:")
             else:  # left
                 sep_cells.append(f":{'-' * width}")
-        lines.append("|" + "|".join(sep_cells) + "|")
+        separator = "|" + "|".join(sep_cells) + "|"
     else:
-        lines.append(format_table_separator(widths))
+        separator = "|" + "|".join("-" * (width + 2) for width in widths) + "|"
 
-    # Data rows
-    for row in str_rows:
-        lines.append(format_table_row(row, widths))
+    # Join header, separator and data rows in a single pass
+    return "\n".join([render_row(str_headers), separator, *map(render_row, str_rows)])
 
-    return "\n".join(lines)
+
+# Indexed by (value > 0) + 2 * (value < 0)
+TREND_INDICATORS = ("→", "↑", "↓")
+
+# Indexed by weak/neutral/strong rank
+STRENGTH_INDICATORS = ("弱い", "中立", "強い")
+
+# Default (low, high) strength thresholds; a tuple so it can key the cache
+DEFAULT_STRENGTH_THRESHOLDS = (30, 70)
 
 
 def format_trend_indicator(value: float | None) -> str:
@@ -288,23 +469,19 @@ def format_trend_indicator(value: float | None) -> str:
     """
     if value is None:
         return "-"
-
-    if value > 0:
-        return "↑"
-    elif value < 0:
-        return "↓"
-    else:
-        return "→"
+    return TREND_INDICATORS[(value > 0) + 2 * (value < 0)]
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_strength_indicator(
-    value: float | None, thresholds: tuple[float, float] = (30, 70)
+    value: float | None, thresholds: tuple[float, float] = DEFAULT_STRENGTH_THRESHOLDS
 ) -> str:
     """Format strength indicator based on thresholds.
 
     Args:
         value: The strength value (typically 0-100).
-        thresholds: Tuple of (low, high) threshold values.
+        thresholds: Tuple of (low, high) threshold values. Must be a tuple,
+            as results are memoized per (value, thresholds).
 
     Returns:
         Strength indicator string (強い/弱い/中立).
@@ -323,9 +500,5 @@ def format_strength_indicator(
         return "N/A"
 
     low, high = thresholds
-    if value >= high:
-        return "強い"
-    elif value <= low:
-        return "弱い"
-    else:
-        return "中立"
+    # NaN compares False both ways and stays neutral; high wins on overlap
+    return STRENGTH_INDICATORS[max(1 - (value <= low), 2 * (value >= high))]
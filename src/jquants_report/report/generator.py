@@ -1,26 +1,81 @@
 """Report generation module."""
 
 import logging
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import date
+from operator import attrgetter
 from pathlib import Path
 
 from jquants_report.report.formatter import (
     create_markdown_table,
     format_amount,
-    format_change,
+    format_change_with_trend,
     format_date,
     format_number,
     format_percentage,
     format_trend_indicator,
     format_volume,
 )
-from jquants_report.report.templates import render_main_template
+from jquants_report.report.templates import (
+    open_report_file,
+    render_main_template,
+    stream_main_template,
+)
 
 logger = logging.getLogger(__name__)
 
+# Main index comment by change rate: MAIN_INDEX_COMMENTS[i] applies when
+# change_pct is above exactly i of MAIN_INDEX_THRESHOLDS
+MAIN_INDEX_THRESHOLDS = (-2.0, -1.0, 0.0, 1.0, 2.0)
+MAIN_INDEX_COMMENTS = (
+    "{name}は大幅安となり、{pct:.2f}%下落しました",
+    "{name}は軟調に推移し、{pct:.2f}%下落しました",
+    "{name}は小幅安で、{pct:.2f}%下落しました",
+    "{name}は小幅高で、{pct:.2f}%上昇しました",
+    "{name}は堅調に推移し、{pct:.2f}%上昇しました",
+    "{name}は大幅高となり、{pct:.2f}%上昇しました",
+)
+
 
-@dataclass
+# Horizon named in the moving average comment, by period found in the indicator name
+MA_COMMENT_HORIZONS = {"25日": "短期的", "75日": "中期的"}
+
+# Moving average comment indexed by (value > 70) + 2 * (value < 30)
+MA_BREADTH_COMMENTS = (
+    None,
+    "{period}移動平均線を上回る銘柄が{value:.1f}%と多く、{horizon}に強い相場です",
+    "{period}移動平均線を上回る銘柄が{value:.1f}%と少なく、{horizon}に弱い相場です",
+)
+
+# Sector tables kept by ReportGenerator; the oldest entry is evicted when full
+TABLE_CACHE_SIZE = 64
+
+# Sector table cache key: table kind and the (name, value) pairs it is built from
+SectorTableKey = tuple[str, tuple[tuple[str, float], ...]]
+
+# Sector sort keys; attrgetter reads the field without a Python-level call per item
+BY_CHANGE_PCT = attrgetter("change_pct")
+BY_TURNOVER = attrgetter("turnover")
+
+# Column headers and alignments of each report table
+MARKET_OVERVIEW_HEADERS = ("指数", "終値", "前日比", "騰落率")
+MARKET_OVERVIEW_ALIGNMENTS = ("left", "right", "right", "right")
+MARKET_BREADTH_HEADERS = ("項目", "銘柄数", "比率")
+MARKET_BREADTH_ALIGNMENTS = ("left", "right", "right")
+SECTOR_PERFORMANCE_HEADERS = ("セクター", "騰落率", "トレンド")
+SECTOR_PERFORMANCE_ALIGNMENTS = ("left", "right", "center")
+SECTOR_TURNOVER_HEADERS = ("セクター", "売買代金")
+SECTOR_TURNOVER_ALIGNMENTS = ("left", "right")
+STOCK_TABLE_HEADERS = ("コード", "銘柄名", "終値", "前日比", "騰落率", "出来高", "売買代金")
+STOCK_TABLE_ALIGNMENTS = ("left", "left", "right", "right", "right", "right", "right")
+MARGIN_BALANCE_HEADERS = ("項目", "残高", "比率")
+MARGIN_BALANCE_ALIGNMENTS = ("left", "right", "right")
+TECHNICAL_INDICATOR_HEADERS = ("指標", "値", "シグナル")
+TECHNICAL_INDICATOR_ALIGNMENTS = ("left", "right", "left")
+
+
+@dataclass(slots=True, frozen=True)
 class IndexData:
     """Index data."""
 
@@ -45,6 +100,36 @@ class MarketSummary:
 
 
 @dataclass
+class MarketStats:
+    """Figures derived from a market summary, computed once per report."""
+
+    total: int
+    adv_ratio: float
+    dec_ratio: float
+    main_index: IndexData | None
+    turnover_trillion: float
+
+    @classmethod
+    def from_summary(cls, summary: MarketSummary) -> "MarketStats":
+        """Derive market figures from a market summary.
+
+        Args:
+            summary: Market summary data.
+
+        Returns:
+            MarketStats with ratios of zero when there are no stocks.
+        """
+        total = summary.advancing + summary.declining + summary.unchanged
+        return cls(
+            total=total,
+            adv_ratio=(summary.advancing / total) if total > 0 else 0,
+            dec_ratio=(summary.declining / total) if total > 0 else 0,
+            main_index=summary.indices[0] if summary.indices else None,
+            turnover_trillion=summary.total_turnover / 1_000_000_000_000,
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class SectorData:
     """Sector data."""
 
@@ -61,7 +146,7 @@ class SectorAnalysis:
     comment: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StockData:
     """Stock data."""
 
@@ -84,7 +169,7 @@ class StockHighlights:
     top_turnover: list[StockData]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TechnicalIndicator:
     """Technical indicator data."""
 
@@ -124,6 +209,9 @@ class ReportGenerator:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Sector tables keyed by the sector fields they are built from, so
+        # repeated snapshots in batch runs are not rendered again
+        self._table_cache: dict[SectorTableKey, str] = {}
 
     def generate(
         self,
@@ -149,71 +237,129 @@ class ReportGenerator:
         """
         logger.info(f"Generating report for {target_date}")
 
-        # Format each section
-        report_date = format_date(target_date)
-        market_overview = self._format_market_overview(market_summary)
-        market_breadth = self._format_market_breadth(market_summary)
-        market_comment = market_summary.comment or self._generate_market_comment(market_summary)
-
-        sector_performance = self._format_sector_performance(sector_analysis)
-        sector_turnover = self._format_sector_turnover(sector_analysis)
-        sector_comment = sector_analysis.comment or self._generate_sector_comment(sector_analysis)
-
-        top_gainers = self._format_stock_table(stock_highlights.top_gainers)
-        top_losers = self._format_stock_table(stock_highlights.top_losers)
-        top_volume = self._format_stock_table(stock_highlights.top_volume)
-        top_turnover = self._format_stock_table(stock_highlights.top_turnover)
-
-        margin_balance = self._format_margin_balance(supply_demand)
-        short_selling = self._format_short_selling(supply_demand)
-        supply_demand_comment = supply_demand.comment or self._generate_supply_demand_comment(
-            supply_demand
-        )
-
-        moving_averages = self._format_technical_indicators(technical_summary.moving_averages)
-        momentum_indicators = self._format_technical_indicators(
-            technical_summary.momentum_indicators
-        )
-        technical_comment = technical_summary.comment or self._generate_technical_comment(
-            technical_summary
-        )
-
-        next_day_focus = self._generate_next_day_focus(
-            market_summary, sector_analysis, technical_summary
-        )
-
-        # Render template
-        report_content = render_main_template(
-            report_date=report_date,
-            market_overview=market_overview,
-            market_breadth=market_breadth,
-            market_comment=market_comment,
-            sector_performance=sector_performance,
-            sector_turnover=sector_turnover,
-            sector_comment=sector_comment,
-            top_gainers=top_gainers,
-            top_losers=top_losers,
-            top_volume=top_volume,
-            top_turnover=top_turnover,
-            margin_balance=margin_balance,
-            short_selling=short_selling,
-            supply_demand_comment=supply_demand_comment,
-            moving_averages=moving_averages,
-            momentum_indicators=momentum_indicators,
-            technical_comment=technical_comment,
-            next_day_focus=next_day_focus,
+        context = self._build_context(
+            target_date,
+            market_summary,
+            sector_analysis,
+            stock_highlights,
+            technical_summary,
+            supply_demand,
         )
 
         # Save to file
         filename = f"market_report_{target_date.strftime('%Y%m%d')}.md"
         report_path = self.output_dir / filename
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        # Render template straight into the file
+        with open_report_file(report_path) as f:
+            stream_main_template(f, **context)
 
         logger.info(f"Report saved to {report_path}")
         return report_path
 
+    def render(
+        self,
+        target_date: date,
+        market_summary: MarketSummary,
+        sector_analysis: SectorAnalysis,
+        stock_highlights: StockHighlights,
+        technical_summary: TechnicalSummary,
+        supply_demand: SupplyDemandSummary,
+    ) -> str:
+        """Render market report without writing it to disk.
+
+        Args:
+            target_date: The target date for the report.
+            market_summary: Market summary data.
+            sector_analysis: Sector analysis data.
+            stock_highlights: Stock highlights data.
+            technical_summary: Technical summary data.
+            supply_demand: Supply and demand data.
+
+        Returns:
+            Report content as Markdown, identical to what ``generate`` writes.
+        """
+        context = self._build_context(
+            target_date,
+            market_summary,
+            sector_analysis,
+            stock_highlights,
+            technical_summary,
+            supply_demand,
+        )
+        return render_main_template(**context)
+
+    def _build_context(
+        self,
+        target_date: date,
+        market_summary: MarketSummary,
+        sector_analysis: SectorAnalysis,
+        stock_highlights: StockHighlights,
+        technical_summary: TechnicalSummary,
+        supply_demand: SupplyDemandSummary,
+    ) -> dict[str, str]:
+        """Format every section of the main report template.
+
+        Args:
+            target_date: The target date for the report.
+            market_summary: Market summary data.
+            sector_analysis: Sector analysis data.
+            stock_highlights: Stock highlights data.
+            technical_summary: Technical summary data.
+            supply_demand: Supply and demand data.
+
+        Returns:
+            Template variables keyed by name.
+        """
+        # Sort sectors once for every section that needs an ordering
+        sectors_by_change = sorted(sector_analysis.sectors, key=BY_CHANGE_PCT, reverse=True)
+        sectors_by_turnover = sorted(sector_analysis.sectors, key=BY_TURNOVER, reverse=True)
+
+        market_stats = MarketStats.from_summary(market_summary)
+
+        return {
+            "report_date": format_date(target_date),
+            "market_overview": self._format_market_overview(market_summary),
+            "market_breadth": self._format_market_breadth(market_summary, market_stats),
+            "market_comment": (
+                market_summary.comment
+                or self._generate_market_comment(market_summary, market_stats)
+            ),
+            "sector_performance": self._format_sector_performance(
+                sector_analysis, sectors_by_change
+            ),
+            "sector_turnover": self._format_sector_turnover(sector_analysis, sectors_by_turnover),
+            "sector_comment": (
+                sector_analysis.comment
+                or self._generate_sector_comment(sector_analysis, sectors_by_change)
+            ),
+            "top_gainers": self._format_stock_table(stock_highlights.top_gainers),
+            "top_losers": self._format_stock_table(stock_highlights.top_losers),
+            "top_volume": self._format_stock_table(stock_highlights.top_volume),
+            "top_turnover": self._format_stock_table(stock_highlights.top_turnover),
+            "margin_balance": self._format_margin_balance(supply_demand),
+            "short_selling": self._format_short_selling(supply_demand),
+            "supply_demand_comment": (
+                supply_demand.comment or self._generate_supply_demand_comment(supply_demand)
+            ),
+            "moving_averages": self._format_technical_indicators(
+                technical_summary.moving_averages
+            ),
+            "momentum_indicators": self._format_technical_indicators(
+                technical_summary.momentum_indicators
+            ),
+            "technical_comment": (
+                technical_summary.comment or self._generate_technical_comment(technical_summary)
+            ),
+            "next_day_focus": self._generate_next_day_focus(
+                market_summary,
+                sector_analysis,
+                technical_summary,
+                sectors_by_change,
+                market_stats,
+            ),
+        }
+
     def _format_market_overview(self, summary: MarketSummary) -> str:
         """Format market overview section.
 
@@ -223,7 +369,6 @@ class ReportGenerator:
         Returns:
             Formatted market overview string.
         """
-        headers = ["指数", "終値", "前日比", "騰落率"]
         rows = []
 
         for idx in summary.indices:
@@ -231,56 +376,76 @@ class ReportGenerator:
                 [
                     idx.name,
                     format_number(idx.close, 2),
-                    format_change(idx.change, 2) + " " + format_trend_indicator(idx.change),
+                    format_change_with_trend(idx.change, 2),
                     format_percentage(idx.change_pct, 2),
                 ]
             )
 
         return create_markdown_table(
-            headers, rows, alignments=["left", "right", "right", "right"]
+            MARKET_OVERVIEW_HEADERS, rows, alignments=MARKET_OVERVIEW_ALIGNMENTS
         )
 
-    def _format_market_breadth(self, summary: MarketSummary) -> str:
+    def _format_market_breadth(
+        self, summary: MarketSummary, stats: MarketStats | None = None
+    ) -> str:
         """Format market breadth section.
 
         Args:
             summary: Market summary data.
+            stats: Figures derived from the summary. Derived here if not given.
 
         Returns:
             Formatted market breadth string.
         """
-        total = summary.advancing + summary.declining + summary.unchanged
-        adv_pct = (summary.advancing / total * 100) if total > 0 else 0
-        dec_pct = (summary.declining / total * 100) if total > 0 else 0
+        if stats is None:
+            stats = MarketStats.from_summary(summary)
+        adv_pct = stats.adv_ratio * 100
+        dec_pct = stats.dec_ratio * 100
 
-        headers = ["項目", "銘柄数", "比率"]
         rows = [
             ["値上がり", format_number(summary.advancing), f"{adv_pct:.1f}%"],
             ["値下がり", format_number(summary.declining), f"{dec_pct:.1f}%"],
             ["変わらず", format_number(summary.unchanged), "-"],
         ]
 
-        table = create_markdown_table(headers, rows, alignments=["left", "right", "right"])
-
-        # Add summary statistics
-        summary_text = f"\n\n- **総売買代金**: {format_amount(summary.total_turnover)}\n"
-        summary_text += f"- **総出来高**: {format_volume(summary.total_volume)}"
+        table = create_markdown_table(
+            MARKET_BREADTH_HEADERS, rows, alignments=MARKET_BREADTH_ALIGNMENTS
+        )
 
-        return table + summary_text
+        # Add summary statistics below the table
+        return "\n".join(
+            [
+                table,
+                "",
+                f"- **総売買代金**: {format_amount(summary.total_turnover)}",
+                f"- **総出来高**: {format_volume(summary.total_volume)}",
+            ]
+        )
 
-    def _format_sector_performance(self, analysis: SectorAnalysis) -> str:
+    def _format_sector_performance(
+        self, analysis: SectorAnalysis, sorted_sectors: list[SectorData] | None = None
+    ) -> str:
         """Format sector performance table.
 
         Args:
             analysis: Sector analysis data.
+            sorted_sectors: Sectors already sorted by change percentage
+                descending. Sorted here if not given.
 
         Returns:
             Formatted sector performance table.
         """
-        # Sort by change percentage descending
-        sorted_sectors = sorted(analysis.sectors, key=lambda s: s.change_pct, reverse=True)
+        key: SectorTableKey = (
+            "performance",
+            tuple((s.name, s.change_pct) for s in analysis.sectors),
+        )
+        cached = self._table_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if sorted_sectors is None:
+            sorted_sectors = sorted(analysis.sectors, key=BY_CHANGE_PCT, reverse=True)
 
-        headers = ["セクター", "騰落率", "トレンド"]
         rows = []
 
         for sector in sorted_sectors:
@@ -292,27 +457,54 @@ class ReportGenerator:
                 ]
             )
 
-        return create_markdown_table(headers, rows, alignments=["left", "right", "center"])
+        table = create_markdown_table(
+            SECTOR_PERFORMANCE_HEADERS, rows, alignments=SECTOR_PERFORMANCE_ALIGNMENTS
+        )
+        self._cache_table(key, table)
+        return table
 
-    def _format_sector_turnover(self, analysis: SectorAnalysis) -> str:
+    def _format_sector_turnover(
+        self, analysis: SectorAnalysis, sorted_sectors: list[SectorData] | None = None
+    ) -> str:
         """Format sector turnover table.
 
         Args:
             analysis: Sector analysis data.
+            sorted_sectors: Sectors already sorted by turnover descending.
+                Sorted here if not given.
 
         Returns:
             Formatted sector turnover table.
         """
-        # Sort by turnover descending
-        sorted_sectors = sorted(analysis.sectors, key=lambda s: s.turnover, reverse=True)
+        key: SectorTableKey = ("turnover", tuple((s.name, s.turnover) for s in analysis.sectors))
+        cached = self._table_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if sorted_sectors is None:
+            sorted_sectors = sorted(analysis.sectors, key=BY_TURNOVER, reverse=True)
 
-        headers = ["セクター", "売買代金"]
         rows = []
 
         for sector in sorted_sectors[:10]:  # Top 10
             rows.append([sector.name, format_amount(sector.turnover)])
 
-        return create_markdown_table(headers, rows, alignments=["left", "right"])
+        table = create_markdown_table(
+            SECTOR_TURNOVER_HEADERS, rows, alignments=SECTOR_TURNOVER_ALIGNMENTS
+        )
+        self._cache_table(key, table)
+        return table
+
+    def _cache_table(self, key: SectorTableKey, table: str) -> None:
+        """Store a rendered sector table, evicting the oldest when full.
+
+        Args:
+            key: Cache key built from the table kind and its sector fields.
+            table: Rendered Markdown table.
+        """
+        if len(self._table_cache) >= TABLE_CACHE_SIZE:
+            del self._table_cache[next(iter(self._table_cache))]
+        self._table_cache[key] = table
 
     def _format_stock_table(self, stocks: list[StockData]) -> str:
         """Format stock table.
@@ -326,27 +518,19 @@ class ReportGenerator:
         if not stocks:
             return "データがありません。"
 
-        headers = ["コード", "銘柄名", "終値", "前日比", "騰落率", "出来高", "売買代金"]
-        rows = []
-
-        for stock in stocks:
-            rows.append(
-                [
-                    stock.code,
-                    stock.name,
-                    format_number(stock.close, 0),
-                    format_change(stock.change, 0) + " " + format_trend_indicator(stock.change),
-                    format_percentage(stock.change_pct, 2),
-                    format_volume(stock.volume),
-                    format_amount(stock.turnover),
-                ]
-            )
-
-        return create_markdown_table(
-            headers,
-            rows,
-            alignments=["left", "left", "right", "right", "right", "right", "right"],
+        # Format column by column, then stitch the columns into rows
+        columns = (
+            [stock.code for stock in stocks],
+            [stock.name for stock in stocks],
+            [format_number(stock.close, 0) for stock in stocks],
+            [format_change_with_trend(stock.change, 0) for stock in stocks],
+            [format_percentage(stock.change_pct, 2) for stock in stocks],
+            [format_volume(stock.volume) for stock in stocks],
+            [format_amount(stock.turnover) for stock in stocks],
         )
+        rows = list(zip(*columns, strict=True))
+
+        return create_markdown_table(STOCK_TABLE_HEADERS, rows, alignments=STOCK_TABLE_ALIGNMENTS)
 
     def _format_margin_balance(self, supply_demand: SupplyDemandSummary) -> str:
         """Format margin balance section.
@@ -357,7 +541,6 @@ class ReportGenerator:
         Returns:
             Formatted margin balance string.
         """
-        headers = ["項目", "残高", "比率"]
         rows = [
             [
                 "信用買い残",
@@ -367,7 +550,9 @@ class ReportGenerator:
             ["信用売り残", format_amount(supply_demand.margin_selling_balance), "-"],
         ]
 
-        return create_markdown_table(headers, rows, alignments=["left", "right", "right"])
+        return create_markdown_table(
+            MARGIN_BALANCE_HEADERS, rows, alignments=MARGIN_BALANCE_ALIGNMENTS
+        )
 
     def _format_short_selling(self, supply_demand: SupplyDemandSummary) -> str:
         """Format short selling section.
@@ -392,19 +577,22 @@ class ReportGenerator:
         if not indicators:
             return "データがありません。"
 
-        headers = ["指標", "値", "シグナル"]
         rows = []
 
         for ind in indicators:
             rows.append([ind.name, format_number(ind.value, 2), ind.signal])
 
-        return create_markdown_table(headers, rows, alignments=["left", "right", "left"])
+        return create_markdown_table(
+            TECHNICAL_INDICATOR_HEADERS, rows, alignments=TECHNICAL_INDICATOR_ALIGNMENTS
+        )
 
     def _generate_next_day_focus(
         self,
         market_summary: MarketSummary,
         sector_analysis: SectorAnalysis,
         technical_summary: TechnicalSummary,
+        sorted_sectors: list[SectorData] | None = None,
+        stats: MarketStats | None = None,
     ) -> str:
         """Generate next day focus points.
 
@@ -412,15 +600,21 @@ class ReportGenerator:
             market_summary: Market summary data.
             sector_analysis: Sector analysis data.
             technical_summary: Technical summary data.
+            sorted_sectors: Sectors already sorted by change percentage
+                descending, if available.
+            stats: Figures derived from the market summary. Derived here if
+                not given.
 
         Returns:
             Next day focus points text.
         """
+        if stats is None:
+            stats = MarketStats.from_summary(market_summary)
         focus_points = []
 
         # Market trend
-        if market_summary.indices:
-            main_index = market_summary.indices[0]
+        main_index = stats.main_index
+        if main_index is not None:
             if main_index.change_pct > 1.0:
                 focus_points.append("- 主要指数が大幅高となった流れを継続できるか注目")
             elif main_index.change_pct < -1.0:
@@ -430,15 +624,16 @@ class ReportGenerator:
 
         # Sector focus
         if sector_analysis.sectors:
-            top_sector = max(sector_analysis.sectors, key=lambda s: s.change_pct)
+            if sorted_sectors is not None:
+                top_sector = sorted_sectors[0]
+            else:
+                top_sector = max(sector_analysis.sectors, key=BY_CHANGE_PCT)
             focus_points.append(f"- {top_sector.name}セクターの続伸に注目")
 
         # Market breadth
-        total = market_summary.advancing + market_summary.declining + market_summary.unchanged
-        adv_ratio = (market_summary.advancing / total) if total > 0 else 0
-        if adv_ratio > 0.7:
+        if stats.adv_ratio > 0.7:
             focus_points.append("- 市場全体の強さが継続するか注目")
-        elif adv_ratio < 0.3:
+        elif stats.adv_ratio < 0.3:
             focus_points.append("- 市場センチメントの改善に注目")
 
         # Default point
@@ -447,68 +642,71 @@ class ReportGenerator:
 
         return "\n".join(focus_points)
 
-    def _generate_market_comment(self, market_summary: MarketSummary) -> str:
+    def _generate_market_comment(
+        self, market_summary: MarketSummary, stats: MarketStats | None = None
+    ) -> str:
         """Generate market overview comment based on data.
 
         Args:
             market_summary: Market summary data.
+            stats: Figures derived from the summary. Derived here if not given.
 
         Returns:
             Market commentary string.
         """
-        comments = []
+        if stats is None:
+            stats = MarketStats.from_summary(market_summary)
+        index_comment = ""
+        breadth_comment = ""
+        turnover_comment = ""
 
         # Analyze main index movement
-        if market_summary.indices:
-            main_index = market_summary.indices[0]
-            if main_index.change_pct > 2.0:
-                comments.append(f"{main_index.name}は大幅高となり、{main_index.change_pct:.2f}%上昇しました")
-            elif main_index.change_pct > 1.0:
-                comments.append(f"{main_index.name}は堅調に推移し、{main_index.change_pct:.2f}%上昇しました")
-            elif main_index.change_pct > 0:
-                comments.append(f"{main_index.name}は小幅高で、{main_index.change_pct:.2f}%上昇しました")
-            elif main_index.change_pct > -1.0:
-                comments.append(f"{main_index.name}は小幅安で、{main_index.change_pct:.2f}%下落しました")
-            elif main_index.change_pct > -2.0:
-                comments.append(f"{main_index.name}は軟調に推移し、{main_index.change_pct:.2f}%下落しました")
-            else:
-                comments.append(f"{main_index.name}は大幅安となり、{main_index.change_pct:.2f}%下落しました")
+        main_index = stats.main_index
+        if main_index is not None:
+            template = MAIN_INDEX_COMMENTS[
+                bisect_left(MAIN_INDEX_THRESHOLDS, main_index.change_pct)
+            ]
+            index_comment = template.format(name=main_index.name, pct=main_index.change_pct)
 
         # Analyze market breadth
-        total = market_summary.advancing + market_summary.declining + market_summary.unchanged
-        if total > 0:
-            adv_ratio = market_summary.advancing / total
+        if stats.total > 0:
+            adv_ratio = stats.adv_ratio
             if adv_ratio > 0.7:
-                comments.append("値上がり銘柄が全体の7割を超え、全面高の展開となりました")
+                breadth_comment = "値上がり銘柄が全体の7割を超え、全面高の展開となりました"
             elif adv_ratio > 0.6:
-                comments.append("値上がり銘柄が優勢で、買い優勢の展開となりました")
+                breadth_comment = "値上がり銘柄が優勢で、買い優勢の展開となりました"
             elif adv_ratio < 0.3:
-                comments.append("値下がり銘柄が全体の7割を超え、全面安の展開となりました")
+                breadth_comment = "値下がり銘柄が全体の7割を超え、全面安の展開となりました"
             elif adv_ratio < 0.4:
-                comments.append("値下がり銘柄が優勢で、売り優勢の展開となりました")
+                breadth_comment = "値下がり銘柄が優勢で、売り優勢の展開となりました"
             else:
-                comments.append("値上がり・値下がり銘柄数が拮抗し、方向感に欠ける展開となりました")
+                breadth_comment = "値上がり・値下がり銘柄数が拮抗し、方向感に欠ける展開となりました"
 
         # Analyze trading volume
         if market_summary.total_turnover > 0:
-            turnover_trillion = market_summary.total_turnover / 1_000_000_000_000
+            turnover_trillion = stats.turnover_trillion
             if turnover_trillion > 4.0:
-                comments.append(f"売買代金は{turnover_trillion:.1f}兆円と活況でした")
+                turnover_comment = f"売買代金は{turnover_trillion:.1f}兆円と活況でした"
             elif turnover_trillion > 3.0:
-                comments.append(f"売買代金は{turnover_trillion:.1f}兆円と堅調でした")
+                turnover_comment = f"売買代金は{turnover_trillion:.1f}兆円と堅調でした"
             elif turnover_trillion < 2.0:
-                comments.append(f"売買代金は{turnover_trillion:.1f}兆円と低調でした")
+                turnover_comment = f"売買代金は{turnover_trillion:.1f}兆円と低調でした"
 
-        if not comments:
+        comment = "。".join(filter(None, (index_comment, breadth_comment, turnover_comment)))
+        if not comment:
             return "本日の市場動向について特記事項はありません。"
 
-        return "。".join(comments) + "。"
+        return comment + "。"
 
-    def _generate_sector_comment(self, sector_analysis: SectorAnalysis) -> str:
+    def _generate_sector_comment(
+        self, sector_analysis: SectorAnalysis, sorted_sectors: list[SectorData] | None = None
+    ) -> str:
         """Generate sector analysis comment based on data.
 
         Args:
             sector_analysis: Sector analysis data.
+            sorted_sectors: Sectors already sorted by change percentage
+                descending. Sorted here if not given.
 
         Returns:
             Sector commentary string.
@@ -519,7 +717,8 @@ class ReportGenerator:
         comments = []
 
         # Sort sectors by change percentage
-        sorted_sectors = sorted(sector_analysis.sectors, key=lambda s: s.change_pct, reverse=True)
+        if sorted_sectors is None:
+            sorted_sectors = sorted(sector_analysis.sectors, key=BY_CHANGE_PCT, reverse=True)
 
         # Top performers
         top_sectors = [s for s in sorted_sectors[:3] if s.change_pct > 0.5]
@@ -601,16 +800,16 @@ class ReportGenerator:
 
         # Moving average analysis
         for ma in technical_summary.moving_averages:
-            if "25日" in ma.name:
-                if ma.value > 70:
-                    comments.append(f"25日移動平均線を上回る銘柄が{ma.value:.1f}%と多く、短期的に強い相場です")
-                elif ma.value < 30:
-                    comments.append(f"25日移動平均線を上回る銘柄が{ma.value:.1f}%と少なく、短期的に弱い相場です")
-            elif "75日" in ma.name:
-                if ma.value > 70:
-                    comments.append(f"75日移動平均線を上回る銘柄が{ma.value:.1f}%と多く、中期的に強い相場です")
-                elif ma.value < 30:
-                    comments.append(f"75日移動平均線を上回る銘柄が{ma.value:.1f}%と少なく、中期的に弱い相場です")
+            period = next((p for p in MA_COMMENT_HORIZONS if p in ma.name), None)
+            if period is None:
+                continue
+            template = MA_BREADTH_COMMENTS[(ma.value > 70) + 2 * (ma.value < 30)]
+            if template:
+                comments.append(
+                    template.format(
+                        period=period, value=ma.value, horizon=MA_COMMENT_HORIZONS[period]
+                    )
+                )
 
         # Momentum analysis
         for momentum in technical_summary.momentum_indicators:
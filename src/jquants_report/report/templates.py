@@ -1,6 +1,35 @@
 """Jinja2 templates for report generation."""
 
-from jinja2 import BaseLoader, Environment
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import TextIO
+
+from jinja2 import BaseLoader, Environment, Template
+
+from jquants_report.report.formatter import (
+    format_amount,
+    format_change,
+    format_date,
+    format_hyakuman,
+    format_number,
+    format_oku,
+    format_oku_signed,
+    format_percentage,
+    format_strength_indicator,
+    format_trend_indicator,
+    format_volume,
+    truncate_text,
+)
+from jquants_report.report.weekly_templates import WEEKLY_REPORT_TEMPLATE
+
+# Buffer size for report files; rendered chunks are streamed into it
+REPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Template fragments joined into each chunk written by a template stream
+STREAM_BUFFER_FRAGMENTS = 64
 
 # Main report template
 MAIN_TEMPLATE = """# 日次株式市場レポート - {{ report_date }}
@@ -83,24 +112,49 @@ MAIN_TEMPLATE = """# 日次株式市場レポート - {{ report_date }}
 """
 
 
+@contextmanager
+def open_report_file(path: Path) -> Iterator[TextIO]:
+    """Open a buffered report file that replaces path atomically on success.
+
+    Output goes to a temporary file next to path, which is moved over path
+    only after writing completes, so readers never see a partial report.
+    Lines end in LF on every platform, with no newline translation on write.
+
+    Args:
+        path: Final report path.
+
+    Yields:
+        Text file object to write the report to.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(
+            tmp_path,
+            "w",
+            encoding="utf-8",
+            newline="\n",
+            buffering=REPORT_WRITE_BUFFER_SIZE,
+        ) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
 def get_template_environment() -> Environment:
     """Get Jinja2 environment with custom filters.
 
+    The environment is built once and shared, so callers must not modify it.
+
     Returns:
         Configured Jinja2 Environment instance.
     """
-    from jquants_report.report.formatter import (
-        format_amount,
-        format_change,
-        format_date,
-        format_number,
-        format_percentage,
-        format_strength_indicator,
-        format_trend_indicator,
-        format_volume,
-    )
-
-    env = Environment(loader=BaseLoader())
+    # Templates emit Markdown compiled from strings, so there is nothing to
+    # escape and no source file to check for changes. Block whitespace is
+    # kept as-is because the blank lines separate Markdown tables.
+    env = Environment(loader=BaseLoader(), autoescape=False, auto_reload=False)
 
     # Register custom filters
     env.filters["format_number"] = format_number
@@ -111,10 +165,34 @@ def get_template_environment() -> Environment:
     env.filters["format_amount"] = format_amount
     env.filters["format_trend"] = format_trend_indicator
     env.filters["format_strength"] = format_strength_indicator
+    env.filters["oku"] = format_oku
+    env.filters["oku_signed"] = format_oku_signed
+    env.filters["hyakuman"] = format_hyakuman
+    env.filters["truncate_jp"] = truncate_text
 
     return env
 
 
+@lru_cache(maxsize=1)
+def get_main_template() -> Template:
+    """Get the compiled main report template.
+
+    Returns:
+        MAIN_TEMPLATE compiled once in the shared environment.
+    """
+    return get_template_environment().from_string(MAIN_TEMPLATE)
+
+
+@lru_cache(maxsize=1)
+def get_weekly_template() -> Template:
+    """Get the compiled weekly report template.
+
+    Returns:
+        WEEKLY_REPORT_TEMPLATE compiled once in the shared environment.
+    """
+    return get_template_environment().from_string(WEEKLY_REPORT_TEMPLATE)
+
+
 def render_main_template(**kwargs: str) -> str:
     """Render the main report template.
 
@@ -142,6 +220,19 @@ def render_main_template(**kwargs: str) -> str:
     Returns:
         Rendered report string.
     """
-    env = get_template_environment()
-    template = env.from_string(MAIN_TEMPLATE)
-    return template.render(**kwargs)
+    return get_main_template().render(**kwargs)
+
+
+def stream_main_template(fp: TextIO, **kwargs: str) -> None:
+    """Render the main report template directly into an open file.
+
+    Chunks are written as they are rendered, so the full report string is
+    never built in memory.
+
+    Args:
+        fp: Text file object to write to.
+        **kwargs: Template variables, as for render_main_template.
+    """
+    stream = get_main_template().stream(**kwargs)
+    stream.enable_buffering(size=STREAM_BUFFER_FRAGMENTS)
+    fp.writelines(stream)
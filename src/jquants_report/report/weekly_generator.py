@@ -5,13 +5,18 @@ all 9 analysis sections into a formatted Markdown document.
 """
 
 import logging
-from datetime import date, datetime
+import time
+from datetime import date
 from pathlib import Path
 
-from jinja2 import Template
-
-from jquants_report.report.weekly_templates import WEEKLY_REPORT_TEMPLATE
+from jquants_report.report.formatter import format_oku, truncate_text
+from jquants_report.report.templates import (
+    STREAM_BUFFER_FRAGMENTS,
+    get_weekly_template,
+    open_report_file,
+)
 from jquants_report.report.weekly_types import (
+    SectorRotationData,
     WeeklyEventsCalendar,
     WeeklyInvestorActivity,
     WeeklyMarginTrends,
@@ -19,12 +24,82 @@ from jquants_report.report.weekly_types import (
     WeeklyMediumTermTrends,
     WeeklyPerformanceRankings,
     WeeklySectorRotation,
+    WeeklyStockPerformance,
     WeeklyTechnicalSummary,
     WeeklyTopics,
 )
 
 logger = logging.getLogger(__name__)
 
+GENERATED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Rows shown in the earnings calendar table; the rest are counted as overflow
+EARNINGS_TABLE_LIMIT = 20
+
+# Pre-formatted table rows, unpacked positionally by the weekly template
+# (rank, name, return, return change, turnover, stock count)
+SectorRow = tuple[int, str, str, str, str, int]
+# (rank, code, name, sector, close, weekly return)
+PriceRankRow = tuple[int, str, str, str, str, str]
+# (rank, code, name, turnover, weekly return)
+TurnoverRankRow = tuple[int, str, str, str, str]
+
+
+def _sector_rows(sectors: list[SectorRotationData]) -> list[SectorRow]:
+    """Pre-format sector rotation table rows.
+
+    Returns:
+        One SectorRow per sector, ranked from 1.
+    """
+    return [
+        (
+            rank,
+            sector.sector_name,
+            f"{sector.weekly_return_pct:+.2f}",
+            f"{sector.return_change:+.2f}" if sector.return_change is not None else "N/A",
+            format_oku(sector.turnover),
+            sector.stock_count,
+        )
+        for rank, sector in enumerate(sectors, 1)
+    ]
+
+
+def _price_rank_rows(stocks: list[WeeklyStockPerformance]) -> list[PriceRankRow]:
+    """Pre-format gainer/loser table rows.
+
+    Returns:
+        One PriceRankRow per stock, ranked from 1.
+    """
+    return [
+        (
+            rank,
+            stock.code,
+            truncate_text(stock.name, 12),
+            stock.sector_name[:8],
+            f"{stock.week_close:,.0f}",
+            f"{stock.weekly_return_pct:+.2f}",
+        )
+        for rank, stock in enumerate(stocks, 1)
+    ]
+
+
+def _turnover_rank_rows(stocks: list[WeeklyStockPerformance]) -> list[TurnoverRankRow]:
+    """Pre-format turnover ranking table rows.
+
+    Returns:
+        One TurnoverRankRow per stock, ranked from 1.
+    """
+    return [
+        (
+            rank,
+            stock.code,
+            truncate_text(stock.name, 15),
+            format_oku(stock.week_turnover),
+            f"{stock.weekly_return_pct:+.2f}",
+        )
+        for rank, stock in enumerate(stocks, 1)
+    ]
+
 
 class WeeklyReportGenerator:
     """Generator for weekly market reports."""
@@ -37,6 +112,7 @@ class WeeklyReportGenerator:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._template = get_weekly_template()
 
     def generate(
         self,
@@ -72,33 +148,57 @@ class WeeklyReportGenerator:
         """
         logger.info(f"Generating weekly report for {week_start} to {week_end}")
 
+        advancing_pct, declining_pct, unchanged_pct = market_summary.breadth_percentages()
+
         # Prepare template context
         context = {
             "week_start": week_start.strftime("%Y年%m月%d日"),
             "week_end": week_end.strftime("%Y年%m月%d日"),
             "market_summary": market_summary,
+            "advancing_pct": advancing_pct,
+            "declining_pct": declining_pct,
+            "unchanged_pct": unchanged_pct,
             "sector_rotation": sector_rotation,
+            "top_sector_rows": _sector_rows(sector_rotation.top_sectors),
+            "bottom_sector_rows": _sector_rows(sector_rotation.bottom_sectors),
             "performance_rankings": performance_rankings,
+            "top_gainer_rows": _price_rank_rows(performance_rankings.top_gainers),
+            "top_loser_rows": _price_rank_rows(performance_rankings.top_losers),
+            "top_turnover_rows": _turnover_rank_rows(performance_rankings.top_turnover),
             "investor_activity": investor_activity,
             "margin_trends": margin_trends,
             "technical_summary": technical_summary,
             "events_calendar": events_calendar,
             "weekly_topics": weekly_topics,
             "medium_term_trends": medium_term_trends,
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "enumerate": enumerate,  # Make enumerate available in template
+            # Section visibility is decided here so the template only reads flags
+            "has_investor_categories": bool(investor_activity.categories),
+            "has_top_margin_buy": bool(margin_trends.top_margin_buy),
+            "has_advance_decline_ratio": bool(technical_summary.advance_decline_ratio),
+            "has_moving_averages": bool(technical_summary.moving_averages),
+            "has_earnings_announcements": bool(events_calendar.earnings_announcements),
+            "earnings_rows": events_calendar.earnings_announcements[:EARNINGS_TABLE_LIMIT],
+            "earnings_overflow": max(
+                len(events_calendar.earnings_announcements) - EARNINGS_TABLE_LIMIT, 0
+            ),
+            "has_key_dates": bool(events_calendar.key_dates),
+            "has_market_topics": bool(weekly_topics.market_topics),
+            "has_price_highlights": bool(weekly_topics.price_highlights),
+            "has_year_high_low_stocks": bool(weekly_topics.year_high_low_stocks),
+            "has_sector_highlights": bool(weekly_topics.sector_highlights),
+            "has_sector_trends": bool(medium_term_trends.sector_trends),
+            "generated_at": time.strftime(GENERATED_AT_FORMAT),
         }
 
-        # Render template
-        template = Template(WEEKLY_REPORT_TEMPLATE)
-        report_content = template.render(**context)
-
-        # Write to file
         filename = f"weekly_report_{week_end.strftime('%Y%m%d')}.md"
         output_path = self.output_dir / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        # Render template section by section straight into the file
+        stream = self._template.stream(**context)
+        stream.enable_buffering(size=STREAM_BUFFER_FRAGMENTS)
+        with open_report_file(output_path) as f:
+            f.writelines(stream)
 
         logger.info(f"Weekly report saved to {output_path}")
         return output_path
+
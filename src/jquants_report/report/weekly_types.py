@@ -1,6 +1,7 @@
 """Data types for weekly report generation.
 
-This module defines dataclasses for the 9 sections of the weekly report:
+This module defines dataclasses and NamedTuple records for the 9 sections
+of the weekly report:
 1. Weekly Market Summary
 2. Sector Rotation
 3. Performance Rankings
@@ -14,10 +15,24 @@ This module defines dataclasses for the 9 sections of the weekly report:
 
 from dataclasses import dataclass, field
 from datetime import date
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _mmdd(value: date) -> str:
+    """Format a date as MM/DD without going through strftime."""
+    return f"{value.month:02d}/{value.day:02d}"
+
+
+def _ymd(value: date) -> str:
+    """Format a date as YYYY/MM/DD without going through strftime."""
+    return f"{value.year:04d}/{value.month:02d}/{value.day:02d}"
 
 
 # Section 1: Weekly Market Summary
-@dataclass
+@dataclass(slots=True)
 class WeeklyIndexData:
     """Weekly index performance data."""
 
@@ -28,9 +43,24 @@ class WeeklyIndexData:
     week_close: float
     weekly_change: float
     weekly_change_pct: float
-
-
-@dataclass
+    open_fmt: str = field(init=False, repr=False, compare=False)
+    high_fmt: str = field(init=False, repr=False, compare=False)
+    low_fmt: str = field(init=False, repr=False, compare=False)
+    close_fmt: str = field(init=False, repr=False, compare=False)
+    change_fmt: str = field(init=False, repr=False, compare=False)
+    change_pct_fmt: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the cell strings used by the index performance table."""
+        self.open_fmt = f"{self.week_open:,.2f}"
+        self.high_fmt = f"{self.week_high:,.2f}"
+        self.low_fmt = f"{self.week_low:,.2f}"
+        self.close_fmt = f"{self.week_close:,.2f}"
+        self.change_fmt = f"{self.weekly_change:+,.2f}"
+        self.change_pct_fmt = f"{self.weekly_change_pct:+.2f}"
+
+
+@dataclass(slots=True, frozen=True)
 class DailyIndexChange:
     """Daily index change data for the week."""
 
@@ -38,9 +68,14 @@ class DailyIndexChange:
     close: float
     change: float
     change_pct: float
+    date_mmdd: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the MM/DD label used by the report tables."""
+        object.__setattr__(self, "date_mmdd", _mmdd(self.date))
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyMarketSummary:
     """Section 1: Weekly market summary data."""
 
@@ -54,9 +89,25 @@ class WeeklyMarketSummary:
     week_total_volume: float = 0.0
     week_total_turnover: float = 0.0
 
+    def breadth_percentages(self) -> tuple[float, float, float]:
+        """Get advancing, declining and unchanged shares of all stocks.
+
+        Returns:
+            Tuple of (advancing, declining, unchanged) percentages, all zero
+            when there are no stocks.
+        """
+        total = self.total_advancing + self.total_declining + self.total_unchanged
+        if total <= 0:
+            return 0.0, 0.0, 0.0
+        return (
+            self.total_advancing / total * 100,
+            self.total_declining / total * 100,
+            self.total_unchanged / total * 100,
+        )
+
 
 # Section 2: Sector Rotation
-@dataclass
+@dataclass(slots=True)
 class SectorRotationData:
     """Sector performance data for rotation analysis."""
 
@@ -71,7 +122,7 @@ class SectorRotationData:
     declining_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklySectorRotation:
     """Section 2: Sector rotation analysis."""
 
@@ -82,7 +133,7 @@ class WeeklySectorRotation:
 
 
 # Section 3: Performance Rankings
-@dataclass
+@dataclass(slots=True)
 class WeeklyStockPerformance:
     """Individual stock weekly performance."""
 
@@ -98,8 +149,20 @@ class WeeklyStockPerformance:
     week_low: float | None = None
     prev_week_close: float | None = None
 
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> list["WeeklyStockPerformance"]:
+        """Build performances from a frame whose columns follow the field order.
+
+        Args:
+            df: DataFrame with one column per field, in declaration order.
+
+        Returns:
+            One WeeklyStockPerformance per row.
+        """
+        return [cls(*row) for row in df.itertuples(index=False, name=None)]
 
-@dataclass
+
+@dataclass(slots=True)
 class WeeklyPerformanceRankings:
     """Section 3: Performance rankings."""
 
@@ -111,8 +174,7 @@ class WeeklyPerformanceRankings:
 
 
 # Section 4: Investor Trading Activity
-@dataclass
-class InvestorCategory:
+class InvestorCategory(NamedTuple):
     """Trading data for an investor category."""
 
     category_name: str
@@ -123,7 +185,7 @@ class InvestorCategory:
     net_change: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyInvestorActivity:
     """Section 4: Investor trading activity."""
 
@@ -135,7 +197,7 @@ class WeeklyInvestorActivity:
 
 
 # Section 5: Margin Trading Trends
-@dataclass
+@dataclass(slots=True)
 class MarginTradingData:
     """Margin trading balance and trend data."""
 
@@ -149,7 +211,7 @@ class MarginTradingData:
     sell_balance_change: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TopMarginStock:
     """Stock with high margin trading activity."""
 
@@ -161,7 +223,7 @@ class TopMarginStock:
     weekly_return_pct: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyMarginTrends:
     """Section 5: Margin trading trends."""
 
@@ -172,7 +234,7 @@ class WeeklyMarginTrends:
 
 
 # Section 6: Technical Summary
-@dataclass
+@dataclass(slots=True)
 class TechnicalIndicatorData:
     """Technical indicator value and signal."""
 
@@ -183,8 +245,7 @@ class TechnicalIndicatorData:
     change: float | None = None
 
 
-@dataclass
-class MovingAverageStatus:
+class MovingAverageStatus(NamedTuple):
     """Moving average analysis status."""
 
     period: int  # 25, 75, 200
@@ -193,7 +254,7 @@ class MovingAverageStatus:
     prev_week_pct: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyTechnicalSummary:
     """Section 6: Technical analysis summary."""
 
@@ -206,7 +267,7 @@ class WeeklyTechnicalSummary:
 
 
 # Section 7: Earnings/Events Calendar
-@dataclass
+@dataclass(slots=True)
 class EarningsEvent:
     """Scheduled earnings announcement."""
 
@@ -215,9 +276,14 @@ class EarningsEvent:
     name: str
     fiscal_period: str  # "2024年3月期" etc.
     announcement_type: str  # "決算", "業績修正" etc.
+    date_mmdd: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the MM/DD label used by the report tables."""
+        self.date_mmdd = _mmdd(self.date)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketEvent:
     """Other market events (IPO, delisting, etc.)."""
 
@@ -226,9 +292,14 @@ class MarketEvent:
     code: str | None
     name: str | None
     description: str
+    date_mmdd: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Precompute the MM/DD label used by the report tables."""
+        self.date_mmdd = _mmdd(self.date)
 
-@dataclass
+
+@dataclass(slots=True)
 class WeeklyEventsCalendar:
     """Section 7: Events calendar for next week."""
 
@@ -237,10 +308,17 @@ class WeeklyEventsCalendar:
     earnings_announcements: list[EarningsEvent] = field(default_factory=list)
     market_events: list[MarketEvent] = field(default_factory=list)
     key_dates: list[str] = field(default_factory=list)  # Holiday notices, etc.
+    upcoming_week_start_ymd: str = field(init=False, repr=False, compare=False)
+    upcoming_week_end_ymd: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the YYYY/MM/DD labels used in the report header."""
+        self.upcoming_week_start_ymd = _ymd(self.upcoming_week_start)
+        self.upcoming_week_end_ymd = _ymd(self.upcoming_week_end)
 
 
 # Section 8: Weekly Topics
-@dataclass
+@dataclass(slots=True)
 class MarketTopic:
     """Notable market topic/theme for the week."""
 
@@ -250,7 +328,7 @@ class MarketTopic:
     impact: str = "中立"  # "ポジティブ", "ネガティブ", "中立"
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceMovementHighlight:
     """Notable price movement highlight."""
 
@@ -262,7 +340,7 @@ class PriceMovementHighlight:
     reason: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyTopics:
     """Section 8: Weekly topics and highlights."""
 
@@ -274,8 +352,7 @@ class WeeklyTopics:
 
 
 # Section 9: Medium-term Trend Check
-@dataclass
-class TrendData:
+class TrendData(NamedTuple):
     """Trend data for a specific period."""
 
     period_name: str  # "1週間", "1ヶ月", "3ヶ月"
@@ -286,7 +363,7 @@ class TrendData:
     trend_direction: str  # "上昇", "下落", "横ばい"
 
 
-@dataclass
+@dataclass(slots=True)
 class SectorTrendData:
     """Sector trend over medium term."""
 
@@ -297,7 +374,7 @@ class SectorTrendData:
     trend_strength: str = "中立"  # "強気", "弱気", "中立"
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyMediumTermTrends:
     """Section 9: Medium-term trend confirmation."""
 
@@ -309,7 +386,7 @@ class WeeklyMediumTermTrends:
 
 
 # Complete Weekly Report
-@dataclass
+@dataclass(slots=True)
 class WeeklyReport:
     """Complete weekly report containing all 9 sections."""
 
@@ -1,5 +1,8 @@
 """Tests for analysis modules."""
 
+import datetime
+from collections.abc import Callable
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -14,12 +17,22 @@ from jquants_report.analysis.supply_demand import (
     SupplyDemandAnalysis,
 )
 from jquants_report.analysis.technical import TechnicalAnalyzer, TechnicalIndicators
+from jquants_report.analysis.weekly.market import WeeklyMarketAnalyzer
+from jquants_report.analysis.weekly.stocks import WeeklyStockAnalyzer
+
+# Analyzers keep no per-call state, so their fixtures are module-scoped and
+# one instance serves every test in a class
 
 
 class TestMarketAnalyzer:
     """Tests for MarketAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def market_analyzer(self) -> MarketAnalyzer:
+        """Create MarketAnalyzer instance."""
+        return MarketAnalyzer()
+
+    @pytest.fixture(scope="module")
     def sample_prices_df(self) -> pd.DataFrame:
         """Create sample price data."""
         return pd.DataFrame(
@@ -33,7 +46,7 @@ class TestMarketAnalyzer:
             }
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_indices_df(self) -> pd.DataFrame:
         """Create sample index data."""
         return pd.DataFrame(
@@ -45,11 +58,13 @@ class TestMarketAnalyzer:
         )
 
     def test_analyze_market_overview(
-        self, sample_prices_df: pd.DataFrame, sample_indices_df: pd.DataFrame
+        self,
+        sample_prices_df: pd.DataFrame,
+        sample_indices_df: pd.DataFrame,
+        market_analyzer: MarketAnalyzer,
     ) -> None:
         """Test market overview analysis."""
-        analyzer = MarketAnalyzer()
-        result = analyzer.analyze("2024-01-15", sample_prices_df, sample_indices_df)
+        result = market_analyzer.analyze("2024-01-15", sample_prices_df, sample_indices_df)
 
         assert isinstance(result, MarketOverview)
         assert result.date == "2024-01-15"
@@ -57,42 +72,49 @@ class TestMarketAnalyzer:
         assert result.declining_issues == 2
         assert result.unchanged_issues == 1
         assert result.total_issues == 5
-        assert result.total_volume == 650000.0
-        assert result.total_value == 933000000.0
+        assert result.total_volume == pytest.approx(650000.0)
+        assert result.total_value == pytest.approx(933000000.0)
         assert result.topix_close == 2500.5
         assert result.nikkei225_close == 38000.25
 
-    def test_analyze_empty_dataframe(self) -> None:
+    def test_analyze_empty_dataframe(self, market_analyzer: MarketAnalyzer) -> None:
         """Test analysis with empty dataframe."""
-        analyzer = MarketAnalyzer()
-        result = analyzer.analyze("2024-01-15", pd.DataFrame())
+        result = market_analyzer.analyze("2024-01-15", pd.DataFrame())
 
         assert result.advancing_issues == 0
         assert result.declining_issues == 0
         assert result.total_volume == 0.0
 
-    def test_calculate_market_breadth(self, sample_prices_df: pd.DataFrame) -> None:
+    def test_calculate_market_breadth(
+        self, sample_prices_df: pd.DataFrame, market_analyzer: MarketAnalyzer
+    ) -> None:
         """Test market breadth calculation."""
-        analyzer = MarketAnalyzer()
-        breadth = analyzer.calculate_market_breadth(sample_prices_df)
+        breadth = market_analyzer.calculate_market_breadth(sample_prices_df)
 
-        assert breadth["advance_decline_ratio"] == 1.0  # 2 advancing / 2 declining
-        assert breadth["advance_percentage"] == 40.0  # 2/5 * 100
-        assert breadth["decline_percentage"] == 40.0  # 2/5 * 100
+        assert breadth["advance_decline_ratio"] == pytest.approx(1.0)  # 2 advancing / 2 declining
+        assert breadth["advance_percentage"] == pytest.approx(40.0)  # 2/5 * 100
+        assert breadth["decline_percentage"] == pytest.approx(40.0)  # 2/5 * 100
 
 
 class TestSectorAnalyzer:
     """Tests for SectorAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def sector_analyzer(self) -> SectorAnalyzer:
+        """Create SectorAnalyzer instance."""
+        return SectorAnalyzer()
+
+    @pytest.fixture(scope="module")
     def sample_sector_df(self) -> pd.DataFrame:
         """Create sample sector data."""
         return pd.DataFrame(
             {
                 "Code": ["1001", "1002", "1003", "2001", "2002"],
                 "CompanyName": ["Stock A", "Stock B", "Stock C", "Stock D", "Stock E"],
-                "Sector33Code": ["3200", "3200", "3250", "6050", "6050"],
-                "Sector33CodeName": ["化学", "化学", "医薬品", "情報・通信業", "情報・通信業"],
+                "Sector33Code": pd.Categorical(["3200", "3200", "3250", "6050", "6050"]),
+                "Sector33CodeName": pd.Categorical(
+                    ["化学", "化学", "医薬品", "情報・通信業", "情報・通信業"]
+                ),
                 "Close": [1000, 2000, 1500, 800, 1200],
                 "ChangeRate": [2.5, -1.5, 3.0, 1.0, -2.0],
                 "Volume": [100000, 200000, 150000, 80000, 120000],
@@ -100,40 +122,52 @@ class TestSectorAnalyzer:
             }
         )
 
-    def test_analyze_sectors(self, sample_sector_df: pd.DataFrame) -> None:
-        """Test sector analysis."""
-        analyzer = SectorAnalyzer()
-        results = analyzer.analyze_sectors(sample_sector_df)
+    @pytest.fixture(scope="module")
+    def sector_results(
+        self, sample_sector_df: pd.DataFrame, sector_analyzer: SectorAnalyzer
+    ) -> list[SectorPerformance]:
+        """Analyze the sample sectors once for all sector tests."""
+        return sector_analyzer.analyze_sectors(sample_sector_df)
 
-        assert len(results) == 3  # 3 unique sectors
-        assert all(isinstance(r, SectorPerformance) for r in results)
+    def test_analyze_sectors(self, sector_results: list[SectorPerformance]) -> None:
+        """Test sector analysis."""
+        assert len(sector_results) == 3  # 3 unique sectors
+        assert all(isinstance(r, SectorPerformance) for r in sector_results)
 
         # Results should be sorted by change rate
-        assert results[0].average_change_pct >= results[1].average_change_pct
-
-    def test_get_top_sectors(self, sample_sector_df: pd.DataFrame) -> None:
-        """Test getting top performing sectors."""
-        analyzer = SectorAnalyzer()
-        all_sectors = analyzer.analyze_sectors(sample_sector_df)
-        top_sectors = analyzer.get_top_sectors(all_sectors, top_n=2)
-
-        assert len(top_sectors) == 2
-        assert top_sectors[0].average_change_pct >= top_sectors[1].average_change_pct
-
-    def test_get_bottom_sectors(self, sample_sector_df: pd.DataFrame) -> None:
-        """Test getting bottom performing sectors."""
-        analyzer = SectorAnalyzer()
-        all_sectors = analyzer.analyze_sectors(sample_sector_df)
-        bottom_sectors = analyzer.get_bottom_sectors(all_sectors, bottom_n=2)
+        assert sector_results[0].average_change_pct >= sector_results[1].average_change_pct
+
+    @pytest.mark.parametrize(
+        ("method", "sort_key"),
+        [
+            ("get_top_sectors", lambda s: -s.average_change_pct),
+            ("get_bottom_sectors", lambda s: s.average_change_pct),
+        ],
+        ids=["top", "bottom"],
+    )
+    def test_sector_selectors(
+        self,
+        sector_results: list[SectorPerformance],
+        sector_analyzer: SectorAnalyzer,
+        method: str,
+        sort_key: Callable[[SectorPerformance], float],
+    ) -> None:
+        """Test top/bottom sector selectors return ordered slices."""
+        selected = getattr(sector_analyzer, method)(sector_results, 2)
 
-        assert len(bottom_sectors) == 2
-        assert bottom_sectors[0].average_change_pct <= bottom_sectors[1].average_change_pct
+        assert len(selected) == 2
+        assert selected == sorted(selected, key=sort_key)
 
 
 class TestStockAnalyzer:
     """Tests for StockAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def stock_analyzer(self) -> StockAnalyzer:
+        """Create StockAnalyzer instance."""
+        return StockAnalyzer()
+
+    @pytest.fixture(scope="module")
     def sample_stocks_df(self) -> pd.DataFrame:
         """Create sample stock data."""
         return pd.DataFrame(
@@ -144,42 +178,62 @@ class TestStockAnalyzer:
                 "ChangeRate": [5.0, -4.0, 3.0, 2.0, -3.0],
                 "Volume": [1000000, 500000, 800000, 300000, 600000],
                 "TurnoverValue": [1000000000, 1000000000, 1200000000, 240000000, 720000000],
-                "Sector33CodeName": ["化学", "医薬品", "情報・通信業", "小売業", "銀行業"],
+                "Sector33CodeName": pd.Categorical(
+                    ["化学", "医薬品", "情報・通信業", "小売業", "銀行業"]
+                ),
             }
         )
 
-    def test_get_top_gainers(self, sample_stocks_df: pd.DataFrame) -> None:
-        """Test getting top gaining stocks."""
-        analyzer = StockAnalyzer()
-        gainers = analyzer.get_top_gainers(sample_stocks_df, top_n=3)
-
-        assert len(gainers) == 3
-        assert all(isinstance(s, StockInfo) for s in gainers)
-        assert gainers[0].change_pct >= gainers[1].change_pct >= gainers[2].change_pct
-        assert gainers[0].change_pct == 5.0
+    @pytest.mark.parametrize(
+        ("method", "expected_codes", "sort_key"),
+        [
+            ("get_top_gainers", ["1001", "1003", "1004"], lambda s: -s.change_pct),
+            ("get_top_losers", ["1002", "1005"], lambda s: s.change_pct),  # Only 2 losing stocks
+            ("get_high_volume_stocks", ["1001", "1003", "1005"], lambda s: -s.volume),
+        ],
+        ids=["gainers", "losers", "high_volume"],
+    )
+    def test_stock_selectors(
+        self,
+        sample_stocks_df: pd.DataFrame,
+        stock_analyzer: StockAnalyzer,
+        method: str,
+        expected_codes: list[str],
+        sort_key: Callable[[StockInfo], float],
+    ) -> None:
+        """Test top-N stock selectors return ordered StockInfo lists."""
+        selected = getattr(stock_analyzer, method)(sample_stocks_df, top_n=3)
 
-    def test_get_top_losers(self, sample_stocks_df: pd.DataFrame) -> None:
-        """Test getting top losing stocks."""
-        analyzer = StockAnalyzer()
-        losers = analyzer.get_top_losers(sample_stocks_df, top_n=3)
+        assert all(isinstance(s, StockInfo) for s in selected)
+        assert [s.code for s in selected] == expected_codes
+        assert selected == sorted(selected, key=sort_key)
 
-        assert len(losers) == 2  # Only 2 losing stocks
-        assert all(isinstance(s, StockInfo) for s in losers)
-        assert losers[0].change_pct <= losers[1].change_pct
-        assert losers[0].change_pct == -4.0
+    def test_stock_info_change_from_prev_close(self, stock_analyzer: StockAnalyzer) -> None:
+        """Test change uses PrevClose when present and falls back to ChangeRate."""
+        df = pd.DataFrame(
+            {
+                "Code": ["1001", "1002", "1003"],
+                "Name": ["Stock A", "Stock B", "Stock C"],
+                "Close": [1100.0, 990.0, 500.0],
+                "ChangeRate": [10.0, -1.0, 0.0],
+                "PrevClose": [1000.0, None, None],
+                "Volume": [100, 200, 300],
+            }
+        )
 
-    def test_get_high_volume_stocks(self, sample_stocks_df: pd.DataFrame) -> None:
-        """Test getting high volume stocks."""
-        analyzer = StockAnalyzer()
-        high_vol = analyzer.get_high_volume_stocks(sample_stocks_df, top_n=3)
+        stocks = stock_analyzer._convert_to_stock_info(df)
 
-        assert len(high_vol) == 3
-        assert all(isinstance(s, StockInfo) for s in high_vol)
-        assert high_vol[0].volume >= high_vol[1].volume
+        assert [s.name for s in stocks] == ["Stock A", "Stock B", "Stock C"]
+        assert stocks[0].change == pytest.approx(100.0)
+        assert stocks[1].change == pytest.approx(-10.0)
+        assert stocks[2].change == 0.0
+        assert stocks[0].sector_name == ""
+        assert stocks[0].turnover_value == 0.0
 
-    def test_get_limit_hits(self) -> None:
-        """Test getting limit hit stocks."""
-        df = pd.DataFrame(
+    @pytest.fixture(scope="module")
+    def sample_limit_df(self) -> pd.DataFrame:
+        """Create sample stock data with limit flags."""
+        return pd.DataFrame(
             {
                 "Code": ["1001", "1002", "1003"],
                 "CompanyName": ["Stock A", "Stock B", "Stock C"],
@@ -192,18 +246,20 @@ class TestStockAnalyzer:
             }
         )
 
-        analyzer = StockAnalyzer()
-        limits = analyzer.get_limit_hits(df)
+    def test_get_limit_hits(
+        self, sample_limit_df: pd.DataFrame, stock_analyzer: StockAnalyzer
+    ) -> None:
+        """Test getting limit hit stocks."""
+        limits = stock_analyzer.get_limit_hits(sample_limit_df)
 
         assert len(limits["upper_limit"]) == 1
         assert len(limits["lower_limit"]) == 1
         assert limits["upper_limit"][0].code == "1001"
         assert limits["lower_limit"][0].code == "1002"
 
-    def test_empty_dataframe(self) -> None:
+    def test_empty_dataframe(self, stock_analyzer: StockAnalyzer) -> None:
         """Test with empty dataframe."""
-        analyzer = StockAnalyzer()
-        gainers = analyzer.get_top_gainers(pd.DataFrame())
+        gainers = stock_analyzer.get_top_gainers(pd.DataFrame())
 
         assert len(gainers) == 0
 
@@ -211,7 +267,12 @@ class TestStockAnalyzer:
 class TestTechnicalAnalyzer:
     """Tests for TechnicalAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def technical_analyzer(self) -> TechnicalAnalyzer:
+        """Create TechnicalAnalyzer instance."""
+        return TechnicalAnalyzer()
+
+    @pytest.fixture(scope="module")
     def sample_current_df(self) -> pd.DataFrame:
         """Create sample current price data."""
         return pd.DataFrame(
@@ -227,34 +288,35 @@ class TestTechnicalAnalyzer:
             }
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_historical_df(self) -> pd.DataFrame:
         """Create sample historical data."""
         dates = pd.date_range(start="2024-01-01", periods=30, freq="D")
-        data = []
-
-        for date in dates:
-            for code in ["1001", "1002", "1003"]:
-                data.append(
-                    {
-                        "Code": code,
-                        "Date": date.strftime("%Y-%m-%d"),
-                        "Close": 1000 + np.random.randint(-50, 50),
-                        "High": 1050 + np.random.randint(-50, 50),
-                        "Low": 950 + np.random.randint(-50, 50),
-                        "ChangeRate": np.random.uniform(-3, 3),
-                        "Volume": 100000 + np.random.randint(-10000, 10000),
-                    }
-                )
-
-        return pd.DataFrame(data)
+        codes = ["1001", "1002", "1003"]
+        n = len(dates) * len(codes)
+        # Seeded so the shared fixture is the same regardless of test order
+        rng = np.random.default_rng(0)
+
+        return pd.DataFrame(
+            {
+                "Code": np.tile(codes, len(dates)),
+                "Date": np.repeat(dates.strftime("%Y-%m-%d").to_numpy(), len(codes)),
+                "Close": 1000 + rng.integers(-50, 50, n),
+                "High": 1050 + rng.integers(-50, 50, n),
+                "Low": 950 + rng.integers(-50, 50, n),
+                "ChangeRate": rng.uniform(-3, 3, n),
+                "Volume": 100000 + rng.integers(-10000, 10000, n),
+            }
+        )
 
     def test_analyze_technical_indicators(
-        self, sample_current_df: pd.DataFrame, sample_historical_df: pd.DataFrame
+        self,
+        sample_current_df: pd.DataFrame,
+        sample_historical_df: pd.DataFrame,
+        technical_analyzer: TechnicalAnalyzer,
     ) -> None:
         """Test technical indicator analysis."""
-        analyzer = TechnicalAnalyzer()
-        result = analyzer.analyze("2024-01-15", sample_current_df, sample_historical_df)
+        result = technical_analyzer.analyze("2024-01-15", sample_current_df, sample_historical_df)
 
         assert isinstance(result, TechnicalIndicators)
         assert result.date == "2024-01-15"
@@ -263,34 +325,59 @@ class TestTechnicalAnalyzer:
         assert isinstance(result.new_highs, int)
         assert isinstance(result.new_lows, int)
 
-    def test_analyze_without_historical(self, sample_current_df: pd.DataFrame) -> None:
+    def test_analyze_without_historical(
+        self, sample_current_df: pd.DataFrame, technical_analyzer: TechnicalAnalyzer
+    ) -> None:
         """Test analysis without historical data."""
-        analyzer = TechnicalAnalyzer()
-        result = analyzer.analyze("2024-01-15", sample_current_df)
+        result = technical_analyzer.analyze("2024-01-15", sample_current_df)
 
         assert isinstance(result, TechnicalIndicators)
         assert result.advance_decline_ratio_25d is None
         assert result.new_highs == 0
         assert result.new_lows == 0
 
-    def test_calculate_rsi(self, sample_historical_df: pd.DataFrame) -> None:
+    def test_calculate_rsi(
+        self, sample_historical_df: pd.DataFrame, technical_analyzer: TechnicalAnalyzer
+    ) -> None:
         """Test RSI calculation."""
-        analyzer = TechnicalAnalyzer()
-        rsi = analyzer.calculate_rsi(sample_historical_df, "1001", period=14)
+        rsi = technical_analyzer.calculate_rsi(sample_historical_df, "1001", period=14)
 
-        if rsi is not None:
-            assert 0 <= rsi <= 100
+        # 30 seeded days per code are enough history for a 14-day RSI
+        assert rsi is not None
+        assert 0 <= rsi <= 100
+
+    def test_calculate_rsi_known_values(self, technical_analyzer: TechnicalAnalyzer) -> None:
+        """Test RSI against hand-computed values on fixed prices."""
+        # Alternating +2/-1 moves: average gain 1.0, average loss 0.5, RS 2
+        closes = np.cumsum([1000.0] + [2.0, -1.0] * 7)
+        prices = pd.DataFrame(
+            {
+                "Code": "1001",
+                "Date": pd.date_range("2024-01-01", periods=len(closes)).strftime("%Y-%m-%d"),
+                "Close": closes,
+            }
+        )
+
+        assert technical_analyzer.calculate_rsi(prices, "1001") == pytest.approx(200 / 3)
+        assert technical_analyzer.calculate_rsi(prices.iloc[:14], "1001") is None
+        rising = prices.assign(Close=np.arange(1000.0, 1000.0 + len(closes)))
+        assert technical_analyzer.calculate_rsi(rising, "1001") == 100.0
 
 
 class TestSupplyDemandAnalyzer:
     """Tests for SupplyDemandAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def supply_demand_analyzer(self) -> SupplyDemandAnalyzer:
+        """Create SupplyDemandAnalyzer instance."""
+        return SupplyDemandAnalyzer()
+
+    @pytest.fixture(scope="module")
     def sample_trading_df(self) -> pd.DataFrame:
         """Create sample trading data."""
         return pd.DataFrame(
             {
-                "InvestorType": ["1", "2", "3", "4"],
+                "InvestorType": pd.Categorical(["1", "2", "3", "4"]),
                 "BuyValue": [1000, 2000, 1500, 800],
                 "SellValue": [1200, 1800, 1600, 700],
                 "BuyVolume": [100000, 200000, 150000, 80000],
@@ -298,7 +385,7 @@ class TestSupplyDemandAnalyzer:
             }
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_margin_df(self) -> pd.DataFrame:
         """Create sample margin trading data."""
         return pd.DataFrame(
@@ -310,66 +397,161 @@ class TestSupplyDemandAnalyzer:
             }
         )
 
-    def test_analyze_investor_trading(self, sample_trading_df: pd.DataFrame) -> None:
-        """Test investor trading analysis."""
-        analyzer = SupplyDemandAnalyzer()
-        results = analyzer.analyze_investor_trading(sample_trading_df)
+    @pytest.fixture(scope="module")
+    def investor_summaries(
+        self, sample_trading_df: pd.DataFrame, supply_demand_analyzer: SupplyDemandAnalyzer
+    ) -> list[InvestorTradingSummary]:
+        """Analyze the sample investor trading once for the summary tests."""
+        return supply_demand_analyzer.analyze_investor_trading(sample_trading_df)
 
-        assert len(results) == 4
-        assert all(isinstance(r, InvestorTradingSummary) for r in results)
+    def test_analyze_investor_trading(
+        self, investor_summaries: list[InvestorTradingSummary]
+    ) -> None:
+        """Test investor trading analysis."""
+        assert len(investor_summaries) == 4
+        assert all(isinstance(r, InvestorTradingSummary) for r in investor_summaries)
 
         # Check calculations
-        individual = next(r for r in results if r.investor_type == "個人")
-        assert individual.buy_value == 1000
-        assert individual.sell_value == 1200
-        assert individual.net_value == -200
+        individual = next(r for r in investor_summaries if r.investor_type == "個人")
+        assert individual.buy_value == pytest.approx(1000)
+        assert individual.sell_value == pytest.approx(1200)
+        assert individual.net_value == pytest.approx(-200)
 
-    def test_analyze_margin_trading(self, sample_margin_df: pd.DataFrame) -> None:
+    def test_analyze_margin_trading(
+        self, sample_margin_df: pd.DataFrame, supply_demand_analyzer: SupplyDemandAnalyzer
+    ) -> None:
         """Test margin trading analysis."""
-        analyzer = SupplyDemandAnalyzer()
-        result = analyzer.analyze_margin_trading("2024-01-15", sample_margin_df)
+        result = supply_demand_analyzer.analyze_margin_trading("2024-01-15", sample_margin_df)
 
         assert isinstance(result, MarginTradingSummary)
         assert result.date == "2024-01-15"
-        assert result.margin_buy_balance == 2500000
-        assert result.margin_sell_balance == 2000000
+        assert result.margin_buy_balance == pytest.approx(2500000)
+        assert result.margin_sell_balance == pytest.approx(2000000)
         assert result.margin_ratio is not None
-        assert result.margin_ratio == 1.25
+        assert result.margin_ratio == pytest.approx(1.25)
 
     def test_analyze_full(
-        self, sample_trading_df: pd.DataFrame, sample_margin_df: pd.DataFrame
+        self,
+        sample_trading_df: pd.DataFrame,
+        sample_margin_df: pd.DataFrame,
+        supply_demand_analyzer: SupplyDemandAnalyzer,
     ) -> None:
         """Test full supply/demand analysis."""
-        analyzer = SupplyDemandAnalyzer()
-        result = analyzer.analyze("2024-01-15", sample_trading_df, sample_margin_df)
+        result = supply_demand_analyzer.analyze("2024-01-15", sample_trading_df, sample_margin_df)
 
         assert isinstance(result, SupplyDemandAnalysis)
         assert result.date == "2024-01-15"
         assert len(result.investor_trading) == 4
         assert result.margin_trading is not None
 
-    def test_get_top_net_buyers(self, sample_trading_df: pd.DataFrame) -> None:
-        """Test getting top net buyers."""
-        analyzer = SupplyDemandAnalyzer()
-        all_summaries = analyzer.analyze_investor_trading(sample_trading_df)
-        top_buyers = analyzer.get_top_net_buyers(all_summaries, top_n=2)
-
-        assert len(top_buyers) == 2
-        assert top_buyers[0].net_value >= top_buyers[1].net_value
-
-    def test_get_top_net_sellers(self, sample_trading_df: pd.DataFrame) -> None:
-        """Test getting top net sellers."""
-        analyzer = SupplyDemandAnalyzer()
-        all_summaries = analyzer.analyze_investor_trading(sample_trading_df)
-        top_sellers = analyzer.get_top_net_sellers(all_summaries, top_n=2)
+    @pytest.mark.parametrize(
+        ("method", "sort_key"),
+        [
+            ("get_top_net_buyers", lambda s: -s.net_value),
+            ("get_top_net_sellers", lambda s: s.net_value),
+        ],
+        ids=["buyers", "sellers"],
+    )
+    def test_net_trading_selectors(
+        self,
+        investor_summaries: list[InvestorTradingSummary],
+        supply_demand_analyzer: SupplyDemandAnalyzer,
+        method: str,
+        sort_key: Callable[[InvestorTradingSummary], float],
+    ) -> None:
+        """Test top net buyer/seller selectors return ordered slices."""
+        selected = getattr(supply_demand_analyzer, method)(investor_summaries, top_n=2)
 
-        assert len(top_sellers) == 2
-        assert top_sellers[0].net_value <= top_sellers[1].net_value
+        assert len(selected) == 2
+        assert selected == sorted(selected, key=sort_key)
 
-    def test_empty_dataframes(self) -> None:
+    def test_empty_dataframes(self, supply_demand_analyzer: SupplyDemandAnalyzer) -> None:
         """Test with empty dataframes."""
-        analyzer = SupplyDemandAnalyzer()
-        result = analyzer.analyze("2024-01-15", pd.DataFrame(), pd.DataFrame())
+        result = supply_demand_analyzer.analyze("2024-01-15", pd.DataFrame(), pd.DataFrame())
 
         assert len(result.investor_trading) == 0
         assert result.margin_trading is None
+
+
+class TestWeeklyMarketAnalyzer:
+    """Tests for WeeklyMarketAnalyzer."""
+
+    @pytest.fixture(scope="module")
+    def weekly_market_analyzer(self) -> WeeklyMarketAnalyzer:
+        """Create WeeklyMarketAnalyzer instance."""
+        return WeeklyMarketAnalyzer()
+
+    def test_process_daily_changes(self, weekly_market_analyzer: WeeklyMarketAnalyzer) -> None:
+        """Test day-over-day changes per index, skipping missing days."""
+        days = [
+            (datetime.date(2024, 1, 10), pd.DataFrame({"Code": ["0000"], "Close": [2525.0]})),
+            (
+                datetime.date(2024, 1, 8),
+                pd.DataFrame({"Code": ["0000", "0001"], "Close": [2500.0, 0.0]}),
+            ),
+            (datetime.date(2024, 1, 9), pd.DataFrame()),
+            (
+                datetime.date(2024, 1, 11),
+                pd.DataFrame({"Code": ["0001", "0001"], "Close": [100.0, 1.0]}),
+            ),
+        ]
+
+        result = weekly_market_analyzer._process_daily_changes(days)
+
+        topix = result["TOPIX"]
+        assert [d.date for d in topix] == [datetime.date(2024, 1, 8), datetime.date(2024, 1, 10)]
+        assert (topix[0].change, topix[0].change_pct) == (0.0, 0.0)
+        assert topix[1].change == pytest.approx(25.0)
+        assert topix[1].change_pct == pytest.approx(1.0)
+
+        nikkei = result["日経225"]
+        assert [d.close for d in nikkei] == [0.0, 100.0]
+        # A zero previous close yields a zero rate rather than inf
+        assert (nikkei[1].change, nikkei[1].change_pct) == (100.0, 0.0)
+
+    def test_calculate_breadth(self, weekly_market_analyzer: WeeklyMarketAnalyzer) -> None:
+        """Test breadth counts ignore missing returns."""
+        weekly_quotes = pd.DataFrame({"WeeklyReturn": [1.5, -0.2, 0.0, -0.0, np.nan, 3.0, -1.0]})
+
+        result = weekly_market_analyzer._calculate_breadth(weekly_quotes)
+
+        assert result == (2, 2, 2)
+        empty = pd.DataFrame({"WeeklyReturn": []})
+        assert weekly_market_analyzer._calculate_breadth(empty) == (0, 0, 0)
+
+
+class TestWeeklyStockAnalyzer:
+    """Tests for WeeklyStockAnalyzer."""
+
+    @pytest.fixture(scope="module")
+    def weekly_stock_analyzer(self) -> WeeklyStockAnalyzer:
+        """Create WeeklyStockAnalyzer instance."""
+        return WeeklyStockAnalyzer()
+
+    def test_rankings_from_weekly_quotes(self, weekly_stock_analyzer: WeeklyStockAnalyzer) -> None:
+        """Test ranked rows convert with code normalization and missing values."""
+        weekly_quotes = pd.DataFrame(
+            {
+                "Code": ["13010", "72030", "99840"],
+                "CompanyName": ["極洋", "トヨタ自動車", "ソフトバンクG"],
+                "WeekOpen": [100.0, 2000.0, 9000.0],
+                "WeekClose": [110.0, 1900.0, 9000.0],
+                "WeeklyReturn": [10.0, -5.0, np.nan],
+                "WeekVolume": [1000, 5000, 3000],
+                "WeekTurnover": [1e5, 1e7, 2.7e7],
+                "WeekHigh": [115.0, np.nan, 9100.0],
+            }
+        )
+
+        rankings = weekly_stock_analyzer.analyze(datetime.date(2024, 1, 12), weekly_quotes, top_n=2)
+
+        assert [s.code for s in rankings.top_gainers] == ["1301", "7203"]
+        assert [s.code for s in rankings.top_losers] == ["7203", "1301"]
+        assert [s.code for s in rankings.top_turnover] == ["9984", "7203"]
+        toyota = rankings.top_volume[0]
+        assert toyota.name == "トヨタ自動車"
+        assert toyota.sector_name == "不明"
+        assert toyota.week_volume == 5000
+        assert toyota.week_high is None
+        assert toyota.prev_week_close is None
+        assert rankings.top_volume[1].weekly_return_pct == 0.0
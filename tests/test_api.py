@@ -8,6 +8,8 @@ This module contains comprehensive tests for:
 """
 
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
@@ -29,89 +31,179 @@ from jquants_report.api.client import (
 )
 from jquants_report.api.endpoints import JQuantsEndpoints, build_query_params
 
+pytestmark = pytest.mark.xdist_group(name="jquants_api")
+
+_BASE = "https://api.jquants.com/v1"
+_URL_AUTH_USER = f"{_BASE}/token/auth_user"
+_URL_AUTH_REFRESH = f"{_BASE}/token/auth_refresh"
+_URL_LISTED_INFO = f"{_BASE}/listed/info"
+_URL_DAILY_QUOTES = f"{_BASE}/prices/daily_quotes"
+_URL_STATEMENTS = f"{_BASE}/fins/statements"
+_URL_INDICES = f"{_BASE}/indices"
+_URL_TRADES_SPEC = f"{_BASE}/markets/trades_spec"
+
+_RESP_LISTED_INFO = {"info": [{"code": "27800", "name": "Test Company"}]}
+_RESP_DAILY_QUOTES = {
+    "daily_quotes": [
+        {
+            "code": "27800",
+            "date": "2024-01-15",
+            "open": 1000,
+            "high": 1100,
+            "low": 950,
+            "close": 1050,
+        }
+    ]
+}
+_RESP_STATEMENTS = {"statements": [{"code": "27800", "revenue": 1000000}]}
+_RESP_INDICES = {"indices": [{"code": "0000", "value": 30000}]}
+_RESP_TRADES_SPEC = {"trades_spec": [{"section": "TSE1", "foreign_buy": 1000000}]}
+
+_COMPANY_RECORDS = [
+    {"code": "27800", "name": "Company A"},
+    {"code": "27810", "name": "Company B"},
+]
+_EXPECTED_DF = pd.DataFrame(_COMPANY_RECORDS)
+_EMPTY_DF = pd.DataFrame()
+
 
 # ==================== Fixtures ====================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_email() -> str:
     """Return mock email for testing."""
     return "test@example.com"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_password() -> str:
     """Return mock password for testing."""
     return "test_password"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_refresh_token() -> str:
     """Return mock refresh token for testing."""
     return "mock_refresh_token_123"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_id_token() -> str:
     """Return mock ID token for testing."""
     return "mock_id_token_456"
 
 
 @pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> float:
+    """Freeze the clock seen by the auth module and return the frozen time."""
+    frozen = 1_700_000_000.0
+    monkeypatch.setattr("jquants_report.api.auth.time.time", lambda: frozen)
+    return frozen
+
+
+@pytest.fixture(scope="module")
 def base_url() -> str:
     """Return base URL for testing."""
-    return "https://api.jquants.com/v1"
+    return _BASE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def http_session() -> Iterator[requests.Session]:
+    """Create one HTTP session shared by every client under test."""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="module")
 def authenticator(
-    mock_email: str, mock_password: str, base_url: str
+    mock_email: str, mock_password: str, base_url: str, http_session: requests.Session
 ) -> JQuantsAuthenticator:
     """Create authenticator instance for testing."""
     return JQuantsAuthenticator(
         base_url=base_url,
         email=mock_email,
         password=mock_password,
+        session=http_session,
     )
 
 
-@pytest.fixture
-def client(mock_email: str, mock_password: str, base_url: str) -> JQuantsClient:
+@pytest.fixture(scope="module")
+def client(
+    mock_email: str, mock_password: str, base_url: str, http_session: requests.Session
+) -> JQuantsClient:
     """Create client instance for testing."""
     return JQuantsClient(
         email=mock_email,
         password=mock_password,
         base_url=base_url,
         rate_limit_delay=0.1,  # Shorter delay for testing
+        session=http_session,
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_auth_state(authenticator: JQuantsAuthenticator, client: JQuantsClient) -> Iterator[None]:
+    """Drop tokens and rate-limit state the previous test left on shared instances."""
+    yield
+    authenticator.clear_all_tokens()
+    client.authenticator.clear_all_tokens()
+    client._last_request_time = 0.0
+
+
+@pytest.fixture
+def authed_client(client: JQuantsClient, mock_id_token: str, now: float) -> JQuantsClient:
+    """Create client instance holding a valid ID token."""
+    client.authenticator._id_token = TokenInfo(token=mock_id_token, expires_at=now + 3600)
+    return client
+
+
+@pytest.fixture(scope="module")
+def rsps() -> Iterator[responses.RequestsMock]:
+    """Install one mocked requests transport for the whole module.
+
+    Tests register responses in the order the client consumes them, so the
+    ordered registry can pop the next match instead of scanning every mock.
+    """
+    with responses.RequestsMock(
+        assert_all_requests_are_fired=False, registry=responses.registries.OrderedRegistry
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_rsps(rsps: responses.RequestsMock) -> Iterator[None]:
+    """Clear registered responses and recorded calls after each test."""
+    yield
+    rsps.reset()
+
+
 # ==================== TokenInfo Tests ====================
 
 
 class TestTokenInfo:
     """Test TokenInfo class."""
 
-    def test_token_info_creation(self) -> None:
+    def test_token_info_creation(self, now: float) -> None:
         """Test creating a TokenInfo instance."""
-        token = TokenInfo(token="test_token", expires_at=time.time() + 3600)
+        token = TokenInfo(token="test_token", expires_at=now + 3600)
         assert token.token == "test_token"
-        assert token.expires_at > time.time()
+        assert token.expires_at > now
 
-    def test_is_expired_not_expired(self) -> None:
+    def test_is_expired_not_expired(self, now: float) -> None:
         """Test that a fresh token is not expired."""
-        token = TokenInfo(token="test_token", expires_at=time.time() + 3600)
+        token = TokenInfo(token="test_token", expires_at=now + 3600)
         assert not token.is_expired()
 
-    def test_is_expired_expired(self) -> None:
+    def test_is_expired_expired(self, now: float) -> None:
         """Test that an expired token is detected."""
-        token = TokenInfo(token="test_token", expires_at=time.time() - 100)
+        token = TokenInfo(token="test_token", expires_at=now - 100)
         assert token.is_expired()
 
-    def test_is_expired_with_buffer(self) -> None:
+    def test_is_expired_with_buffer(self, now: float) -> None:
         """Test expiration check with buffer."""
         # Token expires in 100 seconds
-        token = TokenInfo(token="test_token", expires_at=time.time() + 100)
+        token = TokenInfo(token="test_token", expires_at=now + 100)
         # With 300 second buffer, should be considered expired
         assert token.is_expired(buffer_seconds=300)
         # With 50 second buffer, should not be expired
@@ -124,14 +216,16 @@ class TestTokenInfo:
 class TestJQuantsAuthenticator:
     """Test JQuantsAuthenticator class."""
 
-    @responses.activate
     def test_get_refresh_token_success(
-        self, authenticator: JQuantsAuthenticator, mock_refresh_token: str
+        self,
+        rsps: responses.RequestsMock,
+        authenticator: JQuantsAuthenticator,
+        mock_refresh_token: str,
     ) -> None:
         """Test successful refresh token acquisition."""
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_user",
+            _URL_AUTH_USER,
             json={"refreshToken": mock_refresh_token},
             status=200,
         )
@@ -140,7 +234,6 @@ class TestJQuantsAuthenticator:
         assert token == mock_refresh_token
         assert authenticator._refresh_token == mock_refresh_token
 
-    @responses.activate
     def test_get_refresh_token_uses_cached(
         self, authenticator: JQuantsAuthenticator, mock_refresh_token: str
     ) -> None:
@@ -150,12 +243,13 @@ class TestJQuantsAuthenticator:
         assert token == mock_refresh_token
         # No HTTP request should be made
 
-    @responses.activate
-    def test_get_refresh_token_failure(self, authenticator: JQuantsAuthenticator) -> None:
+    def test_get_refresh_token_failure(
+        self, rsps: responses.RequestsMock, authenticator: JQuantsAuthenticator
+    ) -> None:
         """Test refresh token acquisition failure."""
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_user",
+            _URL_AUTH_USER,
             json={"error": "Invalid credentials"},
             status=401,
         )
@@ -163,14 +257,13 @@ class TestJQuantsAuthenticator:
         with pytest.raises(AuthenticationError):
             authenticator.get_refresh_token()
 
-    @responses.activate
     def test_get_refresh_token_missing_in_response(
-        self, authenticator: JQuantsAuthenticator
+        self, rsps: responses.RequestsMock, authenticator: JQuantsAuthenticator
     ) -> None:
         """Test handling of missing refresh token in response."""
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_user",
+            _URL_AUTH_USER,
             json={"some_other_field": "value"},
             status=200,
         )
@@ -178,9 +271,9 @@ class TestJQuantsAuthenticator:
         with pytest.raises(AuthenticationError, match="Refresh token not found"):
             authenticator.get_refresh_token()
 
-    @responses.activate
     def test_get_id_token_success(
         self,
+        rsps: responses.RequestsMock,
         authenticator: JQuantsAuthenticator,
         mock_refresh_token: str,
         mock_id_token: str,
@@ -188,9 +281,9 @@ class TestJQuantsAuthenticator:
         """Test successful ID token acquisition."""
         authenticator._refresh_token = mock_refresh_token
 
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_refresh",
+            _URL_AUTH_REFRESH,
             json={"idToken": mock_id_token},
             status=200,
         )
@@ -200,35 +293,35 @@ class TestJQuantsAuthenticator:
         assert authenticator._id_token is not None
         assert authenticator._id_token.token == mock_id_token
 
-    @responses.activate
     def test_get_id_token_uses_cached(
-        self, authenticator: JQuantsAuthenticator, mock_id_token: str
+        self, authenticator: JQuantsAuthenticator, mock_id_token: str, now: float
     ) -> None:
         """Test that cached ID token is used if not expired."""
         authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
+            token=mock_id_token, expires_at=now + 3600
         )
 
         token = authenticator.get_id_token()
         assert token == mock_id_token
         # No HTTP request should be made
 
-    @responses.activate
     def test_get_id_token_refreshes_when_expired(
         self,
+        rsps: responses.RequestsMock,
         authenticator: JQuantsAuthenticator,
         mock_refresh_token: str,
         mock_id_token: str,
+        now: float,
     ) -> None:
         """Test that expired ID token is refreshed."""
         authenticator._refresh_token = mock_refresh_token
         authenticator._id_token = TokenInfo(
-            token="old_token", expires_at=time.time() - 100
+            token="old_token", expires_at=now - 100
         )
 
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_refresh",
+            _URL_AUTH_REFRESH,
             json={"idToken": mock_id_token},
             status=200,
         )
@@ -237,22 +330,23 @@ class TestJQuantsAuthenticator:
         assert token == mock_id_token
         assert authenticator._id_token.token == mock_id_token
 
-    @responses.activate
     def test_get_id_token_force_refresh(
         self,
+        rsps: responses.RequestsMock,
         authenticator: JQuantsAuthenticator,
         mock_refresh_token: str,
         mock_id_token: str,
+        now: float,
     ) -> None:
         """Test forcing ID token refresh."""
         authenticator._refresh_token = mock_refresh_token
         authenticator._id_token = TokenInfo(
-            token="old_token", expires_at=time.time() + 3600
+            token="old_token", expires_at=now + 3600
         )
 
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_refresh",
+            _URL_AUTH_REFRESH,
             json={"idToken": mock_id_token},
             status=200,
         )
@@ -260,9 +354,34 @@ class TestJQuantsAuthenticator:
         token = authenticator.get_id_token(force_refresh=True)
         assert token == mock_id_token
 
-    @responses.activate
+    def test_get_id_token_concurrent_refresh_once(
+        self,
+        rsps: responses.RequestsMock,
+        authenticator: JQuantsAuthenticator,
+        mock_refresh_token: str,
+        mock_id_token: str,
+        now: float,
+    ) -> None:
+        """Test that threads racing on an expired token trigger one refresh."""
+        authenticator._refresh_token = mock_refresh_token
+        authenticator._id_token = TokenInfo(token="old_token", expires_at=now - 100)
+
+        rsps.add(
+            responses.POST,
+            _URL_AUTH_REFRESH,
+            json={"idToken": mock_id_token},
+            status=200,
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda _: authenticator.get_id_token(), range(8)))
+
+        assert tokens == [mock_id_token] * 8
+        assert len(rsps.calls) == 1
+
     def test_get_auth_headers(
         self,
+        rsps: responses.RequestsMock,
         authenticator: JQuantsAuthenticator,
         mock_refresh_token: str,
         mock_id_token: str,
@@ -270,9 +389,9 @@ class TestJQuantsAuthenticator:
         """Test getting authentication headers."""
         authenticator._refresh_token = mock_refresh_token
 
-        responses.add(
+        rsps.add(
             responses.POST,
-            f"{authenticator.base_url}/token/auth_refresh",
+            _URL_AUTH_REFRESH,
             json={"idToken": mock_id_token},
             status=200,
         )
@@ -282,11 +401,11 @@ class TestJQuantsAuthenticator:
         assert headers["Authorization"] == f"Bearer {mock_id_token}"
 
     def test_invalidate_tokens(
-        self, authenticator: JQuantsAuthenticator, mock_id_token: str
+        self, authenticator: JQuantsAuthenticator, mock_id_token: str, now: float
     ) -> None:
         """Test invalidating cached tokens."""
         authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
+            token=mock_id_token, expires_at=now + 3600
         )
         authenticator.invalidate_tokens()
         assert authenticator._id_token is None
@@ -296,11 +415,12 @@ class TestJQuantsAuthenticator:
         authenticator: JQuantsAuthenticator,
         mock_refresh_token: str,
         mock_id_token: str,
+        now: float,
     ) -> None:
         """Test clearing all tokens."""
         authenticator._refresh_token = mock_refresh_token
         authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
+            token=mock_id_token, expires_at=now + 3600
         )
 
         authenticator.clear_all_tokens()
@@ -360,244 +480,168 @@ class TestJQuantsClient:
         assert client.rate_limit_delay == 0.1
         assert client.authenticator is not None
 
-    def test_rate_limiting(self, client: JQuantsClient) -> None:
+    def test_rate_limiting(self, client: JQuantsClient, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that rate limiting is enforced."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("jquants_report.api.client.time.sleep", sleeps.append)
+
         client._last_request_time = time.time()
-        start_time = time.time()
         client._enforce_rate_limit()
-        elapsed = time.time() - start_time
-        # Should have waited approximately rate_limit_delay seconds
-        assert elapsed >= client.rate_limit_delay * 0.9  # Allow some tolerance
 
-    @responses.activate
-    def test_make_request_success(self, client: JQuantsClient, mock_id_token: str) -> None:
-        """Test successful API request."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/listed/info",
-            json={"info": [{"code": "27800", "name": "Test Company"}]},
-            status=200,
-        )
+        # Should have waited approximately rate_limit_delay seconds
+        assert len(sleeps) == 1
+        assert sleeps[0] >= client.rate_limit_delay * 0.9  # Allow some tolerance
 
-        result = client._make_request("/listed/info", params={"code": "27800"})
-        assert "info" in result
-        assert len(result["info"]) == 1
+        # Once the delay has passed no wait is needed
+        client._last_request_time = time.time() - client.rate_limit_delay
+        client._enforce_rate_limit()
+        assert len(sleeps) == 1
 
-    @responses.activate
-    def test_make_request_401_invalidates_token(
-        self, client: JQuantsClient, mock_id_token: str
+    def test_rate_limiting_concurrent(
+        self, client: JQuantsClient, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test that 401 error invalidates token."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
+        """Test that concurrent callers are given distinct, spaced request slots."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("jquants_report.api.client.time.sleep", sleeps.append)
+        monkeypatch.setattr("jquants_report.api.client.time.time", lambda: 1_700_000_000.0)
 
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/listed/info",
-            json={"error": "Unauthorized"},
-            status=401,
-        )
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(lambda _: client._enforce_rate_limit(), range(5)))
 
-        with pytest.raises(AuthenticationError):
-            client._make_request("/listed/info")
+        # The first caller goes at once; the rest wait one more delay each
+        delay = client.rate_limit_delay
+        assert sorted(sleeps) == pytest.approx([delay, 2 * delay, 3 * delay, 4 * delay])
 
-        # Token should be invalidated
-        assert client.authenticator._id_token is None
-
-    @responses.activate
-    def test_make_request_404_raises_not_found(
-        self, client: JQuantsClient, mock_id_token: str
+    def test_make_request_success(
+        self, rsps: responses.RequestsMock, authed_client: JQuantsClient
     ) -> None:
-        """Test that 404 raises NotFoundError."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
+        """Test successful API request."""
+        rsps.add(
             responses.GET,
-            f"{client.base_url}/nonexistent",
-            json={"error": "Not found"},
-            status=404,
+            _URL_LISTED_INFO,
+            json=_RESP_LISTED_INFO,
+            status=200,
         )
 
-        with pytest.raises(NotFoundError):
-            client._make_request("/nonexistent")
+        result = authed_client._make_request("/listed/info", params={"code": "27800"})
+        assert "info" in result
+        assert len(result["info"]) == 1
 
-    @responses.activate
-    def test_make_request_429_raises_rate_limit(
-        self, client: JQuantsClient, mock_id_token: str
+    @pytest.mark.parametrize(
+        ("status", "expected_error", "match"),
+        [
+            (401, AuthenticationError, None),
+            (404, NotFoundError, None),
+            (429, RateLimitError, None),
+            (500, APIError, "Server error"),
+        ],
+        ids=["401", "404", "429", "500"],
+    )
+    def test_make_request_error_status(
+        self,
+        rsps: responses.RequestsMock,
+        authed_client: JQuantsClient,
+        status: int,
+        expected_error: type[Exception],
+        match: str | None,
     ) -> None:
-        """Test that 429 raises RateLimitError."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
+        """Test that error statuses raise the matching exception."""
+        rsps.add(
             responses.GET,
-            f"{client.base_url}/listed/info",
-            json={"error": "Rate limit exceeded"},
-            status=429,
+            _URL_LISTED_INFO,
+            json={"error": "Request failed"},
+            status=status,
         )
 
-        with pytest.raises(RateLimitError):
-            client._make_request("/listed/info")
+        with pytest.raises(expected_error, match=match):
+            authed_client._make_request("/listed/info")
 
-    @responses.activate
-    def test_make_request_500_raises_api_error(
-        self, client: JQuantsClient, mock_id_token: str
-    ) -> None:
-        """Test that 500 raises APIError."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/listed/info",
-            json={"error": "Internal server error"},
-            status=500,
-        )
-
-        with pytest.raises(APIError, match="Server error"):
-            client._make_request("/listed/info")
+        # Only an authentication failure drops the cached token
+        assert (authed_client.authenticator._id_token is None) == (status == 401)
 
     def test_to_dataframe_with_data(self, client: JQuantsClient) -> None:
         """Test converting API response to DataFrame."""
-        response = {
-            "data": [
-                {"code": "27800", "name": "Company A"},
-                {"code": "27810", "name": "Company B"},
-            ]
-        }
-        df = client._to_dataframe(response, "data")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 2
-        assert "code" in df.columns
+        df = client._to_dataframe({"data": _COMPANY_RECORDS}, "data")
+        pd.testing.assert_frame_equal(df, _EXPECTED_DF)
 
     def test_to_dataframe_empty(self, client: JQuantsClient) -> None:
         """Test converting empty response to DataFrame."""
-        response = {"data": []}
-        df = client._to_dataframe(response, "data")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 0
+        df = client._to_dataframe({"data": []}, "data")
+        pd.testing.assert_frame_equal(df, _EMPTY_DF)
 
     def test_to_dataframe_missing_key(self, client: JQuantsClient) -> None:
         """Test handling missing key in response."""
-        response = {"other_key": []}
-        df = client._to_dataframe(response, "data")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 0
-
-    @responses.activate
-    def test_get_listed_info(self, client: JQuantsClient, mock_id_token: str) -> None:
-        """Test getting listed company information."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/listed/info",
-            json={"info": [{"code": "27800", "name": "Test Company"}]},
-            status=200,
-        )
-
-        df = client.get_listed_info(code="27800")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 1
-
-    @responses.activate
-    def test_get_daily_quotes(self, client: JQuantsClient, mock_id_token: str) -> None:
-        """Test getting daily quotes."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/prices/daily_quotes",
-            json={
-                "daily_quotes": [
-                    {
-                        "code": "27800",
-                        "date": "2024-01-15",
-                        "open": 1000,
-                        "high": 1100,
-                        "low": 950,
-                        "close": 1050,
-                    }
-                ]
-            },
-            status=200,
-        )
-
-        df = client.get_daily_quotes(code="27800", date="20240115")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 1
-        assert "close" in df.columns
-
-    @responses.activate
-    def test_get_financial_statements(
-        self, client: JQuantsClient, mock_id_token: str
+        df = client._to_dataframe({"other_key": []}, "data")
+        pd.testing.assert_frame_equal(df, _EMPTY_DF)
+
+    @pytest.mark.parametrize(
+        ("method", "kwargs", "url", "body"),
+        [
+            ("get_listed_info", {"code": "27800"}, _URL_LISTED_INFO, _RESP_LISTED_INFO),
+            (
+                "get_daily_quotes",
+                {"code": "27800", "date": "20240115"},
+                _URL_DAILY_QUOTES,
+                _RESP_DAILY_QUOTES,
+            ),
+            ("get_financial_statements", {"code": "27800"}, _URL_STATEMENTS, _RESP_STATEMENTS),
+            ("get_indices", {"code": "0000", "date": "20240115"}, _URL_INDICES, _RESP_INDICES),
+            (
+                "get_trades_by_investor_type",
+                {"section": "TSE1"},
+                _URL_TRADES_SPEC,
+                _RESP_TRADES_SPEC,
+            ),
+        ],
+    )
+    def test_get_methods_return_dataframe(
+        self,
+        rsps: responses.RequestsMock,
+        authed_client: JQuantsClient,
+        method: str,
+        kwargs: dict[str, str],
+        url: str,
+        body: dict[str, list[dict[str, object]]],
     ) -> None:
-        """Test getting financial statements."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/fins/statements",
-            json={"statements": [{"code": "27800", "revenue": 1000000}]},
-            status=200,
-        )
+        """Test endpoint getters turn the response records into a DataFrame."""
+        rsps.add(responses.GET, url, json=body, status=200)
 
-        df = client.get_financial_statements(code="27800")
+        df = getattr(authed_client, method)(**kwargs)
         assert isinstance(df, pd.DataFrame)
-        assert len(df) == 1
-
-    @responses.activate
-    def test_get_indices(self, client: JQuantsClient, mock_id_token: str) -> None:
-        """Test getting index data."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
+        assert df.to_dict("records") == next(iter(body.values()))
 
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/indices",
-            json={"indices": [{"code": "0000", "value": 30000}]},
-            status=200,
-        )
-
-        df = client.get_indices(code="0000", date="20240115")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 1
-
-    @responses.activate
-    def test_get_trades_by_investor_type(
-        self, client: JQuantsClient, mock_id_token: str
+    def test_get_daily_quotes_follows_pagination(
+        self, rsps: responses.RequestsMock, authed_client: JQuantsClient
     ) -> None:
-        """Test getting trading by investor type."""
-        client.authenticator._id_token = TokenInfo(
-            token=mock_id_token, expires_at=time.time() + 3600
-        )
-
-        responses.add(
-            responses.GET,
-            f"{client.base_url}/markets/trades_spec",
-            json={"trades_spec": [{"section": "TSE1", "foreign_buy": 1000000}]},
-            status=200,
-        )
-
-        df = client.get_trades_by_investor_type(section="TSE1")
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 1
+        """Test daily quotes from every page end up in one DataFrame."""
+        pages = [
+            {"daily_quotes": [{"code": "27800", "page": 1}], "pagination_key": "k1"},
+            {"daily_quotes": [{"code": "27800", "page": 2}], "pagination_key": "k2"},
+            {"daily_quotes": [{"code": "27800", "page": 3}]},
+        ]
+        for page in pages:
+            rsps.add(responses.GET, _URL_DAILY_QUOTES, json=page, status=200)
+
+        df = authed_client.get_daily_quotes(code="27800", from_date="20240101", to_date="20240131")
+
+        assert df["page"].tolist() == [1, 2, 3]
+        assert "pagination_key" not in rsps.calls[0].request.url
+        assert "pagination_key=k2" in rsps.calls[2].request.url
+
+    def test_get_daily_quotes_repeated_pagination_key(
+        self, rsps: responses.RequestsMock, authed_client: JQuantsClient
+    ) -> None:
+        """Test a pagination key the API already returned stops paging."""
+        pages = [
+            {"daily_quotes": [{"code": "27800", "page": 1}], "pagination_key": "k1"},
+            {"daily_quotes": [{"code": "27800", "page": 2}], "pagination_key": "k1"},
+        ]
+        for page in pages:
+            rsps.add(responses.GET, _URL_DAILY_QUOTES, json=page, status=200)
+
+        with pytest.raises(APIError, match="Repeated pagination key"):
+            authed_client.get_daily_quotes(code="27800")
+        assert len(rsps.calls) == 2
 
     def test_get_refresh_token(self, client: JQuantsClient, mock_refresh_token: str) -> None:
         """Test getting refresh token from client."""
@@ -616,76 +660,68 @@ class TestJQuantsClient:
 # ==================== Integration-like Tests ====================
 
 
+_MockSpec = tuple[str, str, dict[str, object], int]
+
+# Password login, ID token exchange, then one API call
+_FLOW_MOCKS: list[_MockSpec] = [
+    (responses.POST, _URL_AUTH_USER, {"refreshToken": "refresh_123"}, 200),
+    (responses.POST, _URL_AUTH_REFRESH, {"idToken": "id_456"}, 200),
+    (responses.GET, _URL_LISTED_INFO, _RESP_LISTED_INFO, 200),
+]
+
+# ID token exchange, then a failing call that succeeds on retry
+_RETRY_MOCKS: list[_MockSpec] = [
+    (responses.POST, _URL_AUTH_REFRESH, {"idToken": "id_456"}, 200),
+    (responses.GET, _URL_LISTED_INFO, {"error": "Temporary error"}, 500),
+    (responses.GET, _URL_LISTED_INFO, _RESP_LISTED_INFO, 200),
+]
+
+
+def _register(rsps: responses.RequestsMock, mocks: list[_MockSpec]) -> None:
+    """Register mocked responses in the order the client will consume them."""
+    for method, url, body, status in mocks:
+        rsps.add(method, url, json=body, status=status)
+
+
 class TestIntegration:
     """Integration-like tests for the complete flow."""
 
-    @responses.activate
     def test_complete_authentication_flow(
-        self, mock_email: str, mock_password: str, base_url: str
+        self,
+        rsps: responses.RequestsMock,
+        mock_email: str,
+        mock_password: str,
+        base_url: str,
+        http_session: requests.Session,
     ) -> None:
         """Test complete authentication flow from email/password to API call."""
-        # Mock refresh token acquisition
-        responses.add(
-            responses.POST,
-            f"{base_url}/token/auth_user",
-            json={"refreshToken": "refresh_123"},
-            status=200,
-        )
-
-        # Mock ID token acquisition
-        responses.add(
-            responses.POST,
-            f"{base_url}/token/auth_refresh",
-            json={"idToken": "id_456"},
-            status=200,
-        )
+        _register(rsps, _FLOW_MOCKS)
 
-        # Mock API call
-        responses.add(
-            responses.GET,
-            f"{base_url}/listed/info",
-            json={"info": [{"code": "27800"}]},
-            status=200,
+        client = JQuantsClient(
+            email=mock_email, password=mock_password, base_url=base_url, session=http_session
         )
-
-        client = JQuantsClient(email=mock_email, password=mock_password, base_url=base_url)
         df = client.get_listed_info(code="27800")
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 1
 
-    @responses.activate
     def test_retry_on_failure(
-        self, mock_email: str, mock_password: str, base_url: str
+        self,
+        rsps: responses.RequestsMock,
+        mock_email: str,
+        mock_password: str,
+        base_url: str,
+        http_session: requests.Session,
     ) -> None:
         """Test that requests are retried on failure."""
-        # Mock authentication
-        responses.add(
-            responses.POST,
-            f"{base_url}/token/auth_refresh",
-            json={"idToken": "id_456"},
-            status=200,
-        )
-
-        # First request fails, second succeeds
-        responses.add(
-            responses.GET,
-            f"{base_url}/listed/info",
-            json={"error": "Temporary error"},
-            status=500,
-        )
-        responses.add(
-            responses.GET,
-            f"{base_url}/listed/info",
-            json={"info": [{"code": "27800"}]},
-            status=200,
-        )
+        _register(rsps, _RETRY_MOCKS)
 
         client = JQuantsClient(
             email=mock_email,
             password=mock_password,
             base_url=base_url,
             refresh_token="refresh_123",
+            session=http_session,
         )
 
         df = client.get_listed_info(code="27800")
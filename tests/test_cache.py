@@ -1,11 +1,9 @@
 """Tests for cache manager module."""
 
 import sqlite3
-import tempfile
 import threading
-import time
 from datetime import datetime, timedelta
-from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -13,14 +11,26 @@ import pytest
 from jquants_report.data.cache import CacheManager
 
 
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2024, 1, 15, 9, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs: float) -> None:
+        self.now += timedelta(**kwargs)
+
+
 class TestCacheManager:
     """Test cases for CacheManager class."""
 
     @pytest.fixture
-    def temp_cache_dir(self):
+    def temp_cache_dir(self, tmp_path_factory):
         """Create temporary cache directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path_factory.mktemp("cache")
 
     @pytest.fixture
     def cache_manager(self, temp_cache_dir):
@@ -28,8 +38,18 @@ class TestCacheManager:
         return CacheManager(temp_cache_dir, default_ttl_hours=24)
 
     @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def clocked_cache_manager(self, temp_cache_dir, clock):
+        """Create CacheManager instance driven by the fake clock."""
+        return CacheManager(temp_cache_dir, default_ttl_hours=24, clock=clock)
+
+    @pytest.fixture(scope="module")
     def sample_dataframe(self):
-        """Create sample DataFrame for testing."""
+        """Create sample DataFrame shared by the module; tests must not mutate it."""
         return pd.DataFrame(
             {
                 "code": ["1301", "1302", "1303"],
@@ -58,17 +78,14 @@ class TestCacheManager:
         result = cache_manager.get("nonexistent_key")
         assert result is None
 
-    def test_cache_expiration(self, cache_manager, sample_dataframe):
+    def test_cache_expiration(self, clocked_cache_manager, clock, sample_dataframe):
         """Test cache expiration."""
         key = "expiring_data"
-        # Set cache with very short TTL
-        cache_manager.set(key, sample_dataframe, ttl_hours=0.0001)
-
-        # Wait for expiration
-        time.sleep(0.5)
+        clocked_cache_manager.set(key, sample_dataframe, ttl_hours=1)
+        clock.advance(hours=1)
 
         # Should return None after expiration
-        result = cache_manager.get(key)
+        result = clocked_cache_manager.get(key)
         assert result is None
 
     def test_cache_not_expired(self, cache_manager, sample_dataframe):
@@ -97,9 +114,7 @@ class TestCacheManager:
 
     def test_clear_all_cache(self, cache_manager, sample_dataframe):
         """Test clearing all cache entries."""
-        cache_manager.set("key1", sample_dataframe)
-        cache_manager.set("key2", sample_dataframe)
-        cache_manager.set("key3", sample_dataframe)
+        cache_manager.set_many(dict.fromkeys(("key1", "key2", "key3"), sample_dataframe))
 
         # Clear all
         cache_manager.clear_all()
@@ -109,6 +124,14 @@ class TestCacheManager:
         assert cache_manager.get("key2") is None
         assert cache_manager.get("key3") is None
 
+    def test_set_many(self, cache_manager, sample_dataframe):
+        """Test batch writes store every non-empty frame."""
+        cache_manager.set_many({"batch_a": sample_dataframe, "batch_empty": pd.DataFrame()})
+        cache_manager._memory.clear()
+
+        pd.testing.assert_frame_equal(cache_manager.get("batch_a"), sample_dataframe)
+        assert cache_manager.get("batch_empty") is None
+
     def test_empty_dataframe_not_cached(self, cache_manager):
         """Test that empty DataFrames are not cached."""
         key = "empty_test"
@@ -137,23 +160,18 @@ class TestCacheManager:
         new_size = cache_manager.get_cache_size()
         assert new_size >= initial_size  # Size should not decrease
 
-    def test_cleanup_expired(self, cache_manager, sample_dataframe):
+    def test_cleanup_expired(self, clocked_cache_manager, clock, sample_dataframe):
         """Test cleanup of expired entries."""
         # Set one with short TTL and one with long TTL
-        cache_manager.set("short_ttl", sample_dataframe, ttl_hours=0.0001)
-        cache_manager.set("long_ttl", sample_dataframe, ttl_hours=24)
-
-        # Wait for short TTL to expire
-        time.sleep(0.5)
-
-        # Cleanup
-        removed_count = cache_manager.cleanup_expired()
+        clocked_cache_manager.set("short_ttl", sample_dataframe, ttl_hours=1)
+        clocked_cache_manager.set("long_ttl", sample_dataframe, ttl_hours=24)
+        clock.advance(hours=2)
 
-        # One should be removed
-        assert removed_count >= 1
+        # Only the short TTL entry should be removed
+        assert clocked_cache_manager.cleanup_expired() == 1
 
         # Long TTL should still exist
-        assert cache_manager.get("long_ttl") is not None
+        assert clocked_cache_manager.get("long_ttl") is not None
 
     def test_special_characters_in_key(self, cache_manager, sample_dataframe):
         """Test handling of special characters in cache keys."""
@@ -222,6 +240,22 @@ class TestCacheManager:
 
         conn.close()
 
+    def test_reopen_skips_schema_setup(self, cache_manager, sample_dataframe):
+        """Test reopening a current database keeps entries and skips DDL."""
+        cache_manager.set("kept", sample_dataframe)
+        conn = sqlite3.connect(str(cache_manager._db_path))
+        conn.execute("DROP INDEX idx_expires_at")
+        conn.commit()
+        conn.close()
+
+        reopened = CacheManager(cache_manager.cache_dir, memory_items=0)
+
+        pd.testing.assert_frame_equal(reopened.get("kept"), sample_dataframe)
+        conn = sqlite3.connect(str(cache_manager._db_path))
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        conn.close()
+        assert "idx_expires_at" not in indexes
+
     def test_migration_from_parquet(self, temp_cache_dir):
         """Test migration of existing parquet files."""
         # Create sample parquet and meta files before CacheManager init
@@ -246,6 +280,21 @@ class TestCacheManager:
         assert not parquet_path.exists()
         assert not meta_path.exists()
 
+    def test_migration_batches_many_files(self, temp_cache_dir):
+        """Test every parquet file is migrated in one batch."""
+        expires_at = (datetime.now() + timedelta(hours=24)).isoformat()
+        for i in range(100):
+            pd.DataFrame({"a": [i]}).to_parquet(temp_cache_dir / f"key_{i}.parquet", index=False)
+            (temp_cache_dir / f"key_{i}.meta").write_text(expires_at)
+
+        cache_manager = CacheManager(temp_cache_dir, memory_items=0)
+
+        assert not list(temp_cache_dir.glob("*.parquet"))
+        assert cache_manager.get("key_42")["a"].tolist() == [42]
+        conn = sqlite3.connect(str(temp_cache_dir / "cache.db"))
+        assert conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] == 100
+        conn.close()
+
     def test_migration_skips_expired(self, temp_cache_dir):
         """Test migration skips expired files."""
         sample_df = pd.DataFrame({"a": [1, 2, 3]})
@@ -300,8 +349,9 @@ class TestCacheManager:
 
         def writer(thread_id: int) -> None:
             try:
-                for i in range(5):
-                    cache_manager.set(f"concurrent_key_{thread_id}_{i}", sample_dataframe)
+                cache_manager.set_many(
+                    {f"concurrent_key_{thread_id}_{i}": sample_dataframe for i in range(5)}
+                )
             except Exception as e:
                 errors.append(e)
 
@@ -332,3 +382,47 @@ class TestCacheManager:
 
         # Check values match
         pd.testing.assert_frame_equal(result, sample_dataframe)
+
+    def test_memory_cache_serves_repeated_reads(self, cache_manager, sample_dataframe):
+        """Test repeated reads are served from memory without unpickling."""
+        cache_manager.set("memo_key", sample_dataframe)
+        cache_manager._memory.clear()
+        cache_manager.get("memo_key")
+
+        with patch.object(cache_manager, "_deserialize_dataframe") as deserialize:
+            result = cache_manager.get("memo_key")
+
+        deserialize.assert_not_called()
+        pd.testing.assert_frame_equal(result, sample_dataframe)
+
+    def test_memory_cache_isolated_from_mutation(self, cache_manager, sample_dataframe):
+        """Test mutating a returned frame does not change later reads."""
+        cache_manager.set("memo_key", sample_dataframe)
+
+        first = cache_manager.get("memo_key")
+        first["price"] = 0
+        first["extra"] = 1
+
+        second = cache_manager.get("memo_key")
+        assert second["price"].tolist() == [100, 200, 300]
+        assert "extra" not in second.columns
+
+    def test_memory_cache_eviction_and_invalidation(self, temp_cache_dir, sample_dataframe):
+        """Test the memory cache is bounded and follows invalidation."""
+        cache_manager = CacheManager(temp_cache_dir, memory_items=2)
+        for i in range(3):
+            cache_manager.set(f"key_{i}", sample_dataframe)
+
+        assert list(cache_manager._memory) == ["key_1", "key_2"]
+
+        cache_manager.invalidate("key_2")
+        assert "key_2" not in cache_manager._memory
+        assert cache_manager.get("key_2") is None
+
+    def test_memory_cache_disabled(self, temp_cache_dir, sample_dataframe):
+        """Test memory_items=0 keeps nothing in memory."""
+        cache_manager = CacheManager(temp_cache_dir, memory_items=0)
+        cache_manager.set("key", sample_dataframe)
+
+        assert cache_manager.get("key") is not None
+        assert len(cache_manager._memory) == 0
@@ -5,6 +5,7 @@ import pytest
 import tempfile
 from datetime import date, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 
 from jquants_report.data.cache import CacheManager
@@ -25,9 +26,9 @@ class TestDataFetcher:
         """Create CacheManager instance."""
         return CacheManager(temp_cache_dir, default_ttl_hours=24)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_api_client(self):
-        """Create mock API client."""
+        """Create mock API client shared by the module."""
         client = Mock()
 
         # Mock listed info response
@@ -73,6 +74,12 @@ class TestDataFetcher:
 
         return client
 
+    @pytest.fixture(autouse=True)
+    def _reset_mock_api_client(self, mock_api_client):
+        """Clear recorded calls on the shared mock after each test."""
+        yield
+        mock_api_client.reset_mock()
+
     @pytest.fixture
     def data_fetcher(self, mock_api_client, cache_manager):
         """Create DataFetcher instance."""
@@ -211,29 +218,28 @@ class TestDataFetcher:
     def test_missing_api_method(self, cache_manager):
         """Test handling of missing API methods."""
         # Create client without expected method
-        incomplete_client = Mock(spec=[])
+        incomplete_client = SimpleNamespace()
 
         fetcher = DataFetcher(incomplete_client, cache_manager)
         result = fetcher.fetch_listed_info()
 
-        # Should return empty DataFrame
+        # Should return empty DataFrame without reserving a request slot
         assert result.empty
+        assert fetcher._last_request_time == 0.0
 
-    def test_rate_limiting(self, data_fetcher, mock_api_client):
+    def test_rate_limiting(self, data_fetcher, monkeypatch):
         """Test rate limiting between API calls."""
-        import time
+        sleeps = []
+        monkeypatch.setattr("jquants_report.data.fetcher.time.sleep", sleeps.append)
+        monkeypatch.setattr("jquants_report.data.fetcher.time.time", lambda: 1000.0)
 
         target_date = date(2024, 1, 15)
 
-        # Make multiple consecutive calls
-        start_time = time.time()
+        # The first call goes straight out, the second waits one full interval
         data_fetcher.fetch_daily_quotes(target_date, force_refresh=True)
         data_fetcher.fetch_indices(target_date, force_refresh=True)
-        end_time = time.time()
 
-        # Should take at least MIN_REQUEST_INTERVAL seconds
-        elapsed = end_time - start_time
-        assert elapsed >= DataFetcher.MIN_REQUEST_INTERVAL
+        assert sleeps == [DataFetcher.MIN_REQUEST_INTERVAL]
 
     def test_different_response_formats(self, cache_manager):
         """Test handling different API response formats."""
@@ -278,3 +284,40 @@ class TestDataFetcher:
         result = fetcher.fetch_daily_quotes(date(2024, 1, 15))
 
         assert result.empty
+
+    def test_fetch_daily_quotes_batch(self, data_fetcher, cache_manager, mock_api_client):
+        """Test batch fetch returns a frame per date and serves cache hits."""
+        dates = [date(2024, 1, 15), date(2024, 1, 16)]
+        cache_manager.set(
+            "daily_quotes_2024-01-16", pd.DataFrame({"Code": ["1301"], "Close": [106]})
+        )
+
+        results = data_fetcher.fetch_daily_quotes_batch(dates)
+
+        assert list(results) == dates
+        assert len(results[date(2024, 1, 15)]) == 1
+        assert results[date(2024, 1, 16)]["Close"].iloc[0] == 106
+        assert mock_api_client.get_daily_quotes.call_count == 1
+
+    def test_fetch_indices_batch(self, data_fetcher, cache_manager, mock_api_client):
+        """Test batch index fetch returns a frame per date and serves cache hits."""
+        dates = [date(2024, 1, 15), date(2024, 1, 16)]
+        cache_manager.set("indices_2024-01-16", pd.DataFrame({"Code": ["0000"], "Close": [2510.0]}))
+
+        results = data_fetcher.fetch_indices_batch(dates)
+
+        assert list(results) == dates
+        assert not results[date(2024, 1, 15)].empty
+        assert results[date(2024, 1, 16)]["Close"].iloc[0] == 2510.0
+        assert mock_api_client.get_indices.call_count == 1
+
+    def test_fetch_daily_quotes_batch_warm_cache(self, data_fetcher, cache_manager, mock_api_client):
+        """Test batch fetch makes no API calls when every date is cached."""
+        dates = [date(2024, 1, 15), date(2024, 1, 16)]
+        for d in dates:
+            cache_manager.set(f"daily_quotes_{d.isoformat()}", pd.DataFrame({"Code": ["1301"]}))
+
+        results = data_fetcher.fetch_daily_quotes_batch(dates)
+
+        assert list(results) == dates
+        mock_api_client.get_daily_quotes.assert_not_called()
@@ -1,10 +1,19 @@
 """Tests for data processor module."""
 
+import logging
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
 import pytest
-from datetime import datetime
 
-from jquants_report.data.processor import DataProcessor
+from jquants_report.data.processor import (
+    DataProcessor,
+    downcast_quotes,
+    index_company_info,
+    pct_change,
+    previous_in_group,
+)
 
 
 class TestDataProcessor:
@@ -18,25 +27,29 @@ class TestDataProcessor:
     @pytest.fixture
     def sample_daily_quotes(self):
         """Create sample daily quotes data."""
-        return pd.DataFrame({
-            "Code": ["1301", "1301", "1302"],
-            "Date": ["2024-01-15", "2024-01-16", "2024-01-15"],
-            "Open": ["100", "102", "200"],
-            "High": ["105", "108", "210"],
-            "Low": ["98", "101", "195"],
-            "Close": ["103", "106", "205"],
-            "Volume": ["1000000", "1200000", "500000"],
-        })
+        return pd.DataFrame(
+            {
+                "Code": ["1301", "1301", "1302"],
+                "Date": ["2024-01-15", "2024-01-16", "2024-01-15"],
+                "Open": ["100", "102", "200"],
+                "High": ["105", "108", "210"],
+                "Low": ["98", "101", "195"],
+                "Close": ["103", "106", "205"],
+                "Volume": ["1000000", "1200000", "500000"],
+            }
+        )
 
     @pytest.fixture
     def sample_listed_info(self):
         """Create sample listed info data."""
-        return pd.DataFrame({
-            "Code": ["1301", "1302", "1301"],  # Duplicate to test deduplication
-            "CompanyName": ["Company A", "Company B", "Company A Updated"],
-            "Sector17Code": ["1", "2", "1"],
-            "MarketCode": ["0111", "0111", "0111"],
-        })
+        return pd.DataFrame(
+            {
+                "Code": ["1301", "1302", "1301"],  # Duplicate to test deduplication
+                "CompanyName": ["Company A", "Company B", "Company A Updated"],
+                "Sector17Code": ["1", "2", "1"],
+                "MarketCode": ["0111", "0111", "0111"],
+            }
+        )
 
     def test_process_daily_quotes(self, processor, sample_daily_quotes):
         """Test processing daily quotes data."""
@@ -50,6 +63,7 @@ class TestDataProcessor:
         # Check data types
         assert pd.api.types.is_datetime64_any_dtype(result["date"])
         assert pd.api.types.is_numeric_dtype(result["close"])
+        assert result["code"].dtype.name == "category"
 
         # Check derived columns
         assert "price_change" in result.columns
@@ -58,6 +72,46 @@ class TestDataProcessor:
         # Check sorting
         assert result["code"].tolist() == ["1301", "1301", "1302"]
 
+    def test_process_daily_quotes_large(self, processor):
+        """Test numeric coercion over a realistic batch of string quotes."""
+        n = 10_000
+        prices = np.arange(n) % 500 + 100
+        raw = pd.DataFrame(
+            {
+                "Code": [f"{1300 + i % 4000}0" for i in range(n)],
+                "Date": ["2024-01-15"] * n,
+                "Open": prices.astype(str),
+                "Close": (prices + 1).astype(str),
+                "Volume": ["1000"] * (n - 1) + ["n/a"],
+            }
+        )
+
+        result = processor.process_daily_quotes(raw)
+
+        assert len(result) == n
+        assert result["open"].sum() == prices.sum()
+        assert (result["price_change"] == 1).all()
+        assert result["volume"].isna().sum() == 1
+
+    def test_process_daily_quotes_numeric_input_skips_parsing(self, processor, caplog):
+        """Test already-numeric quote columns are not parsed again."""
+        caplog.set_level(logging.DEBUG, logger="jquants_report.data.processor")
+        raw = pd.DataFrame(
+            {
+                "Code": ["1301", "1302"],
+                "Date": ["2024-01-15", "2024-01-15"],
+                "Open": [100.0, 200.0],
+                "Close": [103.0, 205.0],
+                "Volume": [1000, 2000],
+            }
+        )
+
+        result = processor.process_daily_quotes(raw)
+
+        assert "to numeric" not in caplog.text
+        assert result["close"].tolist() == [103.0, 205.0]
+        assert result["volume"].dtype == np.int64
+
     def test_process_daily_quotes_empty(self, processor):
         """Test processing empty daily quotes data."""
         empty_df = pd.DataFrame()
@@ -72,6 +126,8 @@ class TestDataProcessor:
         assert "code" in result.columns
         assert "company_name" in result.columns
 
+        assert result["code"].dtype.name == "category"
+
         # Check deduplication (should keep last)
         assert len(result) == 2
         company_a = result[result["code"] == "1301"]
@@ -79,13 +135,15 @@ class TestDataProcessor:
 
     def test_process_indices(self, processor):
         """Test processing index data."""
-        sample_data = pd.DataFrame({
-            "Date": ["2024-01-15", "2024-01-16"],
-            "Code": ["0000", "0000"],
-            "IndexName": ["TOPIX", "TOPIX"],
-            "Open": ["2500.0", "2520.0"],
-            "Close": ["2510.0", "2530.0"],
-        })
+        sample_data = pd.DataFrame(
+            {
+                "Date": ["2024-01-15", "2024-01-16"],
+                "Code": ["0000", "0000"],
+                "IndexName": ["TOPIX", "TOPIX"],
+                "Open": ["2500.0", "2520.0"],
+                "Close": ["2510.0", "2530.0"],
+            }
+        )
 
         result = processor.process_indices(sample_data)
 
@@ -110,15 +168,24 @@ class TestDataProcessor:
     def test_calculate_statistics_grouped(self, processor, sample_daily_quotes):
         """Test grouped statistics calculation."""
         processed_df = processor.process_daily_quotes(sample_daily_quotes)
-        stats = processor.calculate_statistics(
-            processed_df,
-            value_column="close",
-            group_by="code"
-        )
+        stats = processor.calculate_statistics(processed_df, value_column="close", group_by="code")
 
         assert len(stats) == 2  # Two unique codes
         assert "code" in stats.columns
 
+    def test_calculate_statistics_keeps_integer_min_max(self, processor):
+        """Test that min and max of an integer column keep its dtype."""
+        df = pd.DataFrame({"code": ["1301", "1301", "1302"], "volume": [1000, 1200, 500]})
+
+        stats = processor.calculate_statistics(df, value_column="volume")
+        assert stats["min"].dtype == np.int64
+        assert stats["max"].dtype == np.int64
+        assert stats["max"].iloc[0] == 1200
+
+        grouped = processor.calculate_statistics(df, value_column="volume", group_by="code")
+        assert grouped["min"].dtype == np.int64
+        assert grouped["min"].tolist() == [1000, 500]
+
     def test_merge_with_master(self, processor, sample_daily_quotes, sample_listed_info):
         """Test merging with master data."""
         quotes_df = processor.process_daily_quotes(sample_daily_quotes)
@@ -128,15 +195,14 @@ class TestDataProcessor:
 
         assert "company_name" in merged.columns
         assert len(merged) == len(quotes_df)
+        assert merged["company_name"].tolist() == ["Company A Updated"] * 2 + ["Company B"]
 
     def test_filter_by_date_range(self, processor, sample_daily_quotes):
         """Test date range filtering."""
         processed_df = processor.process_daily_quotes(sample_daily_quotes)
 
         filtered = processor.filter_by_date_range(
-            processed_df,
-            start_date=datetime(2024, 1, 16),
-            date_column="date"
+            processed_df, start_date=datetime(2024, 1, 16), date_column="date"
         )
 
         assert len(filtered) == 1
@@ -146,23 +212,21 @@ class TestDataProcessor:
         """Test filtering by stock codes."""
         processed_df = processor.process_daily_quotes(sample_daily_quotes)
 
-        filtered = processor.filter_by_codes(
-            processed_df,
-            codes=["1301"],
-            code_column="code"
-        )
+        filtered = processor.filter_by_codes(processed_df, codes=["1301"], code_column="code")
 
         assert len(filtered) == 2
         assert all(filtered["code"] == "1301")
 
     def test_process_margin_interest(self, processor):
         """Test processing margin interest data."""
-        sample_data = pd.DataFrame({
-            "Code": ["1301", "1302"],
-            "Date": ["2024-01-15", "2024-01-15"],
-            "MarginBuy": ["1000", "2000"],
-            "MarginSell": ["500", "800"],
-        })
+        sample_data = pd.DataFrame(
+            {
+                "Code": ["1301", "1302"],
+                "Date": ["2024-01-15", "2024-01-15"],
+                "MarginBuy": ["1000", "2000"],
+                "MarginSell": ["500", "800"],
+            }
+        )
 
         result = processor.process_margin_interest(sample_data)
 
@@ -172,14 +236,92 @@ class TestDataProcessor:
 
     def test_process_short_selling(self, processor):
         """Test processing short selling data."""
-        sample_data = pd.DataFrame({
-            "Code": ["1301", "1302"],
-            "Date": ["2024-01-15", "2024-01-15"],
-            "ShortSellingVolume": ["10000", "20000"],
-            "TotalVolume": ["100000", "150000"],
-        })
+        sample_data = pd.DataFrame(
+            {
+                "Code": ["1301", "1302"],
+                "Date": ["2024-01-15", "2024-01-15"],
+                "ShortSellingVolume": ["10000", "20000"],
+                "TotalVolume": ["100000", "150000"],
+            }
+        )
 
         result = processor.process_short_selling(sample_data)
 
         assert "short_selling_ratio" in result.columns
         assert result["short_selling_ratio"].iloc[0] == 10.0
+
+
+class TestIndexCompanyInfo:
+    """Test cases for index_company_info function."""
+
+    def test_indexes_company_info(self):
+        """Test company info is de-duplicated and indexed by Code."""
+        listed_info = pd.DataFrame(
+            {
+                "Code": ["1301", "1301", "1302"],
+                "CompanyName": ["A", "A", "B"],
+                "Sector33CodeName": ["水産", "水産", "食料品"],
+                "MarketCode": ["0111", "0111", "0111"],
+            }
+        )
+
+        result = index_company_info(listed_info)
+
+        assert result.index.tolist() == ["1301", "1302"]
+        assert list(result.columns) == ["CompanyName", "Sector33CodeName"]
+
+
+class TestDowncastQuotes:
+    """Test cases for quote dtype downcasting."""
+
+    def test_downcasts_only_exact_prices(self):
+        """Test prices stay float64 unless float32 holds them exactly."""
+        df = pd.DataFrame(
+            {
+                "Open": [100.0, 100.5],
+                "Close": [100.1, 100.5],
+                "Volume": [1000.0, 2000.0],
+            }
+        )
+
+        downcast_quotes(df)
+
+        assert df["Open"].dtype == "float32"
+        assert df["Close"].dtype == "float64"
+        assert df["Volume"].dtype.kind == "i"
+
+
+class TestPctChange:
+    """Test cases for pct_change function."""
+
+    def test_pct_change(self):
+        """Test percentage change keeps division semantics for zero and missing bases."""
+        current = np.array([110.0, 90.0, 5.0, -5.0, 0.0, 5.0])
+        base = np.array([100.0, 100.0, 0.0, 0.0, 0.0, np.nan])
+        result = pct_change(current, base)
+
+        assert result[:2].tolist() == pytest.approx([10.0, -10.0])
+        assert result[2] == np.inf
+        assert result[3] == -np.inf
+        assert np.isnan(result[4:]).all()
+        # Same as the Series arithmetic it replaced
+        expected = (pd.Series(current) - pd.Series(base)) / pd.Series(base) * 100
+        np.testing.assert_array_equal(result, expected.to_numpy())
+
+
+class TestPreviousInGroup:
+    """Test cases for previous_in_group function."""
+
+    def test_shifts_within_groups(self):
+        """Test values shift by one row and reset at group boundaries."""
+        result = previous_in_group(
+            np.array(["A", "A", "A", "B", "B"], dtype=object),
+            np.array([1.0, 2.0, 3.0, 10.0, 11.0]),
+        )
+
+        assert np.isnan(result[[0, 3]]).all()
+        assert result[[1, 2, 4]].tolist() == [1.0, 2.0, 10.0]
+
+    def test_empty(self):
+        """Test empty input gives an empty result."""
+        assert len(previous_in_group(np.array([]), np.array([]))) == 0
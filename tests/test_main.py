@@ -0,0 +1,39 @@
+"""Tests for command-line helpers in the main module."""
+
+from datetime import date
+
+import pytest
+
+from jquants_report.main import parse_date, parse_ymd
+
+
+class TestParseDate:
+    """Tests for YYYY-MM-DD date parsing."""
+
+    def test_parse_ymd(self):
+        """Test a well-formed date is parsed."""
+        assert parse_ymd("2024-01-05") == date(2024, 1, 5)
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "+024-01-01",
+            "2024-01- 1",
+            " 2024-1-01",
+            "2024-+1-01",
+            "２０２４-01-01",
+            "2024/01/01",
+            "20240101",
+            "2024-02-30",
+        ],
+    )
+    def test_parse_ymd_rejects_malformed(self, date_str):
+        """Test signs, spaces, non-ASCII digits and bad dates are rejected."""
+        with pytest.raises(ValueError):
+            parse_ymd(date_str)
+
+    def test_parse_date_wraps_error(self):
+        """Test parse_date reports the expected format."""
+        with pytest.raises(ValueError, match="Use YYYY-MM-DD"):
+            parse_date("2024-01- 1")
+        assert parse_date("2024-12-31") == date(2024, 12, 31)
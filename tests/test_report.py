@@ -1,6 +1,9 @@
 """Tests for report generation module."""
 
-import tempfile
+import dataclasses
+import io
+import re
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
@@ -10,17 +13,24 @@ from jquants_report.report.formatter import (
     create_markdown_table,
     format_amount,
     format_change,
+    format_change_with_trend,
     format_date,
+    format_hyakuman,
     format_number,
+    format_oku,
+    format_oku_signed,
     format_percentage,
     format_strength_indicator,
     format_table_row,
     format_table_separator,
     format_trend_indicator,
     format_volume,
+    truncate_text,
 )
 from jquants_report.report.generator import (
+    TABLE_CACHE_SIZE,
     IndexData,
+    MarketStats,
     MarketSummary,
     ReportGenerator,
     SectorAnalysis,
@@ -31,49 +41,220 @@ from jquants_report.report.generator import (
     TechnicalIndicator,
     TechnicalSummary,
 )
+from jquants_report.report.templates import (
+    get_main_template,
+    get_template_environment,
+    get_weekly_template,
+    open_report_file,
+    render_main_template,
+    stream_main_template,
+)
+from jquants_report.report.weekly_generator import (
+    EARNINGS_TABLE_LIMIT,
+    WeeklyReportGenerator,
+    _price_rank_rows,
+    _sector_rows,
+    _turnover_rank_rows,
+)
+from jquants_report.report.weekly_types import (
+    DailyIndexChange,
+    EarningsEvent,
+    MarginTradingData,
+    SectorRotationData,
+    WeeklyEventsCalendar,
+    WeeklyIndexData,
+    WeeklyInvestorActivity,
+    WeeklyMarginTrends,
+    WeeklyMarketSummary,
+    WeeklyMediumTermTrends,
+    WeeklyPerformanceRankings,
+    WeeklySectorRotation,
+    WeeklyStockPerformance,
+    WeeklyTechnicalSummary,
+    WeeklyTopics,
+)
+
+# Sample report inputs, shared read-only by the generator tests
+_MARKET_SUMMARY = MarketSummary(
+    indices=[
+        IndexData(
+            name="日経平均",
+            close=30000.0,
+            change=200.0,
+            change_pct=0.67,
+            volume=1000000000,
+        ),
+        IndexData(
+            name="TOPIX",
+            close=2100.0,
+            change=10.0,
+            change_pct=0.48,
+            volume=800000000,
+        ),
+    ],
+    advancing=1500,
+    declining=800,
+    unchanged=200,
+    total_volume=2000000000,
+    total_turnover=3000000000000,
+    comment="市場は堅調に推移しました。",
+)
+
+_SECTOR_ANALYSIS = SectorAnalysis(
+    sectors=[
+        SectorData(name="電気機器", change_pct=1.5, turnover=500000000000),
+        SectorData(name="情報・通信", change_pct=1.2, turnover=450000000000),
+        SectorData(name="輸送用機器", change_pct=-0.5, turnover=300000000000),
+    ],
+    comment="電気機器セクターが上昇を牽引しました。",
+)
+
+_STOCK_HIGHLIGHTS = StockHighlights(
+    top_gainers=[
+        StockData(
+            code="1234",
+            name="テスト株式会社",
+            close=1000.0,
+            change=100.0,
+            change_pct=11.11,
+            volume=1000000,
+            turnover=1000000000,
+        ),
+    ],
+    top_losers=[
+        StockData(
+            code="5678",
+            name="サンプル株式会社",
+            close=500.0,
+            change=-50.0,
+            change_pct=-9.09,
+            volume=500000,
+            turnover=250000000,
+        ),
+    ],
+    top_volume=[
+        StockData(
+            code="9999",
+            name="出来高株式会社",
+            close=2000.0,
+            change=50.0,
+            change_pct=2.56,
+            volume=10000000,
+            turnover=20000000000,
+        ),
+    ],
+    top_turnover=[
+        StockData(
+            code="8888",
+            name="売買代金株式会社",
+            close=3000.0,
+            change=-100.0,
+            change_pct=-3.23,
+            volume=8000000,
+            turnover=24000000000,
+        ),
+    ],
+)
+
+_TECHNICAL_SUMMARY = TechnicalSummary(
+    moving_averages=[
+        TechnicalIndicator(name="5日移動平均", value=29800.0, signal="上昇"),
+        TechnicalIndicator(name="25日移動平均", value=29500.0, signal="上昇"),
+    ],
+    momentum_indicators=[
+        TechnicalIndicator(name="RSI(14)", value=65.0, signal="中立"),
+        TechnicalIndicator(name="MACD", value=50.0, signal="買い"),
+    ],
+    comment="短期的には上昇トレンドが継続しています。",
+)
+
+_SUPPLY_DEMAND = SupplyDemandSummary(
+    margin_buying_balance=1500000000000,
+    margin_selling_balance=500000000000,
+    margin_ratio=25.5,
+    short_selling_ratio=42.3,
+    comment="信用買い残が増加傾向にあります。",
+)
+
+FORMATTER_CASES = (
+    (format_number, (1234567,), "1,234,567"),
+    (format_number, (1234.567, 2), "1,234.57"),
+    (format_number, (None,), "N/A"),
+    (format_number, (0,), "0"),
+    (format_percentage, (1.5,), "+1.50%"),
+    (format_percentage, (-2.3, 1), "-2.3%"),
+    (format_percentage, (0,), "+0.00%"),
+    (format_percentage, (None,), "N/A"),
+    (format_change, (123.45,), "+123.45"),
+    (format_change, (-67.89, 1), "-67.9"),
+    (format_change, (0,), "+0.00"),
+    (format_change, (None,), "N/A"),
+    (format_date, (date(2024, 1, 15),), "2024年01月15日"),
+    (format_volume, (1234567,), "123.5万株"),
+    (format_volume, (123456789,), "1.2億株"),
+    (format_volume, (None,), "N/A"),
+    (format_amount, (12345678,), "1,234.6万円"),
+    (format_amount, (1234567890,), "12.3億円"),
+    (format_amount, (1234567890123,), "1.2兆円"),
+    (format_amount, (None,), "N/A"),
+    (format_oku, (123456789012,), "1,235"),
+    (format_oku, (None,), "N/A"),
+    (format_oku_signed, (250000000,), "+2"),
+    (format_oku_signed, (-250000000,), "-2"),
+    (format_oku_signed, (None,), "N/A"),
+    (format_hyakuman, (1234567890,), "1,235"),
+    (format_hyakuman, (None,), "N/A"),
+    (format_trend_indicator, (5.2,), "↑"),
+    (format_trend_indicator, (-3.1,), "↓"),
+    (format_trend_indicator, (0,), "→"),
+    (format_trend_indicator, (None,), "-"),
+    (format_strength_indicator, (80,), "強い"),
+    (format_strength_indicator, (20,), "弱い"),
+    (format_strength_indicator, (50,), "中立"),
+    (format_strength_indicator, (None,), "N/A"),
+    (format_strength_indicator, (80, (40, 60)), "強い"),
+    (format_strength_indicator, (20, (40, 60)), "弱い"),
+    (truncate_text, ("あ" * 12, 12), "あ" * 12),
+    (truncate_text, ("あ" * 13, 12), "あ" * 12 + "..."),
+    (truncate_text, ("", 12), ""),
+)
+
+
+def _formatter_case_id(fn: Callable[..., str], args: tuple) -> str:
+    """Build a readable test id such as ``format_number-1234.567-2``."""
+    return "-".join([fn.__name__, *map(str, args)])
 
 
 class TestFormatter:
     """Test formatter functions."""
 
-    def test_format_number(self) -> None:
-        """Test number formatting."""
-        assert format_number(1234567) == "1,234,567"
-        assert format_number(1234.567, 2) == "1,234.57"
-        assert format_number(None) == "N/A"
-        assert format_number(0) == "0"
-
-    def test_format_percentage(self) -> None:
-        """Test percentage formatting."""
-        assert format_percentage(1.5) == "+1.50%"
-        assert format_percentage(-2.3, 1) == "-2.3%"
-        assert format_percentage(0) == "+0.00%"
-        assert format_percentage(None) == "N/A"
-
-    def test_format_change(self) -> None:
-        """Test change formatting."""
-        assert format_change(123.45) == "+123.45"
-        assert format_change(-67.89, 1) == "-67.9"
-        assert format_change(0) == "+0.00"
-        assert format_change(None) == "N/A"
-
-    def test_format_date(self) -> None:
-        """Test date formatting."""
-        test_date = date(2024, 1, 15)
-        assert format_date(test_date) == "2024年01月15日"
-
-    def test_format_volume(self) -> None:
-        """Test volume formatting."""
-        assert format_volume(1234567) == "123.5万株"
-        assert format_volume(123456789) == "1.2億株"
-        assert format_volume(None) == "N/A"
-
-    def test_format_amount(self) -> None:
-        """Test amount formatting."""
-        assert format_amount(12345678) == "1,234.6万円"
-        assert format_amount(1234567890) == "12.3億円"
-        assert format_amount(1234567890123) == "1.2兆円"
-        assert format_amount(None) == "N/A"
+    @pytest.mark.parametrize(
+        ("fn", "args", "expected"),
+        [
+            pytest.param(fn, args, expected, id=_formatter_case_id(fn, args))
+            for fn, args, expected in FORMATTER_CASES
+        ],
+    )
+    def test_formatter(self, fn: Callable[..., str], args: tuple, expected: str) -> None:
+        """Test each formatter against its expected output."""
+        assert fn(*args) == expected
+
+    def test_memoized_formatters_treat_zeros_alike(self) -> None:
+        """Test -0.0 and 0 format identically regardless of call order."""
+        assert format_percentage(-0.0) == format_percentage(0.0) == "+0.00%"
+        assert format_change(-0.0, 1) == format_change(0, 1) == "+0.0"
+        assert format_number(-0.0, 2) == "0.00"
+
+    def test_formatter_cache_hit(self) -> None:
+        """Test repeated values are served from the formatter cache."""
+        hits = format_number.cache_info().hits
+        assert format_number(98765.4321, 3) == format_number(98765.4321, 3) == "98,765.432"
+        assert format_number.cache_info().hits >= hits + 1
+
+        hits = format_strength_indicator.cache_info().hits
+        assert format_strength_indicator(55.5, (40, 60)) == "中立"
+        assert format_strength_indicator(55.5, (40, 60)) == "中立"
+        assert format_strength_indicator.cache_info().hits >= hits + 1
 
     def test_format_table_row(self) -> None:
         """Test table row formatting."""
@@ -119,254 +300,136 @@ class TestFormatter:
         assert "Left" in result
         assert ":" in result  # Alignment markers
 
-    def test_format_trend_indicator(self) -> None:
-        """Test trend indicator formatting."""
-        assert format_trend_indicator(5.2) == "↑"
-        assert format_trend_indicator(-3.1) == "↓"
-        assert format_trend_indicator(0) == "→"
-        assert format_trend_indicator(None) == "-"
-
-    def test_format_strength_indicator(self) -> None:
-        """Test strength indicator formatting."""
-        assert format_strength_indicator(80) == "強い"
-        assert format_strength_indicator(20) == "弱い"
-        assert format_strength_indicator(50) == "中立"
-        assert format_strength_indicator(None) == "N/A"
-
-        # Custom thresholds
-        assert format_strength_indicator(80, (40, 60)) == "強い"
-        assert format_strength_indicator(20, (40, 60)) == "弱い"
+    def test_format_change_with_trend(self) -> None:
+        """Test combined change and trend formatting."""
+        for value in (123.45, -67.89, 0, -0.0, None):
+            expected = f"{format_change(value, 1)} {format_trend_indicator(value)}"
+            assert format_change_with_trend(value, 1) == expected
 
 
 class TestReportGenerator:
     """Test report generator."""
 
-    @pytest.fixture
-    def output_dir(self) -> Path:
-        """Create temporary output directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    @pytest.fixture
-    def market_summary(self) -> MarketSummary:
-        """Create sample market summary."""
-        return MarketSummary(
-            indices=[
-                IndexData(
-                    name="日経平均",
-                    close=30000.0,
-                    change=200.0,
-                    change_pct=0.67,
-                    volume=1000000000,
-                ),
-                IndexData(
-                    name="TOPIX",
-                    close=2100.0,
-                    change=10.0,
-                    change_pct=0.48,
-                    volume=800000000,
-                ),
-            ],
-            advancing=1500,
-            declining=800,
-            unchanged=200,
-            total_volume=2000000000,
-            total_turnover=3000000000000,
-            comment="市場は堅調に推移しました。",
-        )
-
-    @pytest.fixture
-    def sector_analysis(self) -> SectorAnalysis:
-        """Create sample sector analysis."""
-        return SectorAnalysis(
-            sectors=[
-                SectorData(name="電気機器", change_pct=1.5, turnover=500000000000),
-                SectorData(name="情報・通信", change_pct=1.2, turnover=450000000000),
-                SectorData(name="輸送用機器", change_pct=-0.5, turnover=300000000000),
-            ],
-            comment="電気機器セクターが上昇を牽引しました。",
+    @pytest.fixture(scope="module")
+    def generator(self, tmp_path_factory: pytest.TempPathFactory) -> ReportGenerator:
+        """Create a generator shared by tests that only format sections."""
+        return ReportGenerator(tmp_path_factory.mktemp("reports"))
+
+    def test_report_generation(self, generator: ReportGenerator) -> None:
+        """Test complete report content."""
+        content = generator.render(
+            target_date=date(2024, 1, 15),
+            market_summary=_MARKET_SUMMARY,
+            sector_analysis=_SECTOR_ANALYSIS,
+            stock_highlights=_STOCK_HIGHLIGHTS,
+            technical_summary=_TECHNICAL_SUMMARY,
+            supply_demand=_SUPPLY_DEMAND,
         )
 
-    @pytest.fixture
-    def stock_highlights(self) -> StockHighlights:
-        """Create sample stock highlights."""
-        return StockHighlights(
-            top_gainers=[
-                StockData(
-                    code="1234",
-                    name="テスト株式会社",
-                    close=1000.0,
-                    change=100.0,
-                    change_pct=11.11,
-                    volume=1000000,
-                    turnover=1000000000,
-                ),
-            ],
-            top_losers=[
-                StockData(
-                    code="5678",
-                    name="サンプル株式会社",
-                    close=500.0,
-                    change=-50.0,
-                    change_pct=-9.09,
-                    volume=500000,
-                    turnover=250000000,
-                ),
-            ],
-            top_volume=[
-                StockData(
-                    code="9999",
-                    name="出来高株式会社",
-                    close=2000.0,
-                    change=50.0,
-                    change_pct=2.56,
-                    volume=10000000,
-                    turnover=20000000000,
-                ),
-            ],
-            top_turnover=[
-                StockData(
-                    code="8888",
-                    name="売買代金株式会社",
-                    close=3000.0,
-                    change=-100.0,
-                    change_pct=-3.23,
-                    volume=8000000,
-                    turnover=24000000000,
-                ),
-            ],
-        )
+        # Date, market data, sectors, stocks, technicals, supply demand, comments
+        required = {
+            "2024年01月15日",
+            "日経平均",
+            "30,000",
+            "+0.67%",
+            "電気機器",
+            "+1.50%",
+            "テスト株式会社",
+            "1234",
+            "5日移動平均",
+            "RSI",
+            "信用買い残",
+            "空売り比率",
+            "市場は堅調に推移しました。",
+            "電気機器セクターが上昇を牽引しました。",
+        }
+        # Longest first so a needle that prefixes another cannot hide it
+        pattern = re.compile("|".join(map(re.escape, sorted(required, key=len, reverse=True))))
+        found = {m.group(0) for m in pattern.finditer(content)}
+
+        missing = required - found
+        assert not missing, f"missing from report: {sorted(missing)}"
+
+    def test_generate_writes_file(self, tmp_path: Path) -> None:
+        """Test the rendered report is written under a dated file name."""
+        generator = ReportGenerator(tmp_path)
+        inputs = {
+            "target_date": date(2024, 1, 15),
+            "market_summary": _MARKET_SUMMARY,
+            "sector_analysis": _SECTOR_ANALYSIS,
+            "stock_highlights": _STOCK_HIGHLIGHTS,
+            "technical_summary": _TECHNICAL_SUMMARY,
+            "supply_demand": _SUPPLY_DEMAND,
+        }
+        report_path = generator.generate(**inputs)
 
-    @pytest.fixture
-    def technical_summary(self) -> TechnicalSummary:
-        """Create sample technical summary."""
-        return TechnicalSummary(
-            moving_averages=[
-                TechnicalIndicator(name="5日移動平均", value=29800.0, signal="上昇"),
-                TechnicalIndicator(name="25日移動平均", value=29500.0, signal="上昇"),
-            ],
-            momentum_indicators=[
-                TechnicalIndicator(name="RSI(14)", value=65.0, signal="中立"),
-                TechnicalIndicator(name="MACD", value=50.0, signal="買い"),
-            ],
-            comment="短期的には上昇トレンドが継続しています。",
-        )
-
-    @pytest.fixture
-    def supply_demand(self) -> SupplyDemandSummary:
-        """Create sample supply demand summary."""
-        return SupplyDemandSummary(
-            margin_buying_balance=1500000000000,
-            margin_selling_balance=500000000000,
-            margin_ratio=25.5,
-            short_selling_ratio=42.3,
-            comment="信用買い残が増加傾向にあります。",
-        )
-
-    def test_report_generation(
-        self,
-        output_dir: Path,
-        market_summary: MarketSummary,
-        sector_analysis: SectorAnalysis,
-        stock_highlights: StockHighlights,
-        technical_summary: TechnicalSummary,
-        supply_demand: SupplyDemandSummary,
-    ) -> None:
-        """Test complete report generation."""
-        generator = ReportGenerator(output_dir)
-        target_date = date(2024, 1, 15)
-
-        report_path = generator.generate(
-            target_date=target_date,
-            market_summary=market_summary,
-            sector_analysis=sector_analysis,
-            stock_highlights=stock_highlights,
-            technical_summary=technical_summary,
-            supply_demand=supply_demand,
-        )
-
-        # Check file exists
-        assert report_path.exists()
         assert report_path.name == "market_report_20240115.md"
+        assert report_path.read_text(encoding="utf-8") == generator.render(**inputs)
 
-        # Read and check content
-        content = report_path.read_text(encoding="utf-8")
-
-        # Check date
-        assert "2024年01月15日" in content
-
-        # Check market data
-        assert "日経平均" in content
-        assert "30,000" in content
-        assert "+0.67%" in content
-
-        # Check sector data
-        assert "電気機器" in content
-        assert "+1.50%" in content
-
-        # Check stock highlights
-        assert "テスト株式会社" in content
-        assert "1234" in content
-
-        # Check technical indicators
-        assert "5日移動平均" in content
-        assert "RSI" in content
-
-        # Check supply demand
-        assert "信用買い残" in content
-        assert "空売り比率" in content
-
-        # Check comments
-        assert "市場は堅調に推移しました。" in content
-        assert "電気機器セクターが上昇を牽引しました。" in content
-
-    def test_output_directory_creation(self) -> None:
+    def test_output_directory_creation(self, tmp_path: Path) -> None:
         """Test output directory is created if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir) / "reports" / "2024"
-            assert not output_dir.exists()
+        output_dir = tmp_path / "reports" / "2024"
+        assert not output_dir.exists()
 
-            generator = ReportGenerator(output_dir)
-            assert output_dir.exists()
+        ReportGenerator(output_dir)
+        assert output_dir.exists()
 
-    def test_format_market_overview(
-        self, output_dir: Path, market_summary: MarketSummary
-    ) -> None:
+    def test_format_market_overview(self, generator: ReportGenerator) -> None:
         """Test market overview formatting."""
-        generator = ReportGenerator(output_dir)
-        result = generator._format_market_overview(market_summary)
+        result = generator._format_market_overview(_MARKET_SUMMARY)
 
         assert "日経平均" in result
         assert "30,000" in result
         assert "TOPIX" in result
 
-    def test_format_market_breadth(
-        self, output_dir: Path, market_summary: MarketSummary
-    ) -> None:
+    def test_format_market_breadth(self, generator: ReportGenerator) -> None:
         """Test market breadth formatting."""
-        generator = ReportGenerator(output_dir)
-        result = generator._format_market_breadth(market_summary)
+        result = generator._format_market_breadth(_MARKET_SUMMARY)
 
         assert "値上がり" in result
         assert "値下がり" in result
         assert "1,500" in result
         assert "800" in result
 
-    def test_format_sector_performance(
-        self, output_dir: Path, sector_analysis: SectorAnalysis
-    ) -> None:
+    def test_format_sector_performance(self, generator: ReportGenerator) -> None:
         """Test sector performance formatting."""
-        generator = ReportGenerator(output_dir)
-        result = generator._format_sector_performance(sector_analysis)
+        result = generator._format_sector_performance(_SECTOR_ANALYSIS)
 
         assert "電気機器" in result
         assert "情報・通信" in result
         assert "+1.50%" in result
 
-    def test_format_stock_table(self, output_dir: Path, stock_highlights: StockHighlights) -> None:
+    def test_sector_tables_are_cached_by_content(self, tmp_path: Path) -> None:
+        """Test sector tables are reused for equal sectors and rebuilt on change."""
+        generator = ReportGenerator(tmp_path)
+        performance = generator._format_sector_performance(_SECTOR_ANALYSIS)
+        turnover = generator._format_sector_turnover(_SECTOR_ANALYSIS)
+
+        copy = SectorAnalysis(sectors=list(_SECTOR_ANALYSIS.sectors))
+        assert generator._format_sector_performance(copy) is performance
+        assert generator._format_sector_turnover(copy) is turnover
+
+        copy.sectors[0] = SectorData(
+            name=copy.sectors[0].name, change_pct=-9.99, turnover=copy.sectors[0].turnover
+        )
+        assert "-9.99%" in generator._format_sector_performance(copy)
+        assert generator._format_sector_turnover(copy) is turnover
+
+    def test_sector_table_cache_is_bounded(self, tmp_path: Path) -> None:
+        """Test the sector table cache evicts its oldest entries when full."""
+        generator = ReportGenerator(tmp_path)
+        for i in range(TABLE_CACHE_SIZE + 5):
+            analysis = SectorAnalysis(
+                sectors=[SectorData(name="銀行業", change_pct=float(i), turnover=1e9)]
+            )
+            generator._format_sector_performance(analysis)
+
+        assert len(generator._table_cache) == TABLE_CACHE_SIZE
+        assert ("performance", (("銀行業", 0.0),)) not in generator._table_cache
+
+    def test_format_stock_table(self, generator: ReportGenerator) -> None:
         """Test stock table formatting."""
-        generator = ReportGenerator(output_dir)
-        result = generator._format_stock_table(stock_highlights.top_gainers)
+        result = generator._format_stock_table(_STOCK_HIGHLIGHTS.top_gainers)
 
         assert "テスト株式会社" in result
         assert "1234" in result
@@ -376,36 +439,103 @@ class TestReportGenerator:
         result_empty = generator._format_stock_table([])
         assert "データがありません" in result_empty
 
-    def test_format_technical_indicators(
-        self, output_dir: Path, technical_summary: TechnicalSummary
-    ) -> None:
+    def test_format_technical_indicators(self, generator: ReportGenerator) -> None:
         """Test technical indicators formatting."""
-        generator = ReportGenerator(output_dir)
-        result = generator._format_technical_indicators(technical_summary.moving_averages)
+        result = generator._format_technical_indicators(_TECHNICAL_SUMMARY.moving_averages)
 
         assert "5日移動平均" in result
         assert "29,800" in result
         assert "上昇" in result
 
-    def test_generate_next_day_focus(
-        self,
-        output_dir: Path,
-        market_summary: MarketSummary,
-        sector_analysis: SectorAnalysis,
-        technical_summary: TechnicalSummary,
-    ) -> None:
+    def test_generate_next_day_focus(self, generator: ReportGenerator) -> None:
         """Test next day focus generation."""
-        generator = ReportGenerator(output_dir)
         result = generator._generate_next_day_focus(
-            market_summary, sector_analysis, technical_summary
+            _MARKET_SUMMARY, _SECTOR_ANALYSIS, _TECHNICAL_SUMMARY
         )
 
         assert len(result) > 0
         assert "注目" in result
 
-    def test_empty_data_handling(self, output_dir: Path) -> None:
+    @pytest.mark.parametrize(
+        ("change_pct", "expected"),
+        [
+            (2.5, "日経平均は大幅高となり、2.50%上昇しました"),
+            (2.0, "日経平均は堅調に推移し、2.00%上昇しました"),
+            (0.5, "日経平均は小幅高で、0.50%上昇しました"),
+            (0.0, "日経平均は小幅安で、0.00%下落しました"),
+            (-1.0, "日経平均は軟調に推移し、-1.00%下落しました"),
+            (-2.0, "日経平均は大幅安となり、-2.00%下落しました"),
+        ],
+    )
+    def test_generate_market_comment_index_thresholds(
+        self, generator: ReportGenerator, change_pct: float, expected: str
+    ) -> None:
+        """Test main index comment boundaries."""
+        summary = MarketSummary(
+            indices=[IndexData(name="日経平均", close=0, change=0, change_pct=change_pct)],
+            advancing=0,
+            declining=0,
+            unchanged=0,
+            total_volume=0,
+            total_turnover=0,
+        )
+
+        assert generator._generate_market_comment(summary) == expected + "。"
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [
+            ("25日移動平均", 75.0, "25日移動平均線を上回る銘柄が75.0%と多く、短期的に強い相場です。"),
+            ("75日移動平均", 25.0, "75日移動平均線を上回る銘柄が25.0%と少なく、中期的に弱い相場です。"),
+            ("25日移動平均", 70.0, "テクニカル指標について特記事項はありません。"),
+            ("5日移動平均", 90.0, "テクニカル指標について特記事項はありません。"),
+        ],
+    )
+    def test_generate_technical_comment_moving_averages(
+        self, generator: ReportGenerator, name: str, value: float, expected: str
+    ) -> None:
+        """Test moving average comment horizons and thresholds."""
+        summary = TechnicalSummary(
+            moving_averages=[TechnicalIndicator(name=name, value=value, signal="")],
+            momentum_indicators=[],
+        )
+
+        assert generator._generate_technical_comment(summary) == expected
+
+    def test_market_stats_from_summary(self) -> None:
+        """Test derived market figures."""
+        stats = MarketStats.from_summary(_MARKET_SUMMARY)
+        total = _MARKET_SUMMARY.advancing + _MARKET_SUMMARY.declining + _MARKET_SUMMARY.unchanged
+
+        assert stats.total == total
+        assert stats.adv_ratio == _MARKET_SUMMARY.advancing / total
+        assert stats.dec_ratio == _MARKET_SUMMARY.declining / total
+        assert stats.main_index is _MARKET_SUMMARY.indices[0]
+
+        empty = MarketStats.from_summary(
+            MarketSummary(
+                indices=[],
+                advancing=0,
+                declining=0,
+                unchanged=0,
+                total_volume=0,
+                total_turnover=0,
+            )
+        )
+        assert empty.adv_ratio == 0
+        assert empty.main_index is None
+
+    def test_records_are_immutable(self) -> None:
+        """Test row records are frozen and carry no per-instance dict."""
+        sector = _SECTOR_ANALYSIS.sectors[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sector.change_pct = 0.0  # type: ignore[misc]
+        assert not hasattr(sector, "__dict__")
+
+    def test_empty_data_handling(self, tmp_path: Path) -> None:
         """Test handling of empty or minimal data."""
-        generator = ReportGenerator(output_dir)
+        generator = ReportGenerator(tmp_path)
 
         # Empty market summary
         market_summary = MarketSummary(
@@ -444,3 +574,236 @@ class TestReportGenerator:
         assert report_path.exists()
         content = report_path.read_text(encoding="utf-8")
         assert len(content) > 0
+
+
+class TestTemplates:
+    """Tests for report template rendering."""
+
+    def test_stream_matches_render(self) -> None:
+        """Test streamed output is identical to the rendered string."""
+        sections = {"report_date": "2024年01月15日", "market_overview": "| a |\n| b |"}
+        buffer = io.StringIO()
+
+        stream_main_template(buffer, **sections)
+
+        assert buffer.getvalue() == render_main_template(**sections)
+
+    def test_open_report_file_replaces_on_success(self, tmp_path: Path) -> None:
+        """Test the report appears only after writing completes."""
+        path = tmp_path / "report.md"
+        path.write_text("old", encoding="utf-8")
+
+        with open_report_file(path) as f:
+            f.write("新しいレポート")
+            assert path.read_text(encoding="utf-8") == "old"
+
+        assert path.read_text(encoding="utf-8") == "新しいレポート"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_open_report_file_keeps_old_report_on_error(self, tmp_path: Path) -> None:
+        """Test a failed write leaves the previous report and no temp file."""
+        path = tmp_path / "report.md"
+        path.write_text("old", encoding="utf-8")
+
+        with pytest.raises(RuntimeError), open_report_file(path) as f:
+            f.write("partial")
+            raise RuntimeError("render failed")
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_open_report_file_writes_lf_utf8(self, tmp_path: Path) -> None:
+        """Test reports are written as UTF-8 with LF line endings."""
+        path = tmp_path / "report.md"
+
+        with open_report_file(path) as f:
+            f.write("行1\n行2\n")
+
+        assert path.read_bytes() == "行1\n行2\n".encode()
+
+    def test_main_template_is_compiled_once(self) -> None:
+        """Test the environment and compiled template are shared across renders."""
+        assert get_template_environment() is get_template_environment()
+        assert get_main_template() is get_main_template()
+        assert "format_trend" in get_template_environment().filters
+
+    def test_weekly_template_shares_environment(self) -> None:
+        """Test the weekly template is compiled once in the shared environment."""
+        assert get_weekly_template() is get_weekly_template()
+        assert get_weekly_template().environment is get_template_environment()
+
+    def test_environment_keeps_markdown_verbatim(self) -> None:
+        """Test the environment neither escapes nor trims block whitespace."""
+        env = get_template_environment()
+
+        assert env.from_string("{{ v }}").render(v="<b>&</b>") == "<b>&</b>"
+        assert env.from_string("| a |\n{% if x %}\n\n*b*{% endif %}").render(x=True) == "| a |\n\n\n*b*"
+
+
+class TestWeeklyTypes:
+    """Tests for weekly report data type helpers."""
+
+    def test_breadth_percentages(self) -> None:
+        """Test breadth shares and the empty-market fallback."""
+        summary = WeeklyMarketSummary(
+            week_start=date(2024, 1, 8),
+            week_end=date(2024, 1, 12),
+            indices=[],
+            daily_changes={},
+            total_advancing=3,
+            total_declining=1,
+            total_unchanged=0,
+        )
+
+        assert summary.breadth_percentages() == (75.0, 25.0, 0.0)
+
+        summary.total_advancing = summary.total_declining = 0
+        assert summary.breadth_percentages() == (0.0, 0.0, 0.0)
+
+    def test_precomputed_date_labels(self) -> None:
+        """Test date labels match the strftime patterns they replace."""
+        change = DailyIndexChange(date=date(2024, 1, 9), close=1.0, change=0.0, change_pct=0.0)
+        calendar = WeeklyEventsCalendar(
+            upcoming_week_start=date(2024, 1, 15), upcoming_week_end=date(2024, 1, 19)
+        )
+
+        assert change.date_mmdd == change.date.strftime("%m/%d") == "01/09"
+        assert calendar.upcoming_week_start_ymd == "2024/01/15"
+        assert calendar.upcoming_week_end_ymd == "2024/01/19"
+        assert change == DailyIndexChange(
+            date=date(2024, 1, 9), close=1.0, change=0.0, change_pct=0.0
+        )
+
+    def test_index_cells_are_preformatted(self) -> None:
+        """Test index table cells are formatted once at construction."""
+        index = WeeklyIndexData(
+            name="TOPIX",
+            week_open=2500.0,
+            week_high=2550.5,
+            week_low=2450.0,
+            week_close=2493.92,
+            weekly_change=-6.08,
+            weekly_change_pct=-0.2432,
+        )
+
+        assert (index.open_fmt, index.high_fmt, index.close_fmt) == (
+            "2,500.00",
+            "2,550.50",
+            "2,493.92",
+        )
+        assert (index.change_fmt, index.change_pct_fmt) == ("-6.08", "-0.24")
+
+
+class TestWeeklyRows:
+    """Tests for the pre-formatted weekly report table rows."""
+
+    _STOCKS = [
+        WeeklyStockPerformance(
+            code="72030",
+            name="トヨタ自動車株式会社グループ",
+            sector_name="輸送用機器製造業関連",
+            week_open=2500.0,
+            week_close=2650.0,
+            weekly_return_pct=6.0,
+            week_volume=1_000_000,
+            week_turnover=265_000_000_000.0,
+        ),
+        WeeklyStockPerformance(
+            code="13010",
+            name="極洋",
+            sector_name="水産・農林業",
+            week_open=4000.0,
+            week_close=3900.0,
+            weekly_return_pct=-2.5,
+            week_volume=10_000,
+            week_turnover=39_000_000.0,
+        ),
+    ]
+
+    def test_sector_rows(self) -> None:
+        """Test sector rows carry rank and formatted return, change and turnover."""
+        sectors = [
+            SectorRotationData(
+                sector_code="3700",
+                sector_name="輸送用機器",
+                weekly_return_pct=3.456,
+                return_change=-1.2,
+                turnover=1_234_500_000_000.0,
+                stock_count=62,
+            ),
+            SectorRotationData(sector_code="0050", sector_name="水産・農林業", weekly_return_pct=-0.5),
+        ]
+
+        assert _sector_rows(sectors) == [
+            (1, "輸送用機器", "+3.46", "-1.20", "12,345", 62),
+            (2, "水産・農林業", "-0.50", "N/A", "0", 0),
+        ]
+
+    def test_price_rank_rows(self) -> None:
+        """Test gainer/loser rows truncate names and sectors and format prices."""
+        assert _price_rank_rows(self._STOCKS) == [
+            (1, "72030", "トヨタ自動車株式会社グル...", "輸送用機器製造業", "2,650", "+6.00"),
+            (2, "13010", "極洋", "水産・農林業", "3,900", "-2.50"),
+        ]
+
+    def test_turnover_rank_rows(self) -> None:
+        """Test turnover rows format turnover in 億."""
+        assert _turnover_rank_rows(self._STOCKS) == [
+            (1, "72030", "トヨタ自動車株式会社グループ", "2,650", "+6.00"),
+            (2, "13010", "極洋", "0", "-2.50"),
+        ]
+
+
+class TestWeeklyReportGenerator:
+    """Tests for weekly report generation."""
+
+    def test_earnings_table_is_limited(self, tmp_path: Path) -> None:
+        """Test the earnings table shows EARNINGS_TABLE_LIMIT rows and counts the rest."""
+        week_start, week_end = date(2024, 1, 8), date(2024, 1, 12)
+        events = [
+            EarningsEvent(
+                date=date(2024, 1, 15),
+                code=f"{1000 + i}0",
+                name=f"決算会社{i}",
+                fiscal_period="2024年3月期",
+                announcement_type="決算",
+            )
+            for i in range(EARNINGS_TABLE_LIMIT + 5)
+        ]
+
+        report_path = WeeklyReportGenerator(tmp_path).generate(
+            week_start=week_start,
+            week_end=week_end,
+            market_summary=WeeklyMarketSummary(
+                week_start=week_start, week_end=week_end, indices=[], daily_changes={}
+            ),
+            sector_rotation=WeeklySectorRotation(
+                week_end=week_end, top_sectors=[], bottom_sectors=[], all_sectors=[]
+            ),
+            performance_rankings=WeeklyPerformanceRankings(
+                week_end=week_end, top_gainers=[], top_losers=[], top_volume=[], top_turnover=[]
+            ),
+            investor_activity=WeeklyInvestorActivity(week_end=week_end, categories=[]),
+            margin_trends=WeeklyMarginTrends(
+                week_end=week_end,
+                overall=MarginTradingData(
+                    week_end=week_end,
+                    margin_buy_balance=0.0,
+                    margin_sell_balance=0.0,
+                    margin_ratio=0.0,
+                ),
+            ),
+            technical_summary=WeeklyTechnicalSummary(week_end=week_end),
+            events_calendar=WeeklyEventsCalendar(
+                upcoming_week_start=date(2024, 1, 15),
+                upcoming_week_end=date(2024, 1, 19),
+                earnings_announcements=events,
+            ),
+            weekly_topics=WeeklyTopics(week_end=week_end),
+            medium_term_trends=WeeklyMediumTermTrends(week_end=week_end, index_trends={}),
+        )
+        content = report_path.read_text(encoding="utf-8")
+
+        assert f"決算会社{EARNINGS_TABLE_LIMIT - 1} " in content
+        assert f"決算会社{EARNINGS_TABLE_LIMIT} " not in content
+        assert "他5件の決算発表予定があります" in content
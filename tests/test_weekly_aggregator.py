@@ -0,0 +1,253 @@
+"""Tests for weekly data aggregator module."""
+
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jquants_report.analysis.weekly.stocks import WeeklyStockAnalyzer
+from jquants_report.data.cache import CacheManager
+from jquants_report.data.processor import index_company_info
+from jquants_report.data.weekly_aggregator import (
+    WeeklyDataAggregator,
+    _aggregate_sorted,
+)
+
+
+class TestWeeklyDataAggregator:
+    """Test cases for WeeklyDataAggregator class."""
+
+    @pytest.fixture
+    def cache_manager(self):
+        """Create CacheManager instance with temporary directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield CacheManager(Path(tmpdir), default_ttl_hours=24)
+
+    @pytest.fixture
+    def trading_days(self):
+        """Trading days of the week ending 2024-01-12."""
+        return [date(2024, 1, d) for d in range(8, 13)]
+
+    @pytest.fixture
+    def populated_cache(self, cache_manager, trading_days):
+        """Cache populated with two stocks over a full week."""
+        for i, day in enumerate(trading_days):
+            cache_manager.set(
+                f"daily_quotes_{day.strftime('%Y-%m-%d')}",
+                pd.DataFrame(
+                    {
+                        "Code": ["13010", "72030"],
+                        "Open": [100.0 + i, 2000.0 + i],
+                        "High": [110.0 + i, 2100.0 + i],
+                        "Low": [90.0 + i, 1900.0 + i],
+                        "Close": [105.0 + i, 2050.0 + i],
+                        "Volume": [1000, 5000],
+                        "TurnoverValue": [100000, 10000000],
+                        "CompanyName": [f"極洋{i}", "トヨタ自動車"],
+                        "Sector33Code": ["0050", "3700"],
+                        "Sector33CodeName": ["水産・農林業", "輸送用機器"],
+                    }
+                ),
+            )
+        return cache_manager
+
+    @pytest.fixture
+    def aggregator(self, populated_cache):
+        """Create WeeklyDataAggregator backed by the populated cache."""
+        return WeeklyDataAggregator(populated_cache)
+
+    def test_get_week_trading_days(self, aggregator, trading_days):
+        """Test trading days run from Monday to the week end."""
+        assert aggregator.get_week_trading_days(date(2024, 1, 12)) == trading_days
+        assert aggregator.get_week_trading_days(date(2024, 1, 10)) == trading_days[:3]
+
+    def test_get_previous_week_end(self, aggregator):
+        """Test previous Friday calculation."""
+        assert aggregator.get_previous_week_end(date(2024, 1, 12)) == date(2024, 1, 5)
+        assert aggregator.get_previous_week_end(date(2024, 1, 10)) == date(2024, 1, 5)
+
+    def test_get_latest_friday(self, aggregator):
+        """Test most recent Friday calculation."""
+        assert aggregator.get_latest_friday(date(2024, 1, 14)) == date(2024, 1, 12)
+        assert aggregator.get_latest_friday(date(2024, 1, 12)) == date(2024, 1, 12)
+
+    def test_week_trading_days_returns_fresh_list(self, aggregator):
+        """Test cached trading days cannot be mutated through the result."""
+        days = aggregator.get_week_trading_days(date(2024, 1, 12))
+        days.clear()
+        assert len(aggregator.get_week_trading_days(date(2024, 1, 12))) == 5
+
+    def test_aggregate_daily_quotes(self, aggregator, trading_days):
+        """Test OHLCV aggregation and company info carry-over."""
+        result = aggregator.aggregate_daily_quotes(trading_days).set_index("Code")
+
+        row = result.loc["13010"]
+        assert row["WeekOpen"] == 100.0
+        assert row["WeekHigh"] == 114.0
+        assert row["WeekLow"] == 90.0
+        assert row["WeekClose"] == 109.0
+        assert row["WeekVolume"] == 5000
+        assert row["TradingDays"] == 5
+        assert row["FirstDate"] == trading_days[0]
+        assert row["LastDate"] == trading_days[-1]
+        # Company info comes from the last trading day
+        assert row["CompanyName"] == "極洋4"
+        assert row["Sector33CodeName"] == "水産・農林業"
+        assert pd.isna(row["WeeklyReturn"])
+        assert result["CompanyName"].dtype == "string[pyarrow]"
+
+    def test_aggregate_daily_quotes_unordered_days(self, aggregator, trading_days):
+        """Test open/close follow dates even if days are passed out of order."""
+        result = aggregator.aggregate_daily_quotes(trading_days[::-1]).set_index("Code")
+
+        assert result.loc["13010", "WeekOpen"] == 100.0
+        assert result.loc["13010", "WeekClose"] == 109.0
+
+    def test_aggregate_daily_quotes_with_prev_week(self, aggregator, trading_days):
+        """Test weekly return calculation against previous week close."""
+        prev = pd.DataFrame({"Code": ["13010", "72030"], "Close": [100.0, 0.0]})
+        result = aggregator.aggregate_daily_quotes(trading_days, prev).set_index("Code")
+
+        assert result.loc["13010", "PrevWeekClose"] == 100.0
+        assert result.loc["13010", "WeeklyReturn"] == pytest.approx(9.0)
+        # Zero previous close yields inf, as plain division does
+        assert result.loc["72030", "WeeklyReturn"] == np.inf
+
+    def test_aggregate_daily_quotes_with_delisted_codes(self, aggregator, trading_days):
+        """Test previous-week codes that no longer trade are ignored."""
+        prev = pd.DataFrame(
+            {"Code": ["13010", "72030", "99990", "99980"], "Close": [100.0, 2000.0, 1.0, 2.0]}
+        )
+
+        result = aggregator.aggregate_daily_quotes(trading_days, prev).set_index("Code")
+
+        assert list(result.index) == ["13010", "72030"]
+        assert result.loc["13010", "WeeklyReturn"] == pytest.approx(9.0)
+
+    def test_sequential_loading_matches_parallel(self, populated_cache, trading_days):
+        """Test max_workers=1 loads the same data as the thread pool."""
+        parallel = WeeklyDataAggregator(populated_cache, max_workers=5)
+        sequential = WeeklyDataAggregator(populated_cache, max_workers=1)
+        pd.testing.assert_frame_equal(
+            parallel.aggregate_daily_quotes(trading_days),
+            sequential.aggregate_daily_quotes(trading_days),
+        )
+
+    def test_parallel_loading_leaves_no_threads(self, populated_cache, trading_days):
+        """Test the per-load worker pool is shut down once loading returns."""
+        aggregator = WeeklyDataAggregator(populated_cache, max_workers=5)
+        aggregator.load_cached_frames(trading_days, "daily_quotes_")
+        assert not any(
+            t.name.startswith("weekly-aggregator") for t in threading.enumerate()
+        )
+
+    def test_rankings_without_listed_info(self, cache_manager, trading_days):
+        """Test aggregated quotes without company info feed the stock rankings."""
+        for i, day in enumerate(trading_days):
+            cache_manager.set(
+                f"daily_quotes_{day.strftime('%Y-%m-%d')}",
+                pd.DataFrame(
+                    {
+                        "Code": ["13010", "72030"],
+                        "Open": [100.0, 2000.0],
+                        "High": [110.0, 2100.0],
+                        "Low": [90.0, 1900.0],
+                        "Close": [105.0 + i, 2050.0 - i],
+                        "Volume": [1000, 5000],
+                        "TurnoverValue": [100000, 10000000],
+                    }
+                ),
+            )
+        weekly = WeeklyDataAggregator(cache_manager).aggregate_daily_quotes(trading_days)
+
+        rankings = WeeklyStockAnalyzer().analyze(trading_days[-1], weekly)
+        assert [s.code for s in rankings.top_volume] == ["7203", "1301"]
+        assert rankings.top_volume[0].name == "不明"
+        assert rankings.top_volume[0].sector_name == "不明"
+
+    def test_aggregate_daily_quotes_empty(self, cache_manager, trading_days):
+        """Test empty result when no daily data is available."""
+        aggregator = WeeklyDataAggregator(cache_manager)
+        assert aggregator.aggregate_daily_quotes(trading_days).empty
+        assert aggregator.aggregate_daily_quotes([]).empty
+
+    def test_aggregate_sector_performance(self, aggregator, trading_days):
+        """Test sector aggregation from weekly quotes."""
+        prev = pd.DataFrame({"Code": ["13010", "72030"], "Close": [100.0, 2100.0]})
+        weekly = aggregator.aggregate_daily_quotes(trading_days, prev)
+        result = aggregator.aggregate_sector_performance(weekly)
+
+        assert list(result["Sector33CodeName"]) == ["水産・農林業", "輸送用機器"]
+        assert result.iloc[0]["AdvancingCount"] == 1
+        assert result.iloc[1]["DecliningCount"] == 1
+
+    def test_attach_company_info(self, cache_manager, trading_days):
+        """Test listed info fills in the company and sector columns."""
+        for day in trading_days:
+            cache_manager.set(
+                f"daily_quotes_{day.strftime('%Y-%m-%d')}",
+                pd.DataFrame(
+                    {
+                        "Code": ["13010", "72030"],
+                        "Open": [100.0, 2000.0],
+                        "High": [110.0, 2100.0],
+                        "Low": [90.0, 1900.0],
+                        "Close": [105.0, 1950.0],
+                        "Volume": [1000, 5000],
+                        "TurnoverValue": [100000, 10000000],
+                    }
+                ),
+            )
+        listed_info = pd.DataFrame(
+            {
+                "Code": ["13010", "72030"],
+                "CompanyName": ["極洋", "トヨタ自動車"],
+                "Sector33Code": ["0050", "3700"],
+                "Sector33CodeName": ["水産・農林業", "輸送用機器"],
+            }
+        )
+        prev = pd.DataFrame({"Code": ["13010", "72030"], "Close": [100.0, 2000.0]})
+
+        aggregator = WeeklyDataAggregator(cache_manager)
+        weekly = aggregator.attach_company_info(
+            aggregator.aggregate_daily_quotes(trading_days, prev), index_company_info(listed_info)
+        )
+        sectors = aggregator.aggregate_sector_performance(weekly)
+
+        assert set(weekly["CompanyName"]) == {"極洋", "トヨタ自動車"}
+        assert list(sectors["Sector33CodeName"]) == ["水産・農林業", "輸送用機器"]
+
+
+class TestAggregateSorted:
+    """Test cases for the presorted group reduction."""
+
+    def test_matches_pandas_groupby(self):
+        """Test reductions match groupby.agg, including missing values."""
+        df = pd.DataFrame(
+            {
+                "Code": pd.Categorical(["A", "A", "A", "B", "B", "C"]),
+                "Day": [1, 2, 3, 1, 2, 1],
+                "Open": [float("nan"), 2.0, 3.0, 5.0, float("nan"), float("nan")],
+                "High": [1.0, float("nan"), 4.0, 6.0, 7.0, float("nan")],
+                "Volume": [10, 20, 30, 40, 50, 60],
+                "Name": [None, "a2", None, "b1", "b2", None],
+            }
+        )
+        spec = {
+            "First": ("Open", "first"),
+            "Last": ("Open", "last"),
+            "Max": ("High", "max"),
+            "Min": ("High", "min"),
+            "Sum": ("Volume", "sum"),
+            "Days": ("Day", "nunique"),
+            "LastName": ("Name", "last"),
+        }
+
+        result = _aggregate_sorted(df, "Code", spec)
+        expected = df.groupby("Code", observed=True).agg(**spec).reset_index()
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)